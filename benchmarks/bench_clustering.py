@@ -0,0 +1,50 @@
+"""Measure how the fit time of MiniBatchKMeans grows with the size of the library, along with the time to assign
+every track to a cluster and the memory allocated while fitting.
+
+Usage:
+    python -m benchmarks.bench_clustering [library_size ...]
+"""
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from track_analyzer.clustering import MiniBatchKMeans
+from track_analyzer.spotify_audio_features import AUDIO_FEATURES_FIELDS
+
+N_CLUSTERS = 16
+
+
+def _library(size: int, random: np.random.Generator) -> np.ndarray:
+    """Build the normalized audio features of a synthetic library: tracks grouped around N_CLUSTERS moods
+    """
+    moods = random.random((N_CLUSTERS, len(AUDIO_FEATURES_FIELDS)))
+    vectors = moods[random.integers(0, N_CLUSTERS, size)] + random.normal(0, 0.05, (size, len(AUDIO_FEATURES_FIELDS)))
+    return np.clip(vectors, 0, 1).astype(np.float32)
+
+
+def main(*library_sizes: int) -> None:
+    random = np.random.default_rng(0)
+    for size in library_sizes or (10_000, 100_000, 1_000_000, 5_000_000):
+        vectors = _library(size, random)
+        kmeans = MiniBatchKMeans(N_CLUSTERS, seed=0)
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        kmeans.fit(vectors)
+        fit_time = time.perf_counter() - start
+        _, fit_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        kmeans.predict(vectors)
+        predict_time = time.perf_counter() - start
+
+        sample = vectors[:100_000]
+        print(f"{size:>9} tracks: fit {fit_time:.3f} s (peak {fit_peak / 1024 / 1024:.1f} MiB), "
+              f"predict {predict_time:.3f} s, inertia per track {kmeans.inertia(sample) / len(sample):.4f}")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,81 @@
+"""Measure the time to extract pages of tracks and audio features from the responses of the Spotify API, track by track
+through the model constructors against the trusted batch extraction, which validates every page by columns, and the
+lazy extraction, which only builds the albums and artists that are accessed.
+
+Usage:
+    python -m benchmarks.bench_extraction [number_of_pages] [page_size]
+"""
+import random
+import sys
+import time
+
+from track_analyzer.client import (_extract_tracks_batch_from_response,
+                                   _extract_track_info_from_response,
+                                   _extract_audio_features_batch_from_response)
+
+
+def _track_info(i: int) -> dict:
+    """Build the i-th track object as returned by the Spotify API
+    """
+    return {
+        "album": {"id": f"album{i // 10:018d}", "name": f"Album {i // 10}", "type": "album",
+                  "release_date": "2006-01-01", "release_date_precision": "day", "total_tracks": 10},
+        "artists": [{"id": f"artist{i // 50:017d}", "name": f"Artist {i // 50}", "type": "artist"},
+                    {"id": f"featured{i:015d}", "name": f"Featured {i}", "type": "artist"}],
+        "duration_ms": 180_000 + i % 60_000, "explicit": bool(i % 2), "id": f"track{i:018d}", "name": f"Track {i}",
+        "popularity": i % 101, "type": "track"
+    }
+
+
+def _audio_features_info(i: int) -> dict:
+    """Build the audio features of the i-th track as returned by the Spotify API
+    """
+    return {"id": f"track{i:018d}", "acousticness": random.random(), "danceability": random.random(),
+            "energy": random.random(), "instrumentalness": random.random(), "liveness": random.random(),
+            "loudness": -random.random() * 60, "mode": i % 2, "speechiness": random.random(),
+            "tempo": random.uniform(60, 200), "valence": random.random()}
+
+
+def _measure(name: str, extract, pages: list, number_of_items: int) -> float:
+    """Extract every page and print the items extracted per second
+    """
+    start = time.perf_counter()
+    for page in pages:
+        extract(page)
+    elapsed = time.perf_counter() - start
+
+    print(f"{name:>32}: {number_of_items / elapsed:>11,.0f} items/s, {elapsed / len(pages) * 1e6:>7.0f} µs per page")
+    return elapsed
+
+
+def main(number_of_pages: int = 2_000, page_size: int = 50) -> None:
+    number_of_items = number_of_pages * page_size
+    track_pages = [[_track_info(page * page_size + i) for i in range(page_size)] for page in range(number_of_pages)]
+    per_track = _measure("tracks, per track", lambda page: [_extract_track_info_from_response(track_info)
+                                                            for track_info in page], track_pages, number_of_items)
+    trusted = _measure("tracks, trusted batch", lambda page: _extract_tracks_batch_from_response(page, trusted=True),
+                       track_pages, number_of_items)
+    print(f"{'speedup':>32}: {per_track / trusted:.2f}x")
+    lazy = _measure("tracks, lazy (name and ID only)",
+                    lambda page: [(track.name, track.track_id)
+                                  for track in _extract_tracks_batch_from_response(page, trusted=True, lazy=True)],
+                    track_pages, number_of_items)
+    print(f"{'speedup':>32}: {per_track / lazy:.2f}x")
+
+    audio_features_pages = []
+    for page in range(number_of_pages):
+        track_ids = [f"track{page * page_size + i:018d}" for i in range(page_size)]
+        audio_features_pages.append((track_ids, {"audio_features": [_audio_features_info(page * page_size + i)
+                                                                    for i in range(page_size)]}))
+
+    per_track = _measure("audio features, per track",
+                         lambda page: _extract_audio_features_batch_from_response(*page), audio_features_pages,
+                         number_of_items)
+    trusted = _measure("audio features, trusted batch",
+                       lambda page: _extract_audio_features_batch_from_response(*page, trusted=True),
+                       audio_features_pages, number_of_items)
+    print(f"{'speedup':>32}: {per_track / trusted:.2f}x")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,37 @@
+"""Measure the records per second written and read as JSON lines, with the standard json module and with orjson.
+
+Usage:
+    python -m benchmarks.bench_jsonl [number_of_tracks]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.fixtures import enriched_track
+from track_analyzer.jsonl import JSON_BACKENDS, read_jsonl, write_jsonl, orjson
+
+
+def main(number_of_tracks: int = 100_000) -> None:
+    tracks = [enriched_track(i) for i in range(number_of_tracks)]
+    backends = [backend for backend in JSON_BACKENDS if backend != "orjson" or orjson is not None]
+
+    with tempfile.TemporaryDirectory() as directory:
+        for backend in backends:
+            path = os.path.join(directory, f"{backend}.jsonl")
+
+            start = time.perf_counter()
+            write_jsonl(path, tracks, backend=backend)
+            write_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            read = sum(1 for _ in read_jsonl(path, backend=backend))
+            read_time = time.perf_counter() - start
+
+            print(f"{backend:>6}: write {number_of_tracks / write_time:>9,.0f} records/s, "
+                  f"read {read / read_time:>9,.0f} records/s, {os.path.getsize(path) / number_of_tracks:.0f} bytes "
+                  f"per record")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,28 @@
+"""Measure the memory held by fully enriched SpotifyTrack instances: a track with its album, two artists and its audio
+features, every one of them with its own strings as they are when parsed from the Spotify API responses.
+
+Usage:
+    python -m benchmarks.bench_memory [number_of_tracks]
+"""
+import sys
+import tracemalloc
+
+from benchmarks.fixtures import enriched_track
+
+
+def main(number_of_tracks: int = 100_000) -> None:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    tracks = [enriched_track(i) for i in range(number_of_tracks)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total = after - before
+    print(f"{len(tracks)} fully enriched tracks: {total / 1024 / 1024:.1f} MiB, "
+          f"{total / number_of_tracks:.0f} bytes per track")
+    for instance in (tracks[0], tracks[0].album, tracks[0].artists[0], tracks[0].audio_features):
+        print(f"{type(instance).__name__:>20}: {sys.getsizeof(instance)} bytes per instance (without its values)")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,47 @@
+"""Compare the per-request latency of a new connection per request against the pooled SpotifySession.
+
+Usage:
+    python -m benchmarks.bench_session [number_of_requests]
+"""
+import statistics
+import sys
+import time
+
+import requests
+
+from benchmarks.fake_spotify import FakeSpotifyServer
+from track_analyzer.session import SpotifySession
+
+
+def _measure(send, url: str, number_of_requests: int) -> list[float]:
+    """Send number_of_requests requests and return the latency of each one in milliseconds
+    """
+    latencies = []
+    for _ in range(number_of_requests):
+        start = time.perf_counter()
+        send(url).raise_for_status()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    return latencies
+
+
+def main(number_of_requests: int = 2000) -> None:
+    with FakeSpotifyServer() as server:
+        url = f"{server.url}/v1/search"
+        unpooled = _measure(requests.get, url, number_of_requests)
+
+        spotify_session = SpotifySession()
+        spotify_session.warm_up([url])
+        pooled = _measure(spotify_session.get, url, number_of_requests)
+        spotify_session.close()
+
+    print(f"{number_of_requests} requests against {url}")
+    for name, latencies in (("new connection", unpooled), ("pooled session", pooled)):
+        print(f"{name:>15}: mean {statistics.mean(latencies):.3f} ms, "
+              f"p50 {statistics.median(latencies):.3f} ms, "
+              f"p99 {statistics.quantiles(latencies, n=100)[98]:.3f} ms")
+    print(f"{'speedup':>15}: {statistics.mean(unpooled) / statistics.mean(pooled):.2f}x")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,60 @@
+"""Compare the exact and the approximate (partitioned) similarity queries of the SimilarityIndex at several library
+sizes, reporting the time to build the index, the latency of single and batched queries and the recall of the
+approximate queries.
+
+Usage:
+    python -m benchmarks.bench_similarity [library_size ...]
+"""
+import sys
+import time
+
+import numpy as np
+
+from track_analyzer.similarity_index import SimilarityIndex
+from track_analyzer.spotify_audio_features import AUDIO_FEATURES_FIELDS
+
+NUMBER_OF_QUERIES = 200
+K = 10
+
+
+def _library(size: int, random: np.random.Generator) -> np.ndarray:
+    """Build the normalized audio features of a synthetic library: tracks grouped around 50 styles
+    """
+    styles = random.random((50, len(AUDIO_FEATURES_FIELDS)))
+    vectors = styles[random.integers(0, len(styles), size)] + random.normal(0, 0.08, (size, len(AUDIO_FEATURES_FIELDS)))
+    return np.clip(vectors, 0, 1).astype(np.float32)
+
+
+def _timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main(*library_sizes: int) -> None:
+    random = np.random.default_rng(0)
+    for size in library_sizes or (10_000, 100_000, 1_000_000):
+        vectors = _library(size, random)
+        queries = vectors[random.choice(size, NUMBER_OF_QUERIES, replace=False)] + 0.01
+        index = SimilarityIndex(n_partitions=int(np.sqrt(size)), seed=0)
+
+        _, add_time = _timed(lambda: index.add([f"track{i}" for i in range(size)], vectors))
+        _, train_time = _timed(index.train)
+        _, exact_single = _timed(lambda: [index.query(query, K, exact=True) for query in queries])
+        exact, exact_batch = _timed(lambda: index.query_batch(queries, K, exact=True))
+        _, approximate_single = _timed(lambda: [index.query(query, K) for query in queries])
+        approximate, approximate_batch = _timed(lambda: index.query_batch(queries, K))
+
+        recall = np.mean([len({track.track_id for track in exact_tracks} & {track.track_id for track in tracks}) / K
+                          for exact_tracks, tracks in zip(exact, approximate)])
+
+        print(f"{size} tracks: add {add_time:.2f} s, train {index.n_partitions} partitions {train_time:.2f} s")
+        for name, single, batch in (("exact", exact_single, exact_batch),
+                                    ("partitioned", approximate_single, approximate_batch)):
+            print(f"{name:>15}: {single / NUMBER_OF_QUERIES * 1000:.3f} ms per query, "
+                  f"{batch / NUMBER_OF_QUERIES * 1000:.3f} ms per query in a batch of {NUMBER_OF_QUERIES}")
+        print(f"{'recall@' + str(K):>15}: {recall:.3f}")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
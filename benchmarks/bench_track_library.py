@@ -0,0 +1,54 @@
+"""Measure how fast a TrackLibrary is written and opened, along with the latency of looking up and materializing
+tracks by ID and of a vectorized aggregate over the memory-mapped columns.
+
+Usage:
+    python -m benchmarks.bench_track_library [number_of_tracks]
+"""
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.fixtures import enriched_track
+from track_analyzer.track_library import TrackLibrary
+
+NUMBER_OF_LOOKUPS = 10_000
+
+
+def main(number_of_tracks: int = 1_000_000) -> None:
+    tracks = [enriched_track(i) for i in range(number_of_tracks)]
+    track_ids = [track.track_id for track in random.sample(tracks, min(NUMBER_OF_LOOKUPS, number_of_tracks))]
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        TrackLibrary.write(directory, tracks)
+        write_time = time.perf_counter() - start
+        del tracks
+
+        start = time.perf_counter()
+        library = TrackLibrary(directory)
+        open_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        rows = [library.row(track_id) for track_id in track_ids]
+        lookup_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for row in rows:
+            library.track(row)
+        materialize_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        mean_energy = float(np.nanmean(library.audio_features["energy"]))
+        aggregate_time = time.perf_counter() - start
+
+    print(f"{number_of_tracks} tracks: write {write_time:.2f} s, open {open_time * 1000:.2f} ms")
+    print(f"{'lookup by ID':>20}: {lookup_time / len(track_ids) * 1e6:.1f} us per track")
+    print(f"{'materialize':>20}: {materialize_time / len(track_ids) * 1e6:.1f} us per track")
+    print(f"{'mean energy':>20}: {aggregate_time * 1000:.2f} ms ({mean_energy:.3f})")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
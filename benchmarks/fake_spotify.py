@@ -0,0 +1,66 @@
+"""A minimal local stand-in for the Spotify API used by the benchmarks.
+
+It speaks HTTP/1.1 so connections can be kept alive, and answers every GET with a small JSON payload and every POST
+with an access token.
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeSpotifyHandler(BaseHTTPRequestHandler):
+    """Answers requests with canned JSON payloads
+    """
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, so avoid delayed ACK stalls on kept-alive connections
+    disable_nagle_algorithm = True
+
+    def _send_json(self, payload: dict) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        self._send_json({"tracks": {"items": [], "limit": 1, "offset": 0, "next": None, "total": 0}})
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._send_json({"access_token": "fake_access_token", "expires_in": 3600})
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeSpotifyServer:
+    """Runs a FakeSpotifyHandler server in a background thread
+
+    Usage:
+        with FakeSpotifyServer() as server:
+            requests.get(server.url)
+    """
+
+    def __init__(self, handler=FakeSpotifyHandler):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,29 @@
+"""Synthetic tracks shared by the offline benchmarks.
+"""
+import random
+
+from track_analyzer.spotify_album import SpotifyAlbum, SpotifyAlbumReleaseDate
+from track_analyzer.spotify_artist import SpotifyArtist
+from track_analyzer.spotify_audio_features import SpotifyAudioFeatures
+from track_analyzer.spotify_track import SpotifyTrack
+
+
+def enriched_track(i: int) -> SpotifyTrack:
+    """Build the i-th fully enriched track: a track with its album, two artists and random audio features
+
+    Args:
+        i (int): the index of the track, used to make its names and IDs unique
+
+    Returns: the SpotifyTrack
+    """
+    album = SpotifyAlbum(f"Album {i}", f"album{i:018d}", album_type="album", total_tracks=12,
+                         release_date=SpotifyAlbumReleaseDate(f"2006-01-{i % 28 + 1:02d}", "day"))
+    artists = [SpotifyArtist(f"Artist {i}", f"artist{i:017d}"), SpotifyArtist(f"Featured {i}", f"featured{i:015d}")]
+    audio_features = SpotifyAudioFeatures(acousticness=random.random(), danceability=random.random(),
+                                          energy=random.random(), instrumentalness=random.random(),
+                                          liveness=random.random(), loudness=-random.random() * 60,
+                                          mode=i % 2, speechiness=random.random(), tempo=random.uniform(60, 200),
+                                          valence=random.random())
+
+    return SpotifyTrack(f"Track {i}", f"track{i:018d}", popularity=i % 101, duration=180_000 + i % 60_000,
+                        explicit=bool(i % 2), album=album, artists=artists, audio_features=audio_features)
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from faker import Faker
 
 faker = Faker()
@@ -123,39 +125,7 @@ def mocked_search_track_response(no_match: bool = False) -> dict:
         "tracks": {
             "href": "https://api.spotify.com/v1",
             "items": [
-                {
-                    "album": {
-                        "album_type": faker.random_element(elements=('single', 'album', 'compilation')),
-                        "id": faker.pystr(min_chars=10, max_chars=10, prefix='1', suffix='9'),
-                        "is_playable": faker.boolean(),
-                        "name": faker.text(max_nb_chars=20),
-                        "release_date": faker.date(),
-                        "release_date_precision": "day",
-                        "total_tracks": 1,
-                        "type": "album",
-                        "uri": "spotify:album" + faker.pystr(min_chars=10, max_chars=10, prefix='1', suffix='9')
-                    },
-                    "artists": [
-                        {
-                            "id": faker.pystr(min_chars=10, max_chars=10, prefix='1', suffix='9'),
-                            "name": faker.name(),
-                            "type": "artist",
-                            "uri": "spotify:artist:" + faker.pystr(min_chars=10, max_chars=10, prefix='1', suffix='9')
-                        }
-                    ],
-                    "disc_number": 1,
-                    "duration_ms": faker.random_int(min=60000, max=300000),
-                    "explicit": faker.boolean(),
-                    "id": faker.pystr(min_chars=10, max_chars=10, prefix='1', suffix='9'),
-                    "is_local": faker.boolean(),
-                    "is_playable": faker.boolean(),
-                    "name": faker.text(max_nb_chars=20),
-                    "popularity": faker.random_int(min=0, max=100),
-                    "preview_url": "https://api.spotify.com/v1",
-                    "track_number": 1,
-                    "type": "track",
-                    "uri": "spotify:track:" + faker.pystr(min_chars=10, max_chars=10, prefix='1', suffix='9')
-                }
+                mocked_track_response()
             ],
             "limit": 1,
             "next": "https://api.spotify.com/v1",
@@ -164,3 +134,70 @@ def mocked_search_track_response(no_match: bool = False) -> dict:
             "total": 1
         }
     }
+
+
+def mocked_track_response(track_id: Optional[str] = None) -> dict:
+    """Mock a track object as returned by the Spotify API, see mocked_search_track_response
+
+    Args:
+        track_id (Optional[str]): the Spotify ID of the track, if not provided a random one is used
+
+    Returns: a dict containing the mocked track
+    """
+    return {
+        "album": {
+            "album_type": faker.random_element(elements=('single', 'album', 'compilation')),
+            "id": faker.pystr(min_chars=10, max_chars=10, prefix='1', suffix='9'),
+            "is_playable": faker.boolean(),
+            "name": faker.text(max_nb_chars=20),
+            "release_date": faker.date(),
+            "release_date_precision": "day",
+            "total_tracks": 1,
+            "type": "album",
+            "uri": "spotify:album" + faker.pystr(min_chars=10, max_chars=10, prefix='1', suffix='9')
+        },
+        "artists": [
+            {
+                "id": faker.pystr(min_chars=10, max_chars=10, prefix='1', suffix='9'),
+                "name": faker.name(),
+                "type": "artist",
+                "uri": "spotify:artist:" + faker.pystr(min_chars=10, max_chars=10, prefix='1', suffix='9')
+            }
+        ],
+        "disc_number": 1,
+        "duration_ms": faker.random_int(min=60000, max=300000),
+        "explicit": faker.boolean(),
+        "id": track_id or faker.pystr(min_chars=10, max_chars=10, prefix='1', suffix='9'),
+        "is_local": faker.boolean(),
+        "is_playable": faker.boolean(),
+        "name": faker.text(max_nb_chars=20),
+        "popularity": faker.random_int(min=0, max=100),
+        "preview_url": "https://api.spotify.com/v1",
+        "track_number": 1,
+        "type": "track",
+        "uri": "spotify:track:" + faker.pystr(min_chars=10, max_chars=10, prefix='1', suffix='9')
+    }
+
+
+def mocked_audio_features_response(track_id: str) -> dict:
+    """Mock the audio features of a track as returned by the Spotify API
+
+    Args:
+        track_id (str): the Spotify ID of the track
+
+    Returns: a dict containing the mocked audio features
+    """
+    return {
+        "id": track_id,
+        "acousticness": faker.pyfloat(min_value=0, max_value=1),
+        "danceability": faker.pyfloat(min_value=0, max_value=1),
+        "energy": faker.pyfloat(min_value=0, max_value=1),
+        "instrumentalness": faker.pyfloat(min_value=0, max_value=1),
+        "liveness": faker.pyfloat(min_value=0, max_value=1),
+        "loudness": faker.pyfloat(min_value=-60, max_value=0),
+        "mode": faker.random_element(elements=(0, 1)),
+        "speechiness": faker.pyfloat(min_value=0, max_value=1),
+        "tempo": faker.pyfloat(min_value=50, max_value=200),
+        "valence": faker.pyfloat(min_value=0, max_value=1),
+        "type": "audio_features"
+    }
@@ -0,0 +1,131 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase, main
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from track_analyzer.async_client import AsyncSpotifyClient
+from track_analyzer.exceptions import SpotifyAuthenticationError
+from track_analyzer.spotify_audio_features import SpotifyAudioFeatures
+from track_analyzer.spotify_track import SpotifyTrack
+
+from tests.misc.utils import mocked_search_track_response, mocked_audio_features_response
+
+
+class FakeSpotifyAPI:
+    """A local stand-in for the Spotify API that keeps track of the requests it receives
+    """
+
+    def __init__(self, token_status: int = 200):
+        self.token_status = token_status
+        self.token_requests = 0
+        self.api_requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        self.app = web.Application()
+        self.app.router.add_post("/api/token", self.token)
+        self.app.router.add_get("/v1/search", self.search)
+        self.app.router.add_get("/v1/audio-features", self.several_audio_features)
+        self.app.router.add_get("/v1/audio-features/{track_id}", self.audio_features)
+
+    async def _track_request(self):
+        self.api_requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+
+    async def token(self, request):
+        self.token_requests += 1
+        await asyncio.sleep(0.01)
+        return web.json_response({"access_token": "fake_access_token", "expires_in": 3600}, status=self.token_status)
+
+    async def search(self, request):
+        await self._track_request()
+        if request.query["q"] == "missing":
+            return web.json_response(mocked_search_track_response(no_match=True))
+        return web.json_response(mocked_search_track_response())
+
+    async def audio_features(self, request):
+        await self._track_request()
+        return web.json_response(mocked_audio_features_response(request.match_info["track_id"]))
+
+    async def several_audio_features(self, request):
+        await self._track_request()
+        return web.json_response({"audio_features": [mocked_audio_features_response(track_id)
+                                                     for track_id in request.query["ids"].split(",")]})
+
+
+class TestAsyncSpotifyClient(IsolatedAsyncioTestCase):
+    """This class contains a collection of test cases related to the AsyncSpotifyClient, which run against a local
+    fake Spotify API
+    """
+
+    async def asyncSetUp(self):
+        """The test case runs the event loop in debug mode, which is too slow for thousands of concurrent requests
+        """
+        asyncio.get_running_loop().set_debug(False)
+
+    async def _start_client(self, max_concurrency: int = 50, token_status: int = 200) -> AsyncSpotifyClient:
+        """Start the fake Spotify API and create a client that points to it
+        """
+        self.fake_api = FakeSpotifyAPI(token_status)
+        self.server = TestServer(self.fake_api.app)
+        await self.server.start_server()
+        self.addAsyncCleanup(self.server.close)
+
+        spotify_client = AsyncSpotifyClient('my_client_id', 'my_client_secret', max_concurrency=max_concurrency)
+        spotify_client.base_url = str(self.server.make_url("/v1"))
+        spotify_client._auth._auth_url = str(self.server.make_url("/api/token"))
+        self.addAsyncCleanup(spotify_client.close)
+
+        return spotify_client
+
+    async def test_search_track(self):
+        """Test the search track coroutine returns the same model classes as the sync client
+        """
+        spotify_client = await self._start_client()
+
+        spotify_track = await spotify_client.search_track('search for a track')
+        self.assertIsInstance(spotify_track, SpotifyTrack)
+        self.assertIsInstance(spotify_track.audio_features, SpotifyAudioFeatures)
+
+        with self.assertLogs():
+            self.assertIsNone(await spotify_client.search_track('missing'))
+
+    async def test_concurrent_searches(self):
+        """Test thousands of concurrent searches share a single token request and never exceed max_concurrency
+        requests in flight
+        """
+        spotify_client = await self._start_client(max_concurrency=50)
+
+        spotify_tracks = await asyncio.gather(*(spotify_client.search_track(f"track {i}", include_audio_features=False)
+                                                for i in range(2000)))
+
+        self.assertEqual(len(spotify_tracks), 2000)
+        self.assertTrue(all(isinstance(spotify_track, SpotifyTrack) for spotify_track in spotify_tracks))
+        self.assertEqual(self.fake_api.api_requests, 2000)
+        self.assertEqual(self.fake_api.token_requests, 1)
+        self.assertLessEqual(self.fake_api.max_in_flight, 50)
+
+    async def test_get_audio_features_batch(self):
+        """Test the audio features are fetched in batches
+        """
+        spotify_client = await self._start_client()
+
+        audio_features = await spotify_client.get_audio_features_batch([f"track{i}" for i in range(250)])
+        self.assertEqual(len(audio_features), 250)
+        self.assertEqual(self.fake_api.api_requests, 3)
+
+    async def test_authentication_error(self):
+        """Test a SpotifyAuthenticationError is raised if the access token can't be generated
+        """
+        spotify_client = await self._start_client(token_status=400)
+
+        with self.assertRaises(SpotifyAuthenticationError), self.assertLogs():
+            await spotify_client.search_track('search for a track')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+import math
+from unittest import TestCase, main
+
+import numpy as np
+
+from track_analyzer.audio_features_frame import AudioFeaturesFrame
+from track_analyzer.spotify_audio_features import SpotifyAudioFeatures, AUDIO_FEATURES_FIELDS
+from track_analyzer.spotify_track import SpotifyTrack
+
+
+class TestAudioFeaturesFrame(TestCase):
+    """This class contains a collection of different test cases related to the AudioFeaturesFrame class
+    """
+
+    def setUp(self):
+        """Setup common values: three tracks with audio features and one without them
+        """
+        self.tracks = [
+            SpotifyTrack("Calm", "calm", audio_features=SpotifyAudioFeatures(energy=0.2, danceability=0.1, tempo=80.0,
+                                                                            mode=0)),
+            SpotifyTrack("Groovy", "groovy", audio_features=SpotifyAudioFeatures(energy=0.6, danceability=0.5,
+                                                                                tempo=120.0, mode=1)),
+            SpotifyTrack("Loud", "loud", audio_features=SpotifyAudioFeatures(energy=1.0, danceability=0.9,
+                                                                            tempo=160.0, mode=1)),
+            SpotifyTrack("Unknown", "unknown"),
+        ]
+        self.frame = AudioFeaturesFrame.from_tracks(self.tracks)
+
+    def test_from_tracks(self):
+        """Test every audio feature becomes a column and the missing audio features are NaN
+        """
+        self.assertEqual(len(self.frame), 4)
+        self.assertEqual(self.frame.fields, list(AUDIO_FEATURES_FIELDS))
+        np.testing.assert_array_equal(self.frame["energy"][:3], [0.2, 0.6, 1.0])
+        self.assertTrue(math.isnan(self.frame["energy"][3]))
+        np.testing.assert_array_equal(self.frame.missing(), [False, False, False, True])
+
+        self.assertIn("groovy", self.frame)
+        self.assertEqual(self.frame.row("groovy")["tempo"], 120.0)
+        self.assertRaises(KeyError, self.frame.row, "not_in_the_frame")
+
+    def test_from_audio_features(self):
+        """Test a frame built from a mapping of audio features matches the frame built from the tracks
+        """
+        frame = AudioFeaturesFrame.from_audio_features({track.track_id: track.audio_features
+                                                        for track in self.tracks})
+        np.testing.assert_array_equal(frame.to_matrix(), self.frame.to_matrix())
+        self.assertEqual(len(AudioFeaturesFrame.from_audio_features({})), 0)
+
+    def test_describe(self):
+        """Test the summary statistics ignore the missing audio features
+        """
+        summary = self.frame.describe()
+
+        self.assertEqual(summary["tempo"].count, 3)
+        self.assertAlmostEqual(summary["tempo"].mean, 120.0)
+        self.assertAlmostEqual(summary["tempo"].median, 120.0)
+        self.assertAlmostEqual(summary["tempo"].min, 80.0)
+        self.assertAlmostEqual(summary["tempo"].max, 160.0)
+        self.assertAlmostEqual(summary["energy"].std, np.std([0.2, 0.6, 1.0]))
+
+        empty_summary = AudioFeaturesFrame.from_tracks([SpotifyTrack("Unknown", "unknown")]).describe()
+        self.assertEqual(empty_summary["tempo"].count, 0)
+        self.assertTrue(math.isnan(empty_summary["tempo"].mean))
+
+    def test_corr(self):
+        """Test the correlation only uses the tracks with every audio feature
+        """
+        correlation = self.frame.corr(["energy", "danceability", "tempo"])
+
+        self.assertEqual(correlation.shape, (3, 3))
+        np.testing.assert_allclose(correlation, np.ones((3, 3)))
+
+    def test_normalize(self):
+        """Test the audio features are rescaled with both methods and the missing values are kept
+        """
+        minmax = self.frame.normalize(fields=["tempo"])
+        np.testing.assert_allclose(minmax["tempo"][:3], [0.0, 0.5, 1.0])
+        self.assertTrue(math.isnan(minmax["tempo"][3]))
+        # The rest of the audio features are not rescaled
+        np.testing.assert_array_equal(minmax["energy"], self.frame["energy"])
+
+        zscore = self.frame.normalize("zscore")
+        self.assertAlmostEqual(float(np.nanmean(zscore["tempo"])), 0.0)
+        self.assertAlmostEqual(float(np.nanstd(zscore["tempo"])), 1.0)
+        # A constant audio feature is rescaled to 0
+        np.testing.assert_array_equal(zscore["liveness"][:3], [0.0, 0.0, 0.0])
+
+        self.assertRaises(ValueError, self.frame.normalize, "unknown")
+
+    def test_filter(self):
+        """Test the tracks are selected with a mask and the tracks without the audio feature are left out
+        """
+        energetic = self.frame.filter(self.frame["energy"] > 0.5)
+
+        self.assertEqual(list(energetic.track_ids), ["groovy", "loud"])
+        self.assertEqual(energetic.row("loud")["danceability"], 0.9)
+        self.assertEqual(list(self.frame.dropna().track_ids), ["calm", "groovy", "loud"])
+        self.assertRaises(ValueError, self.frame.filter, [True])
+
+
+if __name__ == '__main__':
+    main()
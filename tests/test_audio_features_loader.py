@@ -0,0 +1,113 @@
+import threading
+from unittest import TestCase, main, mock
+
+import requests
+
+from track_analyzer.audio_features_loader import AudioFeaturesLoader, AudioFeaturesLoaderStats
+from track_analyzer.client import SpotifyClient
+
+from tests.misc.utils import mocked_search_track_response, mocked_audio_features_response
+
+
+class TestAudioFeaturesLoader(TestCase):
+    """This class contains a collection of different test cases related to the micro-batching of audio features
+    """
+
+    def test_loads_within_the_window_are_batched(self):
+        """Make sure the track IDs requested within the batch window are fetched with a single call
+        """
+        batches = []
+
+        def batch_fn(track_ids):
+            batches.append(track_ids)
+            return {track_id: f"features_{track_id}" for track_id in track_ids}
+
+        loader = AudioFeaturesLoader(batch_fn, batch_window=0.05)
+        futures = [loader.load(track_id) for track_id in ('a', 'b', 'a', 'c')]
+
+        self.assertEqual([future.result(timeout=1) for future in futures],
+                         ['features_a', 'features_b', 'features_a', 'features_c'])
+        self.assertEqual(batches, [['a', 'b', 'c']])
+        self.assertEqual(loader.stats, AudioFeaturesLoaderStats(loads=4, batches=1))
+
+    def test_full_batch_is_sent_right_away(self):
+        """Make sure a batch is sent as soon as it reaches the maximum batch size, without waiting for the window
+        """
+        batches = []
+
+        def batch_fn(track_ids):
+            batches.append(track_ids)
+            return {}
+
+        loader = AudioFeaturesLoader(batch_fn, max_batch_size=2, batch_window=60)
+        first, second = loader.load('a'), loader.load('b')
+
+        self.assertTrue(first.done() and second.done())
+        self.assertIsNone(first.result())
+        self.assertEqual(batches, [['a', 'b']])
+
+    def test_errors_are_shared(self):
+        """Make sure the exception raised by the batch function is raised to every caller of the batch
+        """
+        def batch_fn(track_ids):
+            raise ValueError("failed")
+
+        loader = AudioFeaturesLoader(batch_fn, batch_window=0.01)
+        futures = [loader.load('a'), loader.load('b')]
+        for future in futures:
+            self.assertRaises(ValueError, future.result, 1)
+
+    def test_invalid_max_batch_size(self):
+        """Make sure a ValueError is raised if the maximum batch size is not valid
+        """
+        self.assertRaises(ValueError, AudioFeaturesLoader, lambda track_ids: {}, max_batch_size=0)
+
+    @mock.patch('track_analyzer.auth.SpotifyAuth.access_token', return_value='my_access_token')
+    @mock.patch('track_analyzer.session.requests.Session.get')
+    def test_client_batches_concurrent_searches(self, mock_requests_get, mock_access_token):
+        """Make sure the audio features of concurrent searches are fetched with a single batched request
+        """
+        search_results = iter(range(10))
+        lock = threading.Lock()
+
+        def response(url, params=None, **kwargs):
+            mocked_response = mock.MagicMock()
+            mocked_response.status_code = requests.codes.ok
+            if url.endswith('/search'):
+                with lock:
+                    search_result = mocked_search_track_response()
+                    search_result['tracks']['items'][0]['id'] = f"track_{next(search_results)}"
+                mocked_response.json.return_value = search_result
+            else:
+                mocked_response.json.return_value = {
+                    "audio_features": [mocked_audio_features_response(track_id)
+                                       for track_id in params['ids'].split(',')]}
+            return mocked_response
+
+        mock_requests_get.side_effect = response
+        spotify_client = SpotifyClient('my_client_id', 'my_client_secret', audio_features_batch_window=0.2)
+        barrier = threading.Barrier(10)
+        tracks = []
+
+        def search(query):
+            barrier.wait()
+            tracks.append(spotify_client.search_track(query))
+
+        threads = [threading.Thread(target=search, args=(f'popular track {i}',)) for i in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(tracks), 10)
+        self.assertEqual(len({track.track_id for track in tracks}), 10)
+        self.assertTrue(all(track.audio_features is not None for track in tracks))
+        audio_features_calls = [call for call in mock_requests_get.call_args_list
+                                if call.args[0].endswith('/audio-features')]
+        self.assertEqual(len(audio_features_calls), 1)
+        self.assertEqual(spotify_client.audio_features_loader_stats, AudioFeaturesLoaderStats(loads=10, batches=1))
+        self.assertIsNone(SpotifyClient('my_client_id', 'my_client_secret').audio_features_loader_stats)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+import os
+import tempfile
+import threading
+from unittest import TestCase, main, mock
+from unittest.mock import MagicMock
+
+import requests
+
+from track_analyzer.audio_features_store import SQLiteAudioFeaturesStore
+from track_analyzer.client import SpotifyClient
+from track_analyzer.spotify_audio_features import SpotifyAudioFeatures, AUDIO_FEATURES_FIELDS
+from track_analyzer.spotify_track import SpotifyTrack
+
+from tests.misc.utils import mocked_audio_features_response
+
+
+def mocked_response(url, params=None, **kwargs) -> MagicMock:
+    """Mock the responses of the single and several audio features endpoints
+    """
+    response = MagicMock()
+    response.status_code = requests.codes.ok
+    if params:
+        response.json.return_value = {
+            "audio_features": [mocked_audio_features_response(track_id) for track_id in params["ids"].split(",")]
+        }
+    else:
+        response.json.return_value = mocked_audio_features_response(url.rsplit("/", 1)[-1])
+    return response
+
+
+class TestSQLiteAudioFeaturesStore(TestCase):
+    """This class contains a collection of different test cases related to the SQLite audio features store
+    """
+
+    def setUp(self):
+        """Setup a store in a temporary directory
+        """
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.path = os.path.join(temporary_directory.name, "audio_features.db")
+        self.store = SQLiteAudioFeaturesStore(self.path)
+        self.addCleanup(self.store.close)
+
+    def test_put_and_get_many(self):
+        """Make sure stored audio features are read back with the same values, and unknown tracks are left out
+        """
+        audio_features = {f"track{i}": SpotifyAudioFeatures(acousticness=i / 2000, mode=i % 2, tempo=100 + i)
+                          for i in range(1200)}
+        self.store.put_many(audio_features)
+
+        stored_audio_features = self.store.get_many(list(audio_features) + ["unknown"])
+        self.assertEqual(len(self.store), 1200)
+        self.assertCountEqual(stored_audio_features, audio_features)
+        for track_id, features in audio_features.items():
+            for field in AUDIO_FEATURES_FIELDS:
+                self.assertEqual(getattr(stored_audio_features[track_id], field), getattr(features, field))
+
+    def test_durable_and_wal(self):
+        """Make sure the audio features survive a new store instance and the database uses WAL
+        """
+        self.store.put_many({"track": SpotifyAudioFeatures(energy=0.5)})
+        self.store.close()
+
+        reopened_store = SQLiteAudioFeaturesStore(self.path)
+        self.addCleanup(reopened_store.close)
+        self.assertEqual(reopened_store.get_many(["track"])["track"].energy, 0.5)
+        self.assertEqual(reopened_store._connection.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+
+    def test_concurrent_readers(self):
+        """Make sure several threads can read while another one writes
+        """
+        self.store.put_many({f"track{i}": SpotifyAudioFeatures(valence=0.1) for i in range(100)})
+        errors = []
+
+        def read():
+            try:
+                for _ in range(20):
+                    self.assertEqual(len(self.store.get_many(f"track{i}" for i in range(100))), 100)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=read) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        self.store.put_many({f"new_track{i}": SpotifyAudioFeatures(valence=0.2) for i in range(100)})
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+
+    @mock.patch('track_analyzer.auth.SpotifyAuth.access_token', return_value='my_access_token')
+    @mock.patch('track_analyzer.session.requests.Session.get', side_effect=mocked_response)
+    def test_client_uses_store(self, mock_requests_get, mock_access_token):
+        """Make sure the client only requests the audio features that are not stored, and stores the fetched ones
+        """
+        self.store.put_many({"stored": SpotifyAudioFeatures(energy=0.9)})
+        spotify_client = SpotifyClient('my_client_id', 'my_client_secret', audio_features_store=self.store)
+
+        audio_features = spotify_client.get_audio_features_batch(["stored", "new"])
+        self.assertEqual(list(audio_features), ["stored", "new"])
+        self.assertEqual(mock_requests_get.call_args.kwargs["params"], {"ids": "new"})
+        self.assertEqual(len(self.store), 2)
+
+        # Everything is stored now, so no more requests are made
+        spotify_client.get_audio_features_batch(["stored", "new"])
+        self.assertIsNotNone(spotify_client._get_audio_features(SpotifyTrack("New", "new")))
+        mock_requests_get.assert_called_once()
+
+        spotify_client._get_audio_features(SpotifyTrack("Single", "single"))
+        self.assertEqual(len(self.store), 3)
+
+
+if __name__ == '__main__':
+    main()
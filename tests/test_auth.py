@@ -1,7 +1,9 @@
+import threading
+import time
 from unittest import mock, TestCase, main
 from requests import codes
 
-from track_analyzer.auth import SpotifyAuth
+from track_analyzer.auth import SpotifyAuth, SpotifyAccessToken
 from track_analyzer.exceptions import SpotifyAuthenticationError
 
 
@@ -42,6 +44,23 @@ class TestAuth(TestCase):
             self.assertIn(f"Could not generate access token. Status code: {codes.too_many_requests}",
                           log.output[0])
 
+    def test_token_request_and_store_token(self, mock_requests_post):
+        """Make sure a token requested with another HTTP client can be stored, without SpotifyAuth making a request
+        """
+        auth_url, body = self.spotify_auth.token_request()
+        self.assertEqual(auth_url, 'https://accounts.spotify.com/api/token')
+        self.assertEqual(body["grant_type"], "client_credentials")
+        self.assertIsNone(self.spotify_auth.valid_access_token)
+
+        with self.assertRaises(SpotifyAuthenticationError), self.assertLogs():
+            self.spotify_auth.store_token(codes.bad_request, None)
+
+        self.assertEqual(self.spotify_auth.store_token(codes.ok, {"access_token": "new_token", "expires_in": 3600}),
+                         "new_token")
+        self.assertEqual(self.spotify_auth.valid_access_token, "new_token")
+        self.assertEqual(self.spotify_auth.access_token, "new_token")
+        mock_requests_post.assert_not_called()
+
     def test_access_token_is_generated_when_no_token(self, mock_requests_post):
         """Make sure a new access token is generated if the SpotifyAuth object doesn't already contain one
         """
@@ -58,6 +77,64 @@ class TestAuth(TestCase):
         auth_url = 'https://accounts.spotify.com/api/token'
         mock_requests_post.assert_called_once_with(auth_url, data=body)
 
+    def test_token_timestamp_is_generation_time(self, mock_requests_post):
+        """Make sure the timestamp of a token is the time it was generated, not the time the module was imported
+        """
+        mock_requests_post.return_value.status_code = codes.ok
+        mock_requests_post.return_value.json.return_value = {"access_token": "spotify_access_token", "expires_in": 3600}
+
+        before = time.time()
+        self.spotify_auth._generate_access_token()
+        self.assertGreaterEqual(self.spotify_auth._credentials.timestamp, before)
+        self.assertLessEqual(self.spotify_auth._credentials.timestamp, time.time())
+
+    def test_expired_token_is_regenerated(self, mock_requests_post):
+        """Make sure a new access token is generated once the stored one has expired
+        """
+        mock_requests_post.return_value.status_code = codes.ok
+        mock_requests_post.return_value.json.return_value = {"access_token": "new_access_token", "expires_in": 3600}
+        self.spotify_auth._credentials = SpotifyAccessToken("old_access_token", 3595, time.time() - 3600)
+
+        self.assertEqual(self.spotify_auth.access_token, "new_access_token")
+        mock_requests_post.assert_called_once()
+
+    def test_single_flight_token_generation(self, mock_requests_post):
+        """Make sure only a single token request is made when several threads need a token at the same time
+        """
+        def slow_token_request(*args, **kwargs):
+            time.sleep(0.05)
+            response = mock.MagicMock()
+            response.status_code = codes.ok
+            response.json.return_value = {"access_token": "spotify_access_token", "expires_in": 3600}
+            return response
+
+        mock_requests_post.side_effect = slow_token_request
+        access_tokens = []
+        threads = [threading.Thread(target=lambda: access_tokens.append(self.spotify_auth.access_token))
+                   for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(access_tokens, ["spotify_access_token"] * 10)
+        mock_requests_post.assert_called_once()
+
+    def test_background_refresh(self, mock_requests_post):
+        """Make sure a token that is about to expire keeps being used while a new one is requested in the background
+        """
+        mock_requests_post.return_value.status_code = codes.ok
+        mock_requests_post.return_value.json.return_value = {"access_token": "new_access_token", "expires_in": 3600}
+        spotify_auth = SpotifyAuth('my_client_id', 'my_client_secret', background_refresh=True, refresh_margin=60)
+        # The token expires in 30 seconds, which is within the refresh margin
+        spotify_auth._credentials = SpotifyAccessToken("old_access_token", 3600, time.time() - 3570)
+
+        self.assertEqual(spotify_auth.access_token, "old_access_token")
+        spotify_auth._refresh_thread.join()
+
+        self.assertEqual(spotify_auth.access_token, "new_access_token")
+        mock_requests_post.assert_called_once()
+
 
 if __name__ == '__main__':
     main()
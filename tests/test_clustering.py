@@ -0,0 +1,67 @@
+from unittest import TestCase, main
+
+import numpy as np
+
+from track_analyzer.clustering import MiniBatchKMeans, closest_centroids
+
+
+class TestMiniBatchKMeans(TestCase):
+    """This class contains a collection of different test cases related to the MiniBatchKMeans class
+    """
+
+    def setUp(self):
+        """Setup common values: 3000 vectors around 3 well separated centers
+        """
+        random = np.random.default_rng(0)
+        self.centers = np.array([[0.1, 0.1, 0.1], [0.9, 0.1, 0.5], [0.5, 0.9, 0.9]])
+        self.labels = random.integers(0, 3, 3000)
+        self.vectors = self.centers[self.labels] + random.normal(0, 0.02, (3000, 3))
+
+    def _assert_recovers_centers(self, kmeans: MiniBatchKMeans) -> None:
+        """Check every center is matched by a centroid, whatever the order of the clusters
+        """
+        for center in self.centers:
+            self.assertLess(np.min(np.linalg.norm(kmeans.centroids - center, axis=1)), 0.02)
+
+    def test_fit(self):
+        """Test the clusters are found and every vector is assigned to the cluster of its center
+        """
+        kmeans = MiniBatchKMeans(3, batch_size=256, seed=0).fit(self.vectors)
+        self._assert_recovers_centers(kmeans)
+
+        predicted = kmeans.predict(self.vectors)
+        # The clusters are numbered differently, but the vectors of a center all share the same cluster
+        for label in range(3):
+            self.assertEqual(len(set(predicted[self.labels == label])), 1)
+        self.assertLess(kmeans.inertia(self.vectors) / len(self.vectors), 3 * 0.02 ** 2 * 1.5)
+
+    def test_partial_fit(self):
+        """Test the clusters are found when the vectors arrive in small batches
+        """
+        kmeans = MiniBatchKMeans(3, seed=0)
+        self.assertFalse(kmeans.is_fitted)
+        for start in range(0, len(self.vectors), 100):
+            kmeans.partial_fit(self.vectors[start:start + 100])
+
+        self.assertTrue(kmeans.is_fitted)
+        self.assertEqual(kmeans.counts.sum(), len(self.vectors))
+        self._assert_recovers_centers(kmeans)
+
+    def test_closest_centroids(self):
+        """Test the closest centroids are the same when they are computed in blocks
+        """
+        vectors = np.random.default_rng(1).random((5000, 3))
+        expected = np.argmin(np.linalg.norm(vectors[:, None, :] - self.centers[None, :, :], axis=2), axis=1)
+        np.testing.assert_array_equal(closest_centroids(vectors, self.centers), expected)
+
+    def test_invalid_arguments(self):
+        """Test a ValueError is raised for an invalid number of clusters, too few vectors or an unfitted model
+        """
+        self.assertRaises(ValueError, MiniBatchKMeans, 0)
+        self.assertRaises(ValueError, MiniBatchKMeans(3).fit, self.vectors[:2])
+        self.assertRaises(ValueError, MiniBatchKMeans(3).partial_fit, self.vectors[:2])
+        self.assertRaises(ValueError, MiniBatchKMeans(3).predict, self.vectors)
+
+
+if __name__ == '__main__':
+    main()
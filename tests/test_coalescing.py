@@ -0,0 +1,104 @@
+import threading
+import time
+from unittest import TestCase, main, mock
+
+import requests
+
+from track_analyzer.client import SpotifyClient
+from track_analyzer.coalescing import SingleFlight, CoalescingStats
+
+from tests.misc.utils import mocked_search_track_response
+
+
+class TestSingleFlight(TestCase):
+    """This class contains a collection of different test cases related to request coalescing
+    """
+
+    def _run_concurrently(self, target, number_of_threads: int = 10) -> None:
+        """Run the target from several threads, starting all of them at the same time
+        """
+        barrier = threading.Barrier(number_of_threads)
+
+        def run():
+            barrier.wait()
+            target()
+
+        threads = [threading.Thread(target=run) for _ in range(number_of_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_identical_calls_are_coalesced(self):
+        """Make sure identical concurrent calls share a single execution and its result
+        """
+        single_flight = SingleFlight()
+        executions = []
+        results = []
+
+        def slow_call():
+            executions.append(1)
+            time.sleep(0.1)
+            return {"tracks": {}}
+
+        self._run_concurrently(lambda: results.append(single_flight.do("key", slow_call)))
+
+        self.assertEqual(len(executions), 1)
+        self.assertEqual(len(results), 10)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(single_flight.stats, CoalescingStats(calls=10, executions=1, coalesced=9))
+
+    def test_errors_are_shared(self):
+        """Make sure the exception of the call in flight is raised to every coalesced call
+        """
+        single_flight = SingleFlight()
+        errors = []
+
+        def failing_call():
+            time.sleep(0.1)
+            raise ValueError("failed")
+
+        def call():
+            try:
+                single_flight.do("key", failing_call)
+            except ValueError as e:
+                errors.append(e)
+
+        self._run_concurrently(call, number_of_threads=5)
+        self.assertEqual(len(errors), 5)
+        self.assertEqual(single_flight.stats.executions, 1)
+
+    def test_sequential_calls_are_not_coalesced(self):
+        """Make sure a call is executed again once the previous identical call has finished
+        """
+        single_flight = SingleFlight()
+        self.assertEqual(single_flight.do("key", lambda: 1), 1)
+        self.assertEqual(single_flight.do("key", lambda: 2), 2)
+        self.assertEqual(single_flight.do("another_key", lambda: 3), 3)
+        self.assertEqual(single_flight.stats, CoalescingStats(calls=3, executions=3, coalesced=0))
+
+    @mock.patch('track_analyzer.auth.SpotifyAuth.access_token', return_value='my_access_token')
+    @mock.patch('track_analyzer.session.requests.Session.get')
+    def test_client_coalesces_requests(self, mock_requests_get, mock_access_token):
+        """Make sure concurrent identical searches from the client share a single request
+        """
+        def slow_response(*args, **kwargs):
+            time.sleep(0.1)
+            response = mock.MagicMock()
+            response.status_code = requests.codes.ok
+            response.json.return_value = mocked_search_track_response()
+            return response
+
+        mock_requests_get.side_effect = slow_response
+        spotify_client = SpotifyClient('my_client_id', 'my_client_secret')
+
+        self._run_concurrently(lambda: spotify_client.search_track('popular track', include_audio_features=False))
+
+        mock_requests_get.assert_called_once()
+        self.assertEqual(spotify_client.coalescing_stats.coalesced, 9)
+        self.assertIsNone(SpotifyClient('my_client_id', 'my_client_secret',
+                                        coalesce_requests=False).coalescing_stats)
+
+
+if __name__ == '__main__':
+    main()
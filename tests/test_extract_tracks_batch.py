@@ -0,0 +1,81 @@
+from unittest import TestCase, main
+
+from track_analyzer.client import (_extract_tracks_batch_from_response,
+                                   _extract_track_info_from_response,
+                                   _extract_audio_features_batch_from_response)
+from track_analyzer.identity_map import IdentityMap
+
+from tests.misc.utils import mocked_track_response, mocked_audio_features_response
+
+
+class TestExtractTracksBatch(TestCase):
+    """This class contains a collection of test cases related to the batch extraction of tracks and audio features
+    """
+
+    def setUp(self):
+        """Setup common values: a page of tracks as returned by the Spotify API
+        """
+        self.page = [mocked_track_response(f"track{i}") for i in range(20)]
+
+    def test_trusted_batch_matches_per_track_extraction(self):
+        """Test the trusted batch extraction returns the same tracks as the per track extraction
+        """
+        for include_album, include_artists in ((True, True), (False, True), (True, False)):
+            trusted = _extract_tracks_batch_from_response(self.page, include_album, include_artists, trusted=True)
+            expected = [_extract_track_info_from_response(track_info, include_album, include_artists)
+                        for track_info in self.page]
+            self.assertEqual([track.to_dict() for track in trusted], [track.to_dict() for track in expected])
+
+        bare_track = _extract_tracks_batch_from_response([{"id": "bare"}], trusted=True)[0]
+        self.assertEqual(bare_track.track_id, "bare")
+        self.assertIsNone(bare_track.album)
+        self.assertIsNone(bare_track.artists)
+        self.assertIsNone(bare_track.audio_features)
+        self.assertIsNone(bare_track.is_explicit)
+
+    def test_trusted_batch_validates_columns(self):
+        """Test an invalid popularity or album type in a page raises the same error as the per track extraction
+        """
+        self.page[7]["popularity"] = 101
+        with self.assertRaisesRegex(ValueError, "between 0 and 100"):
+            _extract_tracks_batch_from_response(self.page, trusted=True)
+
+        self.page[7]["popularity"] = 50
+        self.page[3]["album"]["type"] = "podcast"
+        with self.assertRaisesRegex(ValueError, "podcast is not a valid album type"):
+            _extract_tracks_batch_from_response(self.page, trusted=True)
+
+        # The album type is not validated if the album is not included
+        self.assertEqual(len(_extract_tracks_batch_from_response(self.page, include_album=False, trusted=True)), 20)
+
+    def test_trusted_batch_interns_albums_and_artists(self):
+        """Test the albums and artists of the page are interned in the identity map
+        """
+        self.page[1]["album"] = self.page[0]["album"]
+        identity_map = IdentityMap()
+
+        tracks = _extract_tracks_batch_from_response(self.page, identity_map=identity_map, trusted=True)
+        self.assertIs(tracks[0].album, tracks[1].album)
+        self.assertIs(identity_map.artist(tracks[5].artists[0]), tracks[5].artists[0])
+
+    def test_trusted_audio_features_batch(self):
+        """Test the trusted audio features extraction matches the per track extraction, and only the invalid audio
+        features are left out
+        """
+        track_ids = [f"track{i}" for i in range(10)]
+        result = {"audio_features": [mocked_audio_features_response(track_id) for track_id in track_ids[:-1]] + [None]}
+
+        trusted = _extract_audio_features_batch_from_response(track_ids, result, trusted=True)
+        expected = _extract_audio_features_batch_from_response(track_ids, result)
+        self.assertEqual({track_id: features.to_dict() for track_id, features in trusted.items()},
+                         {track_id: features.to_dict() for track_id, features in expected.items()})
+        self.assertEqual(list(trusted), track_ids[:-1])
+
+        result["audio_features"][2]["mode"] = 2
+        result["audio_features"][4]["energy"] = 1.5
+        trusted = _extract_audio_features_batch_from_response(track_ids, result, trusted=True)
+        self.assertEqual(list(trusted), [track_ids[i] for i in (0, 1, 3, 5, 6, 7, 8)])
+
+
+if __name__ == '__main__':
+    main()
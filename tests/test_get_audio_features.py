@@ -10,13 +10,13 @@ from track_analyzer.spotify_track import SpotifyTrack
 
 
 @mock.patch('track_analyzer.auth.SpotifyAuth.access_token', return_value='my_access_token')
-@mock.patch('track_analyzer.utils.requests.get')
+@mock.patch('track_analyzer.session.requests.Session.get')
 class TestGetAudioFeatures(TestCase):
     """This class contains a collection of test cases related to the _get_audio_features method
 
     The following patches are applied at class level:
     * SpotifyAuth->access_token: a generic "my_access_token" is set as the access token
-    * requests->get: all the GET requests to the Spotify API will be mocked out
+    * requests->Session->get: all the GET requests to the Spotify API will be mocked out
     """
 
     def setUp(self):
@@ -0,0 +1,93 @@
+from unittest import TestCase, main, mock
+from unittest.mock import MagicMock
+
+import requests
+
+from track_analyzer.client import SpotifyClient, AUDIO_FEATURES_BATCH_SIZE
+from track_analyzer.retry import RetryPolicy
+from track_analyzer.spotify_audio_features import SpotifyAudioFeatures
+from track_analyzer.spotify_track import SpotifyTrack
+
+from tests.misc.utils import mocked_audio_features_response
+
+
+def mocked_batch_response(url, params=None, **kwargs) -> MagicMock:
+    """Mock the response of the several audio features endpoint, returning null for every ID that starts with
+    "unknown" and failing for every request that includes an ID that starts with "broken"
+    """
+    track_ids = params["ids"].split(",")
+    response = MagicMock()
+    if any(track_id.startswith("broken") for track_id in track_ids):
+        response.status_code = requests.codes.server_error
+        return response
+
+    response.status_code = requests.codes.ok
+    response.json.return_value = {
+        "audio_features": [None if track_id.startswith("unknown") else mocked_audio_features_response(track_id)
+                           for track_id in track_ids]
+    }
+    return response
+
+
+@mock.patch('track_analyzer.auth.SpotifyAuth.access_token', return_value='my_access_token')
+@mock.patch('track_analyzer.session.requests.Session.get', side_effect=mocked_batch_response)
+class TestGetAudioFeaturesBatch(TestCase):
+    """This class contains a collection of test cases related to fetching the audio features of several tracks
+
+    The following patches are applied at class level:
+    * SpotifyAuth->access_token: a generic "my_access_token" is set as the access token
+    * requests->Session->get: all the GET requests to the Spotify API will be mocked out
+    """
+
+    def setUp(self):
+        """Setup common values
+        """
+        # Failed requests are not retried, so the broken batch fails right away
+        self.spotify_client = SpotifyClient('my_client_id', 'my_client_secret',
+                                            retry_policy=RetryPolicy(max_attempts=1))
+
+    def test_get_audio_features_batch(self, mock_requests_get, mock_access_token):
+        """Test the track IDs are split in chunks of AUDIO_FEATURES_BATCH_SIZE and every track gets its audio features
+        """
+        track_ids = [f"track{i}" for i in range(250)]
+        audio_features = self.spotify_client.get_audio_features_batch(track_ids + track_ids[:10])
+
+        # 250 unique IDs means 3 requests: 100 + 100 + 50
+        self.assertEqual(mock_requests_get.call_count, 3)
+        self.assertEqual([len(call.kwargs["params"]["ids"].split(",")) for call in mock_requests_get.call_args_list],
+                         [AUDIO_FEATURES_BATCH_SIZE, AUDIO_FEATURES_BATCH_SIZE, 50])
+        self.assertEqual(list(audio_features), track_ids)
+        for features in audio_features.values():
+            self.assertIsInstance(features, SpotifyAudioFeatures)
+
+    def test_get_audio_features_batch_missing_and_failed(self, mock_requests_get, mock_access_token):
+        """Test null entries are left out and a failed chunk doesn't prevent the other chunks from being fetched
+        """
+        track_ids = ["broken"] + [f"track{i}" for i in range(99)] + ["unknown", "track99"]
+
+        with self.assertLogs() as log:
+            audio_features = self.spotify_client.get_audio_features_batch(track_ids)
+
+        # The first chunk failed, the second one included an unknown ID
+        self.assertEqual(list(audio_features), ["track99"])
+        self.assertTrue(any("An error has occurred while trying to get the audio features for 100 tracks" in output
+                            for output in log.output))
+        self.assertTrue(any("Spotify did not return the audio features for the unknown track" in output
+                            for output in log.output))
+
+    def test_add_audio_features(self, mock_requests_get, mock_access_token):
+        """Test the audio features are populated in place using a single request
+        """
+        tracks = [SpotifyTrack("Porcelain", "1hEh8Hc9lBAFWUghHBsCel"), SpotifyTrack("Unknown", "unknown")]
+
+        with self.assertLogs():
+            enriched = self.spotify_client.add_audio_features(tracks)
+
+        self.assertEqual(enriched, 1)
+        mock_requests_get.assert_called_once()
+        self.assertIsInstance(tracks[0].audio_features, SpotifyAudioFeatures)
+        self.assertIsNone(tracks[1].audio_features)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+from unittest import TestCase, main, mock
+from unittest.mock import MagicMock
+
+import requests
+
+from track_analyzer.client import SpotifyClient, LazySpotifyTrack, TRACKS_BATCH_SIZE
+from track_analyzer.spotify_album import SpotifyAlbum
+from track_analyzer.spotify_audio_features import SpotifyAudioFeatures
+from track_analyzer.spotify_track import SpotifyTrack
+
+from tests.misc.utils import mocked_audio_features_response, mocked_track_response
+
+
+def mocked_response(url, params=None, **kwargs) -> MagicMock:
+    """Mock the responses of the several tracks and several audio features endpoints, returning null for every ID that
+    starts with "unknown"
+    """
+    track_ids = params["ids"].split(",")
+    response = MagicMock()
+    response.status_code = requests.codes.ok
+    if url.endswith("/tracks"):
+        response.json.return_value = {
+            "tracks": [None if track_id.startswith("unknown") else mocked_track_response(track_id)
+                       for track_id in track_ids]
+        }
+    else:
+        response.json.return_value = {
+            "audio_features": [mocked_audio_features_response(track_id) for track_id in track_ids]
+        }
+    return response
+
+
+@mock.patch('track_analyzer.auth.SpotifyAuth.access_token', return_value='my_access_token')
+@mock.patch('track_analyzer.session.requests.Session.get', side_effect=mocked_response)
+class TestGetTracks(TestCase):
+    """This class contains a collection of test cases related to fetching several tracks by their IDs
+
+    The following patches are applied at class level:
+    * SpotifyAuth->access_token: a generic "my_access_token" is set as the access token
+    * requests->Session->get: all the GET requests to the Spotify API will be mocked out
+    """
+
+    def setUp(self):
+        """Setup common values
+        """
+        self.spotify_client = SpotifyClient('my_client_id', 'my_client_secret')
+
+    def test_get_tracks(self, mock_requests_get, mock_access_token):
+        """Test the track IDs are split in chunks of TRACKS_BATCH_SIZE and the audio features are fetched in batches
+        """
+        track_ids = [f"track{i}" for i in range(120)]
+        spotify_tracks = self.spotify_client.get_tracks(track_ids)
+
+        # 3 requests for the tracks (50 + 50 + 20) and 2 for the audio features (100 + 20)
+        requested_urls = [call.args[0] for call in mock_requests_get.call_args_list]
+        self.assertEqual(sum(url.endswith("/tracks") for url in requested_urls), 3)
+        self.assertEqual(sum(url.endswith("/audio-features") for url in requested_urls), 2)
+        self.assertEqual(len(mock_requests_get.call_args_list[0].kwargs["params"]["ids"].split(",")),
+                         TRACKS_BATCH_SIZE)
+
+        self.assertEqual(list(spotify_tracks), track_ids)
+        for track_id, spotify_track in spotify_tracks.items():
+            self.assertIsInstance(spotify_track, SpotifyTrack)
+            self.assertEqual(spotify_track.track_id, track_id)
+            self.assertIsInstance(spotify_track.audio_features, SpotifyAudioFeatures)
+
+    def test_get_tracks_unknown_ids(self, mock_requests_get, mock_access_token):
+        """Test unknown tracks are left out and the audio features are not fetched unless requested
+        """
+        with self.assertLogs() as log:
+            spotify_tracks = self.spotify_client.get_tracks(["track1", "unknown", "track2"],
+                                                            include_audio_features=False)
+
+        mock_requests_get.assert_called_once()
+        self.assertEqual(list(spotify_tracks), ["track1", "track2"])
+        self.assertIsNone(spotify_tracks["track1"].audio_features)
+        self.assertTrue(any("Spotify did not return the unknown track" in output for output in log.output))
+
+    def test_get_lazy_tracks(self, mock_requests_get, mock_access_token):
+        """Test the client returns lazy tracks when requested, with their album, artists and audio features
+        """
+        spotify_client = SpotifyClient('my_client_id', 'my_client_secret', lazy_tracks=True)
+        spotify_tracks = spotify_client.get_tracks(["track1", "track2"])
+
+        for spotify_track in spotify_tracks.values():
+            self.assertIsInstance(spotify_track, LazySpotifyTrack)
+            self.assertIsInstance(spotify_track.album, SpotifyAlbum)
+            self.assertTrue(spotify_track.artists)
+            self.assertIsInstance(spotify_track.audio_features, SpotifyAudioFeatures)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+import gc
+from unittest import TestCase, main, mock
+from unittest.mock import MagicMock
+
+import requests
+
+from track_analyzer.client import SpotifyClient
+from track_analyzer.identity_map import IdentityMap
+from track_analyzer.spotify_album import SpotifyAlbum
+from track_analyzer.spotify_artist import SpotifyArtist
+
+from tests.misc.utils import mocked_track_response
+
+
+class TestIdentityMap(TestCase):
+    """This class contains a collection of different test cases related to interning artists and albums
+    """
+
+    def test_same_id_returns_same_instance(self):
+        """Test the artists and albums with the same ID are interned as a single instance
+        """
+        identity_map = IdentityMap()
+        artist = identity_map.artist(SpotifyArtist("Fulano", "artist_id"))
+        album = identity_map.album(SpotifyAlbum("My Album", "album_id"))
+
+        self.assertIs(identity_map.artist(SpotifyArtist("Fulano", "artist_id")), artist)
+        self.assertIs(identity_map.intern(SpotifyAlbum("My Album", "album_id")), album)
+        self.assertIsNot(identity_map.artist(SpotifyArtist("Mengano", "another_artist_id")), artist)
+        # Artists and albums with the same ID are not mixed up
+        self.assertIsInstance(identity_map.album(SpotifyAlbum("Fulano", "artist_id")), SpotifyAlbum)
+
+    def test_missing_information_is_merged(self):
+        """Test the information missing in the interned instance is filled with the information of new instances,
+        without overwriting the information already known
+        """
+        identity_map = IdentityMap()
+        artist = identity_map.artist(SpotifyArtist("Fulano", "artist_id", popularity=10))
+        identity_map.artist(SpotifyArtist("Another name", "artist_id", popularity=90, genres=["rock"]))
+
+        self.assertEqual(artist.name, "Fulano")
+        self.assertEqual(artist.popularity, 10)
+        self.assertEqual(artist.genres, ["rock"])
+
+    def test_entities_without_id_are_not_interned(self):
+        """Test the artists and albums without an ID are returned as they are and never interned
+        """
+        identity_map = IdentityMap()
+        artist = SpotifyArtist("Fulano", None)
+
+        self.assertIs(identity_map.artist(artist), artist)
+        self.assertEqual(len(identity_map), 0)
+
+    def test_unused_entities_are_collected(self):
+        """Test the identity map doesn't keep alive the artists and albums no longer referenced
+        """
+        identity_map = IdentityMap()
+        artist = identity_map.artist(SpotifyArtist("Fulano", "artist_id"))
+        identity_map.album(SpotifyAlbum("My Album", "album_id"))
+        gc.collect()
+
+        self.assertEqual(len(identity_map), 1)
+        del artist
+        gc.collect()
+        self.assertEqual(len(identity_map), 0)
+
+    @mock.patch('track_analyzer.auth.SpotifyAuth.access_token', return_value='my_access_token')
+    @mock.patch('track_analyzer.session.requests.Session.get')
+    def test_client_interns_artists_and_albums(self, mock_requests_get, mock_access_token):
+        """Test the tracks returned by the client share the instances of their artists and albums
+        """
+        tracks = [mocked_track_response(f"track{i}") for i in range(3)]
+        for track in tracks:
+            track["album"] = dict(tracks[0]["album"])
+            track["artists"] = [dict(tracks[0]["artists"][0])]
+
+        response = MagicMock()
+        response.status_code = requests.codes.ok
+        response.json.return_value = {"tracks": tracks}
+        mock_requests_get.return_value = response
+
+        spotify_client = SpotifyClient('my_client_id', 'my_client_secret', identity_map=IdentityMap())
+        spotify_tracks = list(spotify_client.get_tracks([f"track{i}" for i in range(3)],
+                                                        include_audio_features=False).values())
+
+        self.assertTrue(all(track.album is spotify_tracks[0].album for track in spotify_tracks))
+        self.assertTrue(all(track.artists[0] is spotify_tracks[0].artists[0] for track in spotify_tracks))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+from unittest import TestCase, main, mock
+from unittest.mock import MagicMock
+
+import requests
+
+from track_analyzer.client import SpotifyClient, PLAYLIST_TRACKS_PAGE_SIZE, AUDIO_FEATURES_BATCH_SIZE
+
+from tests.misc.utils import mocked_audio_features_response, mocked_track_response
+
+ALBUM_TRACKS = 12
+PLAYLIST_TRACKS = 1_000
+
+
+def _paging_object(url: str, params: dict, total: int, make_item) -> dict:
+    """Build a page of a paginated response with total items
+    """
+    offset, limit = int(params["offset"]), int(params["limit"])
+    end = min(offset + limit, total)
+    return {
+        "items": [make_item(i) for i in range(offset, end)],
+        "limit": limit,
+        "offset": offset,
+        "total": total,
+        "next": f"{url}?offset={end}" if end < total else None
+    }
+
+
+def _playlist_item(i: int) -> dict:
+    """Mock a playlist item, every 100th item is a removed track and every 100th + 1 item is an episode
+    """
+    if i % 100 == 0:
+        return {"track": None}
+
+    track = mocked_track_response(f"track{i}")
+    if i % 100 == 1:
+        track["type"] = "episode"
+    return {"track": track}
+
+
+def mocked_response(url, params=None, **kwargs) -> MagicMock:
+    """Mock the responses of the album, album tracks, playlist tracks and several audio features endpoints
+    """
+    response = MagicMock()
+    response.status_code = requests.codes.ok
+    if url.endswith("/albums/album_id"):
+        response.json.return_value = {"id": "album_id", "name": "My album", "type": "album",
+                                      "release_date": "2006-01-01", "release_date_precision": "day",
+                                      "total_tracks": ALBUM_TRACKS}
+    elif url.endswith("/albums/album_id/tracks"):
+        def album_track(i: int) -> dict:
+            track = mocked_track_response(f"track{i}")
+            del track["album"], track["popularity"]  # The album's tracks are simplified track objects
+            return track
+
+        response.json.return_value = _paging_object(url, params, ALBUM_TRACKS, album_track)
+    elif url.endswith("/playlists/playlist_id/tracks"):
+        response.json.return_value = _paging_object(url, params, PLAYLIST_TRACKS, _playlist_item)
+    else:
+        response.json.return_value = {
+            "audio_features": [mocked_audio_features_response(track_id) for track_id in params["ids"].split(",")]
+        }
+    return response
+
+
+@mock.patch('track_analyzer.auth.SpotifyAuth.access_token', return_value='my_access_token')
+@mock.patch('track_analyzer.session.requests.Session.get', side_effect=mocked_response)
+class TestIterAlbumAndPlaylistTracks(TestCase):
+    """This class contains a collection of test cases related to iterating over the tracks of albums and playlists
+
+    The following patches are applied at class level:
+    * SpotifyAuth->access_token: a generic "my_access_token" is set as the access token
+    * requests->Session->get: all the GET requests to the Spotify API will be mocked out
+    """
+
+    def setUp(self):
+        """Setup common values
+        """
+        self.spotify_client = SpotifyClient('my_client_id', 'my_client_secret')
+
+    def test_iter_album_tracks(self, mock_requests_get, mock_access_token):
+        """Test every track of the album is yielded with the album information shared by all of them
+        """
+        spotify_tracks = list(self.spotify_client.iter_album_tracks('album_id'))
+
+        self.assertEqual([track.track_id for track in spotify_tracks], [f"track{i}" for i in range(ALBUM_TRACKS)])
+        self.assertEqual(spotify_tracks[0].album.name, "My album")
+        self.assertTrue(all(track.album is spotify_tracks[0].album for track in spotify_tracks))
+        self.assertTrue(all(track.audio_features is not None for track in spotify_tracks))
+        # The album, a single page of tracks and a single batch of audio features
+        self.assertEqual(mock_requests_get.call_count, 3)
+
+    def test_iter_album_tracks_without_album(self, mock_requests_get, mock_access_token):
+        """Test the album is not requested if it doesn't need to be included
+        """
+        spotify_tracks = list(self.spotify_client.iter_album_tracks('album_id', include_album=False,
+                                                                    include_audio_features=False))
+
+        self.assertEqual(len(spotify_tracks), ALBUM_TRACKS)
+        self.assertIsNone(spotify_tracks[0].album)
+        mock_requests_get.assert_called_once()
+
+    def test_iter_playlist_tracks(self, mock_requests_get, mock_access_token):
+        """Test a large playlist is streamed with a request per page and a batched request of audio features per page,
+        skipping removed tracks and episodes
+        """
+        enriched = 0
+        yielded = 0
+        for spotify_track in self.spotify_client.iter_playlist_tracks('playlist_id'):
+            yielded += 1
+            enriched += spotify_track.audio_features is not None
+
+        self.assertEqual(yielded, PLAYLIST_TRACKS - 2 * PLAYLIST_TRACKS // 100)
+        self.assertEqual(enriched, yielded)
+
+        pages = PLAYLIST_TRACKS // PLAYLIST_TRACKS_PAGE_SIZE
+        self.assertEqual(mock_requests_get.call_count, pages + pages * PLAYLIST_TRACKS_PAGE_SIZE
+                         // AUDIO_FEATURES_BATCH_SIZE)
+
+
+if __name__ == '__main__':
+    main()
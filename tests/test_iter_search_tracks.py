@@ -0,0 +1,111 @@
+import threading
+from unittest import TestCase, main, mock
+from unittest.mock import MagicMock
+
+import requests
+
+from track_analyzer.client import SpotifyClient, SEARCH_PAGE_SIZE
+from track_analyzer.exceptions import SpotifyInvalidContentError
+
+from tests.misc.utils import mocked_audio_features_response, mocked_track_response
+
+TOTAL_RESULTS = 120
+
+
+def mocked_response(url, params=None, **kwargs) -> MagicMock:
+    """Mock the responses of a paginated search with TOTAL_RESULTS matching tracks and of the several audio features
+    endpoint
+    """
+    response = MagicMock()
+    response.status_code = requests.codes.ok
+    if url.endswith("/search"):
+        offset, limit = int(params["offset"]), int(params["limit"])
+        end = min(offset + limit, TOTAL_RESULTS)
+        response.json.return_value = {
+            "tracks": {
+                "items": [mocked_track_response(f"track{i}") for i in range(offset, end)],
+                "limit": limit,
+                "offset": offset,
+                "total": TOTAL_RESULTS,
+                "next": f"https://api.spotify.com/v1/search?offset={end}" if end < TOTAL_RESULTS else None
+            }
+        }
+    else:
+        response.json.return_value = {
+            "audio_features": [mocked_audio_features_response(track_id) for track_id in params["ids"].split(",")]
+        }
+    return response
+
+
+@mock.patch('track_analyzer.auth.SpotifyAuth.access_token', return_value='my_access_token')
+@mock.patch('track_analyzer.session.requests.Session.get', side_effect=mocked_response)
+class TestIterSearchTracks(TestCase):
+    """This class contains a collection of test cases related to iterating over the pages of a search
+
+    The following patches are applied at class level:
+    * SpotifyAuth->access_token: a generic "my_access_token" is set as the access token
+    * requests->Session->get: all the GET requests to the Spotify API will be mocked out
+    """
+
+    def setUp(self):
+        """Setup common values
+        """
+        self.spotify_client = SpotifyClient('my_client_id', 'my_client_secret')
+
+    def _search_offsets(self, mock_requests_get) -> list[int]:
+        """Get the offset of every search request made
+        """
+        return [call.kwargs["params"]["offset"] for call in mock_requests_get.call_args_list
+                if call.args[0].endswith("/search")]
+
+    def test_iterates_over_every_page(self, mock_requests_get, mock_access_token):
+        """Test every matching track is yielded in order, with its audio features fetched in a batch per page
+        """
+        spotify_tracks = list(self.spotify_client.iter_search_tracks('popular track'))
+
+        self.assertEqual([track.track_id for track in spotify_tracks], [f"track{i}" for i in range(TOTAL_RESULTS)])
+        self.assertTrue(all(track.audio_features is not None for track in spotify_tracks))
+        self.assertEqual(self._search_offsets(mock_requests_get), [0, SEARCH_PAGE_SIZE, 2 * SEARCH_PAGE_SIZE])
+        self.assertEqual(mock_requests_get.call_count, 6)
+
+    def test_max_results(self, mock_requests_get, mock_access_token):
+        """Test no more than max_results tracks are yielded and no page past them is requested
+        """
+        spotify_tracks = list(self.spotify_client.iter_search_tracks('popular track', max_results=60,
+                                                                     include_audio_features=False))
+
+        self.assertEqual(len(spotify_tracks), 60)
+        self.assertEqual(self._search_offsets(mock_requests_get), [0, SEARCH_PAGE_SIZE])
+        self.assertEqual(list(self.spotify_client.iter_search_tracks('popular track', max_results=0)), [])
+
+    def test_next_page_is_prefetched(self, mock_requests_get, mock_access_token):
+        """Test the next page is requested while the caller is still consuming the current one
+        """
+        next_page_requested = threading.Event()
+
+        def response(url, params=None, **kwargs):
+            if params.get("offset") == SEARCH_PAGE_SIZE:
+                next_page_requested.set()
+            return mocked_response(url, params, **kwargs)
+
+        mock_requests_get.side_effect = response
+        spotify_tracks = self.spotify_client.iter_search_tracks('popular track', include_audio_features=False)
+
+        self.assertEqual(next(spotify_tracks).track_id, "track0")
+        self.assertTrue(next_page_requested.wait(timeout=1))
+        spotify_tracks.close()
+
+    def test_missing_paging_object(self, mock_requests_get, mock_access_token):
+        """Test an error is raised if the search response doesn't include the "tracks" section
+        """
+        response = MagicMock()
+        response.status_code = requests.codes.ok
+        response.json.return_value = {}
+        mock_requests_get.side_effect = None
+        mock_requests_get.return_value = response
+
+        self.assertRaises(SpotifyInvalidContentError, list, self.spotify_client.iter_search_tracks('popular track'))
+
+
+if __name__ == '__main__':
+    main()
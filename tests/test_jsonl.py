@@ -0,0 +1,90 @@
+import io
+import os
+import tempfile
+from unittest import TestCase, main, skipIf
+
+from track_analyzer.jsonl import JSONLWriter, read_jsonl, write_jsonl, orjson
+from track_analyzer.spotify_album import SpotifyAlbum, SpotifyAlbumReleaseDate
+from track_analyzer.spotify_artist import SpotifyArtist
+from track_analyzer.spotify_audio_features import SpotifyAudioFeatures
+from track_analyzer.spotify_track import SpotifyTrack
+
+
+class TestJSONL(TestCase):
+    """This class contains a collection of different test cases related to the JSON lines writer and reader
+    """
+
+    def setUp(self):
+        """Setup common values: an enriched track and a bare track
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.tracks = [
+            SpotifyTrack("Ñandú", "track1", popularity=70, duration=216133, explicit=True,
+                         album=SpotifyAlbum("My Album", "album_id", genres=["pop"],
+                                            release_date=SpotifyAlbumReleaseDate("2006", "year")),
+                         artists=[SpotifyArtist("Fulano", "artist_id", followers=10)],
+                         audio_features=SpotifyAudioFeatures(energy=0.5, tempo=120.0, loudness=-5.5, mode=1)),
+            SpotifyTrack("Bare", "track2"),
+        ]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _assert_round_trip(self, path: str, backend: str):
+        """Write the tracks to the given path and check they are read back unchanged
+        """
+        self.assertEqual(write_jsonl(path, self.tracks, backend=backend), 2)
+        self.assertEqual([track.to_dict() for track in read_jsonl(path, backend=backend)],
+                         [track.to_dict() for track in self.tracks])
+
+    def test_json_round_trip(self):
+        """Test the tracks are written and read back with the standard json module, one track per line
+        """
+        path = os.path.join(self.directory.name, "tracks.jsonl")
+        self._assert_round_trip(path, "json")
+
+        with open(path, encoding="utf-8") as jsonl_file:
+            lines = jsonl_file.read().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn('"name":"Ñandú"', lines[0])
+
+    @skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_round_trip(self):
+        """Test the tracks are written and read back with orjson, and the file can be read with the json module
+        """
+        path = os.path.join(self.directory.name, "tracks.jsonl")
+        self._assert_round_trip(path, "orjson")
+        self.assertEqual([track.track_id for track in read_jsonl(path, backend="json")], ["track1", "track2"])
+
+    def test_gzip_round_trip(self):
+        """Test the files ending with .gz are compressed
+        """
+        path = os.path.join(self.directory.name, "tracks.jsonl.gz")
+        self._assert_round_trip(path, "json")
+
+        with open(path, "rb") as gzip_file:
+            self.assertEqual(gzip_file.read(2), b"\x1f\x8b")
+
+    def test_writer_streams_to_open_file(self):
+        """Test the writer appends to an open file without closing it, and the reader skips blank lines
+        """
+        buffer = io.BytesIO()
+        with JSONLWriter(buffer, backend="json") as writer:
+            writer.write(self.tracks[0])
+            self.assertEqual(writer.write_many(iter(self.tracks[1:])), 1)
+            self.assertEqual(writer.count, 2)
+
+        self.assertFalse(buffer.closed)
+        buffer.write(b"\n")
+        buffer.seek(0)
+        self.assertEqual([track.track_id for track in read_jsonl(buffer, backend="json")], ["track1", "track2"])
+
+    def test_invalid_backend(self):
+        """Test an unknown JSON backend is rejected
+        """
+        with self.assertRaises(ValueError):
+            write_jsonl(os.path.join(self.directory.name, "tracks.jsonl"), self.tracks, backend="yaml")
+
+
+if __name__ == '__main__':
+    main()
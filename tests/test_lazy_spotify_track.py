@@ -0,0 +1,133 @@
+import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase, main, mock
+
+from track_analyzer.client import (LazySpotifyTrack,
+                                   _extract_track_info_from_response,
+                                   _extract_tracks_batch_from_response)
+from track_analyzer.identity_map import IdentityMap
+from track_analyzer.spotify_album import SpotifyAlbum
+from track_analyzer.spotify_track import SpotifyTrack
+
+from tests.misc.utils import mocked_track_response
+
+
+class TestLazySpotifyTrack(TestCase):
+    """This class contains a collection of test cases related to the LazySpotifyTrack class
+    """
+
+    def setUp(self):
+        """Setup common values: a track as returned by the Spotify API
+        """
+        self.track_info = mocked_track_response("track_id")
+
+    def test_lazy_track_matches_eager_track(self):
+        """Test a lazy track exposes the same information as the eagerly extracted one
+        """
+        for include_album, include_artists in ((True, True), (False, True), (True, False), (False, False)):
+            lazy_track = LazySpotifyTrack(self.track_info, include_album, include_artists)
+            eager_track = _extract_track_info_from_response(self.track_info, include_album, include_artists)
+
+            self.assertIsInstance(lazy_track, SpotifyTrack)
+            self.assertEqual(lazy_track.to_dict(), eager_track.to_dict())
+            self.assertEqual(repr(lazy_track), repr(eager_track))
+            self.assertEqual(lazy_track.is_explicit, eager_track.is_explicit)
+
+    def test_album_and_artists_are_built_on_first_access(self):
+        """Test the album and artists are only built once, the first time they are accessed
+        """
+        with mock.patch('track_analyzer.client._extract_album_info_from_response',
+                        wraps=lambda album_info, identity_map: SpotifyAlbum(album_info["name"], album_info["id"])) \
+                as mock_extract_album:
+            lazy_track = LazySpotifyTrack(self.track_info)
+            self.assertEqual(lazy_track.track_id, "track_id")
+            mock_extract_album.assert_not_called()
+
+            self.assertIs(lazy_track.album, lazy_track.album)
+            mock_extract_album.assert_called_once()
+
+        self.assertEqual(lazy_track.artists[0].artist_id, self.track_info["artists"][0]["id"])
+        self.assertIs(lazy_track.artists, lazy_track.artists)
+
+    def test_setters_replace_the_pending_values(self):
+        """Test assigning the album or artists replaces the values that were not built yet
+        """
+        lazy_track = LazySpotifyTrack(self.track_info)
+        lazy_track.album = None
+        lazy_track.artists = []
+
+        self.assertIsNone(lazy_track.album)
+        self.assertEqual(lazy_track.artists, [])
+
+    def test_validation_and_identity_map(self):
+        """Test the popularity and album type are validated on creation and the album and artists are interned
+        """
+        self.track_info["album"]["type"] = "podcast"
+        with self.assertRaises(ValueError):
+            LazySpotifyTrack(self.track_info)
+
+        # The album type is not validated if the album is not included
+        LazySpotifyTrack(self.track_info, include_album=False)
+
+        self.track_info["album"]["type"] = "album"
+        identity_map = IdentityMap()
+        lazy_tracks = _extract_tracks_batch_from_response([self.track_info, self.track_info], identity_map=identity_map,
+                                                          lazy=True)
+        self.assertIs(lazy_tracks[0].album, lazy_tracks[1].album)
+        self.assertIs(lazy_tracks[0].artists[0], lazy_tracks[1].artists[0])
+
+    def test_creation_is_lock_free_and_validated_by_page(self):
+        """Test creating lazy tracks doesn't take the lock, and an invalid page in trusted mode raises the same error
+        as the per track validation
+        """
+        with mock.patch('track_analyzer.client._LAZY_TRACKS_LOCK') as mock_lock:
+            lazy_tracks = _extract_tracks_batch_from_response([self.track_info] * 3, trusted=True, lazy=True)
+            LazySpotifyTrack(self.track_info)
+        mock_lock.__enter__.assert_not_called()
+        self.assertEqual([track.track_id for track in lazy_tracks], ["track_id"] * 3)
+
+        self.track_info["popularity"] = 101
+        with self.assertRaisesRegex(ValueError, "between 0 and 100"):
+            _extract_tracks_batch_from_response([self.track_info], trusted=True, lazy=True)
+        with self.assertRaisesRegex(ValueError, "between 0 and 100"):
+            LazySpotifyTrack(self.track_info)
+
+    def test_from_dict_returns_eager_track(self):
+        """Test a lazy track converted to a dict can be restored with LazySpotifyTrack.from_dict, as an eager track
+        """
+        lazy_track = LazySpotifyTrack(self.track_info)
+        restored_track = LazySpotifyTrack.from_dict(lazy_track.to_dict())
+
+        self.assertIs(type(restored_track), SpotifyTrack)
+        self.assertEqual(restored_track.to_dict(), lazy_track.to_dict())
+
+    def test_concurrent_first_access(self):
+        """Test threads reading the album and artists of a lazy track at the same time get the same instances
+        """
+        lazy_track = LazySpotifyTrack(self.track_info)
+
+        def slow_extract_album(album_info, identity_map):
+            time.sleep(0.01)
+            return SpotifyAlbum(album_info["name"], album_info["id"])
+
+        with mock.patch('track_analyzer.client._extract_album_info_from_response', side_effect=slow_extract_album) \
+                as mock_extract_album, ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: (lazy_track.album, lazy_track.artists), range(8)))
+
+        mock_extract_album.assert_called_once()
+        self.assertEqual(len({id(album) for album, _ in results}), 1)
+        self.assertEqual(len({id(artists) for _, artists in results}), 1)
+
+    def test_lazy_track_pickles_materialized(self):
+        """Test a pickled lazy track keeps its album and artists but not the identity map
+        """
+        lazy_track = LazySpotifyTrack(self.track_info, identity_map=IdentityMap())
+        unpickled_track = pickle.loads(pickle.dumps(lazy_track))
+
+        self.assertEqual(unpickled_track.to_dict(), lazy_track.to_dict())
+        self.assertIsNone(unpickled_track._identity_map)
+
+
+if __name__ == '__main__':
+    main()
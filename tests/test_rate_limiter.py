@@ -0,0 +1,84 @@
+import time
+from unittest import TestCase, main, mock
+
+from requests import codes
+
+from track_analyzer.client import SpotifyClient
+from track_analyzer.exceptions import SpotifyLimitExceededError
+from track_analyzer.rate_limiter import RateLimiter
+from track_analyzer.utils import make_http_request
+
+
+class TestRateLimiter(TestCase):
+    """This class contains a collection of different test cases related to the client-side rate limiter
+    """
+
+    def test_burst_then_throttle(self):
+        """Make sure up to burst requests are sent right away and the rest wait for new tokens
+        """
+        rate_limiter = RateLimiter(rate=50, burst=2)
+
+        self.assertEqual(rate_limiter.acquire(), 0.0)
+        self.assertEqual(rate_limiter.acquire(), 0.0)
+        self.assertLess(rate_limiter.state.tokens_available, 1)
+
+        # The third request has to wait for a new token (1 / 50 seconds)
+        self.assertGreater(rate_limiter.acquire(), 0.0)
+        self.assertEqual(rate_limiter.state.throttled_requests, 1)
+        self.assertGreater(rate_limiter.state.throttled_time, 0.0)
+
+    def test_default_burst(self):
+        """Make sure the burst defaults to the number of requests allowed in a second
+        """
+        self.assertEqual(RateLimiter(rate=20).burst, 20)
+        self.assertEqual(RateLimiter(rate=0.5).burst, 1)
+        self.assertEqual(RateLimiter().state.tokens_available, float("inf"))
+
+    def test_invalid_values(self):
+        """Make sure a ValueError is raised if the rate or the burst are not valid
+        """
+        with self.assertRaises(ValueError):
+            RateLimiter(rate=0)
+
+        with self.assertRaises(ValueError):
+            RateLimiter(rate=10, burst=0)
+
+    def test_pause(self):
+        """Make sure a pause holds every request until the window has passed, even without a rate
+        """
+        rate_limiter = RateLimiter()
+
+        with self.assertLogs():
+            rate_limiter.pause(0.05)
+        self.assertGreater(rate_limiter.state.paused_for, 0.0)
+
+        start = time.monotonic()
+        rate_limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.04)
+        self.assertEqual(rate_limiter.state.paused_for, 0.0)
+
+    @mock.patch('track_analyzer.utils.requests.get')
+    def test_retry_after_pauses_the_limiter(self, mock_requests_get):
+        """Make sure the Retry-After header of a 429 response is stored in the exception and pauses the limiter
+        """
+        mock_requests_get.return_value.status_code = codes.too_many_requests
+        mock_requests_get.return_value.headers = {"Retry-After": "30"}
+        rate_limiter = RateLimiter()
+
+        with self.assertRaises(SpotifyLimitExceededError) as context, self.assertLogs():
+            make_http_request("https://api.spotify.com/v1", "search", "spotify_access_token",
+                              rate_limiter=rate_limiter)
+
+        self.assertEqual(context.exception.retry_after, 30.0)
+        self.assertGreater(rate_limiter.state.paused_for, 29.0)
+
+    def test_client_rate_limiter_state(self):
+        """Make sure the client exposes the state of its rate limiter
+        """
+        spotify_client = SpotifyClient('my_client_id', 'my_client_secret', rate_limit=5, burst=3)
+        self.assertEqual(spotify_client.rate_limiter_state.tokens_available, 3)
+        self.assertEqual(spotify_client.rate_limiter_state.throttled_requests, 0)
+
+
+if __name__ == '__main__':
+    main()
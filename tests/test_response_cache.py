@@ -0,0 +1,97 @@
+from unittest import TestCase, main, mock
+
+import requests
+
+from track_analyzer.client import SpotifyClient
+from track_analyzer.response_cache import ResponseCache, ResponseCacheStats
+from track_analyzer.utils import normalize_query_params
+
+from tests.misc.utils import mocked_search_track_response
+
+
+class TestResponseCache(TestCase):
+    """This class contains a collection of different test cases related to the in-memory response cache
+    """
+
+    def test_normalize_query_params(self):
+        """Make sure equivalent query params are normalized to the same value
+        """
+        self.assertEqual(normalize_query_params({"q": "Porcelain", "limit": 1}),
+                         normalize_query_params({"limit": "1", "q": "Porcelain"}))
+        self.assertEqual(normalize_query_params(None), ())
+
+    def test_hit_and_miss(self):
+        """Make sure cached responses are returned regardless of the order of the query params
+        """
+        response_cache = ResponseCache()
+        self.assertIsNone(response_cache.get("search", {"q": "Porcelain", "limit": 1}))
+
+        response_cache.set("search", {"q": "Porcelain", "limit": 1}, {"tracks": {}})
+        self.assertEqual(response_cache.get("search", {"limit": 1, "q": "Porcelain"}), {"tracks": {}})
+        self.assertIsNone(response_cache.get("search", {"limit": 1, "q": "Natural Blues"}))
+
+        self.assertEqual(response_cache.stats, ResponseCacheStats(hits=1, misses=2, evictions=0, expirations=0,
+                                                                  entries=1, size_bytes=len('{"tracks": {}}')))
+
+    def test_lru_eviction_by_entries(self):
+        """Make sure the least recently used response is evicted once the cache is full
+        """
+        response_cache = ResponseCache(max_entries=2)
+        response_cache.set("audio-features/1", None, {"id": "1"})
+        response_cache.set("audio-features/2", None, {"id": "2"})
+        response_cache.get("audio-features/1")  # 2 is now the least recently used
+        response_cache.set("audio-features/3", None, {"id": "3"})
+
+        self.assertIsNone(response_cache.get("audio-features/2"))
+        self.assertIsNotNone(response_cache.get("audio-features/1"))
+        self.assertIsNotNone(response_cache.get("audio-features/3"))
+        self.assertEqual(response_cache.stats.evictions, 1)
+
+    def test_lru_eviction_by_size(self):
+        """Make sure responses are evicted once the cache exceeds its size, and responses that can't fit are skipped
+        """
+        response_cache = ResponseCache(max_bytes=30)
+        response_cache.set("tracks", {"ids": "1"}, {"name": "a" * 10})  # 16 bytes
+        response_cache.set("tracks", {"ids": "2"}, {"name": "b" * 10})
+        response_cache.set("tracks", {"ids": "3"}, {"name": "c" * 100})
+
+        self.assertEqual(response_cache.stats.entries, 1)
+        self.assertEqual(response_cache.stats.evictions, 1)
+        self.assertIsNotNone(response_cache.get("tracks", {"ids": "2"}))
+
+    @mock.patch('track_analyzer.response_cache.time.monotonic')
+    def test_ttl_per_endpoint_type(self, mock_monotonic):
+        """Make sure every endpoint type expires after its own TTL, and a TTL of 0 disables the cache
+        """
+        mock_monotonic.return_value = 1000
+        response_cache = ResponseCache(ttls={"search": 10, "audio-features": 100, "tracks": 0})
+        response_cache.set("search", {"q": "Porcelain"}, {"tracks": {}})
+        response_cache.set("audio-features/1", None, {"id": "1"})
+        response_cache.set("tracks", {"ids": "1"}, {"tracks": []})
+
+        mock_monotonic.return_value = 1050
+        self.assertIsNone(response_cache.get("search", {"q": "Porcelain"}))
+        self.assertIsNotNone(response_cache.get("audio-features/1"))
+        self.assertIsNone(response_cache.get("tracks", {"ids": "1"}))
+        self.assertEqual(response_cache.stats.expirations, 1)
+
+    @mock.patch('track_analyzer.auth.SpotifyAuth.access_token', return_value='my_access_token')
+    @mock.patch('track_analyzer.session.requests.Session.get')
+    def test_client_uses_cache(self, mock_requests_get, mock_access_token):
+        """Make sure repeated searches are answered from the client's response cache
+        """
+        mock_requests_get.return_value.status_code = requests.codes.ok
+        mock_requests_get.return_value.json.return_value = mocked_search_track_response()
+        response_cache = ResponseCache()
+        spotify_client = SpotifyClient('my_client_id', 'my_client_secret', response_cache=response_cache)
+
+        first_track = spotify_client.search_track('search for a track', include_audio_features=False)
+        second_track = spotify_client.search_track('search for a track', include_audio_features=False)
+
+        self.assertEqual(first_track.track_id, second_track.track_id)
+        mock_requests_get.assert_called_once()
+        self.assertEqual(response_cache.stats.hits, 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+from unittest import TestCase, main, mock
+from unittest.mock import MagicMock
+
+from requests import codes, ConnectionError
+
+from track_analyzer.exceptions import (SpotifyForbiddenOperationError,
+                                       SpotifyLimitExceededError,
+                                       SpotifyUnknownStatusError)
+from track_analyzer.rate_limiter import RateLimiter
+from track_analyzer.retry import RetryBudget, RetryPolicy, RetryStats
+from track_analyzer.utils import make_http_request
+
+
+def mocked_response(status_code: int, headers: dict = None) -> MagicMock:
+    """Mock a response from the Spotify API with the given status code and headers
+    """
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = {"message": "it works!"}
+    return response
+
+
+@mock.patch('track_analyzer.retry.time.sleep')  # Never wait for the backoff
+@mock.patch('track_analyzer.utils.requests.get')
+class TestRetry(TestCase):
+    """This class contains a collection of different test cases related to retrying failed requests
+    """
+
+    def _make_http_request(self, retry_policy: RetryPolicy) -> dict:
+        """Make a request to the Spotify API using the given retry policy
+        """
+        return make_http_request("https://api.spotify.com/v1", "search", "spotify_access_token",
+                                 retry_policy=retry_policy)
+
+    def test_retry_transient_errors(self, mock_requests_get, mock_sleep):
+        """Make sure transient status codes and connection errors are retried until the request succeeds
+        """
+        mock_requests_get.side_effect = [mocked_response(codes.service_unavailable), ConnectionError(),
+                                         mocked_response(codes.ok)]
+        retry_policy = RetryPolicy(max_attempts=3)
+
+        with self.assertLogs() as log:
+            self.assertEqual(self._make_http_request(retry_policy), {"message": "it works!"})
+
+        self.assertEqual(retry_policy.stats, RetryStats(requests=1, retries=2, exhausted=0, budget_exceeded=0))
+        self.assertEqual(mock_sleep.call_count, 2)
+        self.assertIn("(attempt 2 of 3)", log.output[0])
+
+    def test_retry_gives_up(self, mock_requests_get, mock_sleep):
+        """Make sure the error of the last attempt is raised once all the attempts are used
+        """
+        mock_requests_get.return_value = mocked_response(codes.bad_gateway)
+        retry_policy = RetryPolicy(max_attempts=2)
+
+        with self.assertRaises(SpotifyUnknownStatusError), self.assertLogs():
+            self._make_http_request(retry_policy)
+
+        self.assertEqual(mock_requests_get.call_count, 2)
+        self.assertEqual(retry_policy.stats.exhausted, 1)
+
+    def test_not_retryable(self, mock_requests_get, mock_sleep):
+        """Make sure errors that are not retryable are raised right away
+        """
+        mock_requests_get.return_value = mocked_response(codes.forbidden)
+
+        with self.assertRaises(SpotifyForbiddenOperationError), self.assertLogs():
+            self._make_http_request(RetryPolicy())
+
+        mock_requests_get.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    def test_retry_after(self, mock_requests_get, mock_sleep):
+        """Make sure the Retry-After window is waited for, and not retried if it is longer than backoff_max
+        """
+        mock_requests_get.side_effect = [mocked_response(codes.too_many_requests, {"Retry-After": "4"}),
+                                         mocked_response(codes.ok)]
+        with self.assertLogs():
+            self._make_http_request(RetryPolicy(backoff_max=10))
+        self.assertGreaterEqual(mock_sleep.call_args.args[0], 4)
+
+        mock_requests_get.side_effect = None
+        mock_requests_get.return_value = mocked_response(codes.too_many_requests, {"Retry-After": "3600"})
+        with self.assertRaises(SpotifyLimitExceededError), self.assertLogs():
+            self._make_http_request(RetryPolicy(backoff_max=10))
+
+    def test_retry_after_with_rate_limiter(self, mock_requests_get, mock_sleep):
+        """Make sure a Retry-After window longer than backoff_max is not retried when a rate limiter is paused, and a
+        shorter one is only waited for by the limiter
+        """
+        mock_requests_get.return_value = mocked_response(codes.too_many_requests, {"Retry-After": "3"})
+        rate_limiter = RateLimiter()
+        with self.assertRaises(SpotifyLimitExceededError), self.assertLogs():
+            make_http_request("https://api.spotify.com/v1", "search", "spotify_access_token",
+                              rate_limiter=rate_limiter, retry_policy=RetryPolicy(backoff_max=1.0))
+
+        mock_requests_get.assert_called_once()
+        mock_sleep.assert_not_called()
+        self.assertGreater(rate_limiter.state.paused_for, 0.0)
+
+        mock_requests_get.side_effect = [mocked_response(codes.too_many_requests, {"Retry-After": "0.01"}),
+                                         mocked_response(codes.ok)]
+        with self.assertLogs():
+            make_http_request("https://api.spotify.com/v1", "search", "spotify_access_token",
+                              rate_limiter=RateLimiter(), retry_policy=RetryPolicy(backoff_base=0.001))
+        self.assertLessEqual(mock_sleep.call_args.args[0], 0.001)
+
+    def test_retry_budget(self, mock_requests_get, mock_sleep):
+        """Make sure retries stop once the retry budget is spent
+        """
+        mock_requests_get.return_value = mocked_response(codes.internal_server_error)
+        # A single retry is allowed in the window, no matter the number of requests
+        retry_policy = RetryPolicy(max_attempts=5, budget=RetryBudget(ratio=0, min_retries_per_second=0.1))
+
+        with self.assertRaises(SpotifyUnknownStatusError), self.assertLogs() as log:
+            self._make_http_request(retry_policy)
+
+        self.assertEqual(mock_requests_get.call_count, 2)
+        self.assertEqual(retry_policy.stats, RetryStats(requests=1, retries=1, exhausted=0, budget_exceeded=1))
+        self.assertTrue(any("The retry budget is spent" in output for output in log.output))
+
+    def test_backoff_full_jitter(self, mock_requests_get, mock_sleep):
+        """Make sure the backoff is a random value between 0 and the capped exponential delay
+        """
+        retry_policy = RetryPolicy(backoff_base=1, backoff_max=5)
+        for attempt, ceiling in ((1, 1), (2, 2), (3, 4), (4, 5), (10, 5)):
+            for _ in range(50):
+                self.assertTrue(0 <= retry_policy.backoff(attempt) <= ceiling)
+
+
+if __name__ == '__main__':
+    main()
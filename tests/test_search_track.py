@@ -13,13 +13,13 @@ from tests.misc.utils import mocked_search_track_response
 
 
 @mock.patch('track_analyzer.auth.SpotifyAuth.access_token', return_value='my_access_token')
-@mock.patch('track_analyzer.utils.requests.get')
+@mock.patch('track_analyzer.session.requests.Session.get')
 class TestSearchTrack(TestCase):
     """This class contains a collection of different test cases related to the search functionality
 
     The following patches are applied at class level:
     * SpotifyAuth->access_token: a generic "my_access_token" is set as the access token
-    * requests->get: all the GET requests to the Spotify API will be mocked out
+    * requests->Session->get: all the GET requests to the Spotify API will be mocked out
     """
 
     def setUp(self):
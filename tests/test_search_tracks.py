@@ -0,0 +1,79 @@
+from unittest import TestCase, main, mock
+from unittest.mock import MagicMock
+
+import requests
+
+from track_analyzer.client import SpotifyClient, SpotifySearchResult
+from track_analyzer.exceptions import SpotifyForbiddenOperationError
+from track_analyzer.spotify_audio_features import SpotifyAudioFeatures
+from track_analyzer.spotify_track import SpotifyTrack
+
+from tests.misc.utils import mocked_search_track_response, mocked_audio_features_response
+
+
+def mocked_response(url, params=None, **kwargs) -> MagicMock:
+    """Mock the responses of the search and several audio features endpoints. Searching for "forbidden" returns a 403
+    status and searching for "missing" doesn't find any track
+    """
+    response = MagicMock()
+    response.status_code = requests.codes.ok
+    if url.endswith("/search"):
+        if params["q"] == "forbidden":
+            response.status_code = requests.codes.forbidden
+        response.json.return_value = mocked_search_track_response(no_match=params["q"] == "missing")
+    else:
+        response.json.return_value = {
+            "audio_features": [mocked_audio_features_response(track_id) for track_id in params["ids"].split(",")]
+        }
+    return response
+
+
+@mock.patch('track_analyzer.auth.SpotifyAuth.access_token', return_value='my_access_token')
+@mock.patch('track_analyzer.session.requests.Session.get', side_effect=mocked_response)
+class TestSearchTracks(TestCase):
+    """This class contains a collection of test cases related to the bulk search functionality
+
+    The following patches are applied at class level:
+    * SpotifyAuth->access_token: a generic "my_access_token" is set as the access token
+    * requests->Session->get: all the GET requests to the Spotify API will be mocked out
+    """
+
+    def setUp(self):
+        """Setup common values
+        """
+        self.spotify_client = SpotifyClient('my_client_id', 'my_client_secret')
+
+    def test_search_tracks(self, mock_requests_get, mock_access_token):
+        """Test every query gets its result in the same order, and the audio features are fetched in a single batch
+        """
+        queries = [f"artist {i} - title {i}" for i in range(30)]
+        results = self.spotify_client.search_tracks(queries, max_workers=4)
+
+        self.assertEqual([result.query for result in results], queries)
+        for result in results:
+            self.assertIsInstance(result, SpotifySearchResult)
+            self.assertIsInstance(result.track, SpotifyTrack)
+            self.assertIsInstance(result.track.audio_features, SpotifyAudioFeatures)
+            self.assertIsNone(result.error)
+
+        # 30 searches and a single request for the audio features
+        requested_urls = [call.args[0] for call in mock_requests_get.call_args_list]
+        self.assertEqual(sum(url.endswith("/search") for url in requested_urls), 30)
+        self.assertEqual(sum(url.endswith("/audio-features") for url in requested_urls), 1)
+
+    def test_search_tracks_with_errors(self, mock_requests_get, mock_access_token):
+        """Test a failed search doesn't abort the rest of them
+        """
+        with self.assertLogs():
+            results = self.spotify_client.search_tracks(["first", "forbidden", "missing", "last"],
+                                                        include_audio_features=False)
+
+        self.assertIsInstance(results[0].track, SpotifyTrack)
+        self.assertIsNone(results[1].track)
+        self.assertIsInstance(results[1].error, SpotifyForbiddenOperationError)
+        self.assertEqual(results[2], SpotifySearchResult("missing"))
+        self.assertIsInstance(results[3].track, SpotifyTrack)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+import threading
+from unittest import TestCase, main, mock
+
+from requests import codes, ConnectionError
+
+from track_analyzer.auth import SpotifyAuth
+from track_analyzer.client import SpotifyClient
+from track_analyzer.session import SpotifySession
+from track_analyzer.utils import make_http_request
+
+
+class TestSpotifySession(TestCase):
+    """This class contains a collection of different test cases related to the pooled HTTP session
+    """
+
+    def setUp(self):
+        """Setup common variables
+        """
+        self.spotify_session = SpotifySession(pool_size=4)
+
+    def test_session_per_thread_shares_the_pool(self):
+        """Make sure every thread gets its own requests.Session, but all of them use the same connection pool
+        """
+        sessions = []
+        thread = threading.Thread(target=lambda: sessions.append(self.spotify_session.session))
+        thread.start()
+        thread.join()
+
+        # The same thread always gets the same session...
+        self.assertIs(self.spotify_session.session, self.spotify_session.session)
+        # ...a different thread gets a different one...
+        self.assertIsNot(sessions[0], self.spotify_session.session)
+        # ...but both of them share the HTTP adapter (and therefore the connection pool)
+        self.assertIs(sessions[0].get_adapter("https://api.spotify.com"),
+                      self.spotify_session.session.get_adapter("https://api.spotify.com"))
+
+    def test_keep_alive_header(self):
+        """Make sure the Connection header reflects the keep_alive setting
+        """
+        self.assertEqual(self.spotify_session.session.headers["Connection"], "keep-alive")
+        self.assertEqual(SpotifySession(keep_alive=False).session.headers["Connection"], "close")
+
+    def test_invalid_pool_size(self):
+        """Make sure a ValueError is raised if the pool size is not valid
+        """
+        with self.assertRaises(ValueError):
+            SpotifySession(pool_size=0)
+
+    @mock.patch('track_analyzer.session.requests.Session.head')
+    def test_warm_up(self, mock_session_head):
+        """Make sure a single connection is opened per host when warming up and failures are only logged
+        """
+        warmed_up = self.spotify_session.warm_up(["https://api.spotify.com/v1", "https://api.spotify.com/v1/search"])
+        self.assertEqual(warmed_up, 1)
+        mock_session_head.assert_called_once_with("https://api.spotify.com", timeout=5.0)
+
+        mock_session_head.side_effect = ConnectionError
+        with self.assertLogs() as log:
+            self.assertEqual(self.spotify_session.warm_up(["https://accounts.spotify.com/api/token"]), 0)
+            self.assertIn("Could not warm up the connection to https://accounts.spotify.com", log.output[0])
+
+    @mock.patch('track_analyzer.session.requests.Session.get')
+    def test_make_http_request_uses_session(self, mock_session_get):
+        """Make sure make_http_request sends the request through the given session
+        """
+        mock_session_get.return_value.status_code = codes.ok
+        mock_session_get.return_value.json.return_value = {"message": "it works!"}
+
+        with mock.patch('track_analyzer.utils.requests.get') as mock_requests_get:
+            result = make_http_request("https://api.spotify.com/v1", "search", "spotify_access_token",
+                                       session=self.spotify_session)
+            mock_requests_get.assert_not_called()
+
+        self.assertEqual(result, {"message": "it works!"})
+        mock_session_get.assert_called_once()
+
+    @mock.patch('track_analyzer.session.requests.Session.post')
+    def test_auth_uses_session(self, mock_session_post):
+        """Make sure SpotifyAuth requests the access token through the given session
+        """
+        mock_session_post.return_value.status_code = codes.ok
+        mock_session_post.return_value.json.return_value = {"access_token": "spotify_access_token",
+                                                            "expires_in": 3600}
+
+        spotify_auth = SpotifyAuth('my_client_id', 'my_client_secret', session=self.spotify_session)
+        self.assertEqual(spotify_auth.access_token, "spotify_access_token")
+        mock_session_post.assert_called_once()
+
+    @mock.patch('track_analyzer.session.SpotifySession.warm_up')
+    def test_client_warm_up(self, mock_warm_up):
+        """Make sure the client only warms up the connections when requested
+        """
+        SpotifyClient('my_client_id', 'my_client_secret')
+        mock_warm_up.assert_not_called()
+
+        with SpotifyClient('my_client_id', 'my_client_secret', pool_size=2, warm_up=True) as spotify_client:
+            self.assertEqual(spotify_client._session.pool_size, 2)
+            mock_warm_up.assert_called_once()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+from unittest import TestCase, main
+
+import numpy as np
+
+from track_analyzer.audio_features_frame import AudioFeaturesFrame
+from track_analyzer.similarity_index import SimilarityIndex, SimilarTrack, feature_vectors
+from track_analyzer.spotify_audio_features import SpotifyAudioFeatures
+from track_analyzer.spotify_track import SpotifyTrack
+
+
+class TestSimilarityIndex(TestCase):
+    """This class contains a collection of different test cases related to the SimilarityIndex class
+    """
+
+    def setUp(self):
+        """Setup common values: a library of random normalized audio features
+        """
+        random = np.random.default_rng(0)
+        self.track_ids = [f"track{i}" for i in range(2000)]
+        self.vectors = random.random((2000, 10), dtype=np.float32)
+        self.queries = random.random((20, 10), dtype=np.float32)
+
+    def _brute_force(self, query: np.ndarray, k: int) -> list[str]:
+        """Get the IDs of the k tracks closest to the query, comparing with every track
+        """
+        distances = np.linalg.norm(self.vectors - query, axis=1)
+        return [self.track_ids[i] for i in np.argsort(distances)[:k]]
+
+    def test_feature_vectors(self):
+        """Test the audio features are rescaled to [0, 1] with their fixed ranges
+        """
+        frame = AudioFeaturesFrame.from_tracks([
+            SpotifyTrack("Track", "track", audio_features=SpotifyAudioFeatures(loudness=-30.0, tempo=125.0, mode=1)),
+            SpotifyTrack("Unknown", "unknown")
+        ])
+        vectors = feature_vectors(frame, ["loudness", "tempo", "mode"])
+
+        np.testing.assert_allclose(vectors[0], [0.5, 0.5, 1.0])
+        self.assertTrue(np.isnan(vectors[1]).all())
+
+    def test_exact_query(self):
+        """Test the exact queries return the same tracks as a brute force search, from the closest to the farthest
+        """
+        index = SimilarityIndex()
+        index.add(self.track_ids, self.vectors)
+
+        similar_tracks = index.query(self.queries[0], k=5)
+        self.assertEqual([track.track_id for track in similar_tracks], self._brute_force(self.queries[0], 5))
+        self.assertEqual([track.distance for track in similar_tracks],
+                         sorted(track.distance for track in similar_tracks))
+
+        for query, batch_result in zip(self.queries, index.query_batch(self.queries, k=5)):
+            self.assertEqual([track.track_id for track in batch_result], self._brute_force(query, 5))
+
+    def test_partitioned_query(self):
+        """Test the approximate queries search the closest clusters and find the same tracks when every cluster is
+        searched
+        """
+        index = SimilarityIndex(n_partitions=16, n_probe=16, seed=0)
+        index.add(self.track_ids, self.vectors)
+        self.assertFalse(index.is_trained)
+
+        for query, batch_result in zip(self.queries, index.query_batch(self.queries, k=5)):
+            self.assertEqual([track.track_id for track in batch_result], self._brute_force(query, 5))
+        self.assertTrue(index.is_trained)
+
+        index.n_probe = 4
+        recall = np.mean([len({track.track_id for track in result} & set(self._brute_force(query, 10))) / 10
+                          for query, result in zip(self.queries, index.query_batch(self.queries, k=10))])
+        self.assertGreater(recall, 0.7)
+
+    def test_incremental_inserts(self):
+        """Test the tracks inserted after training are assigned to a cluster and replaced tracks are moved
+        """
+        index = SimilarityIndex(n_partitions=8, seed=0)
+        index.add(self.track_ids[:1000], self.vectors[:1000])
+        index.train()
+        index.add(self.track_ids[1000:], self.vectors[1000:])
+        index.add(["track0"], self.queries[:1])
+
+        self.assertEqual(len(index), 2000)
+        self.assertEqual(index.query(self.queries[0], k=1), [SimilarTrack("track0", 0.0)])
+        self.assertEqual(sum(len(partition) for partition in index._partitions), 2000)
+
+    def test_readd_after_training(self):
+        """Test a track added again after training is only returned once, even if its old cluster was cached
+        """
+        index = SimilarityIndex(n_partitions=8, n_probe=8, seed=0)
+        index.add(self.track_ids, self.vectors)
+        index.train()
+        index.query(self.vectors[0], k=5)  # Caches the rows of every cluster
+
+        index.add(["track0"], 1 - self.vectors[:1])
+        for vector in (self.vectors[0], 1 - self.vectors[0]):
+            track_ids = [track.track_id for track in index.query(vector, k=50)]
+            self.assertEqual(len(track_ids), len(set(track_ids)))
+
+        self.assertEqual(index.query(1 - self.vectors[0], k=1), [SimilarTrack("track0", 0.0)])
+
+    def test_repeated_track_id_after_training(self):
+        """Test a track ID repeated in a single insert after training is added once, with its last vector
+        """
+        index = SimilarityIndex(n_partitions=8, seed=0)
+        index.add(self.track_ids, self.vectors)
+        index.train()
+
+        self.assertEqual(index.add(["new", "new"], self.queries[:2]), 1)
+        self.assertEqual(len(index), 2001)
+        self.assertEqual(sum(len(partition) for partition in index._partitions), 2001)
+        self.assertEqual(index.query(self.queries[1], k=1), [SimilarTrack("new", 0.0)])
+
+    def test_query_track(self):
+        """Test the tracks similar to a track in the index don't include the track itself
+        """
+        index = SimilarityIndex()
+        index.add_tracks([SpotifyTrack(f"Track {i}", f"track{i}", audio_features=SpotifyAudioFeatures(energy=i / 10,
+                                                                                               mode=1))
+                          for i in range(10)] + [SpotifyTrack("Unknown", "unknown")])
+
+        self.assertEqual(len(index), 10)
+        self.assertNotIn("unknown", index)
+        self.assertEqual({track.track_id for track in index.query_track("track5", k=2)}, {"track4", "track6"})
+        self.assertRaises(KeyError, index.query_track, "unknown")
+
+    def test_invalid_arguments(self):
+        """Test invalid fields, partitions and queries on an empty index
+        """
+        self.assertRaises(ValueError, SimilarityIndex, ["unknown"])
+        self.assertRaises(ValueError, SimilarityIndex, n_partitions=0)
+        self.assertRaises(ValueError, SimilarityIndex().train)
+        self.assertEqual(SimilarityIndex().query(self.queries[0]), [])
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,8 @@
 from unittest import TestCase, main
 
+from track_analyzer.spotify_album import SpotifyAlbum, SpotifyAlbumReleaseDate
+from track_analyzer.spotify_artist import SpotifyArtist
+from track_analyzer.spotify_audio_features import SpotifyAudioFeatures
 from track_analyzer.spotify_track import SpotifyTrack
 
 
@@ -48,6 +51,42 @@ class TestSpotifyTrack(TestCase):
         # Shakira's Día Especial is 4 minutes and 22 seconds long
         self.assertEqual(dia_especial.human_duration, "4:22")
 
+    def test_spotify_track_is_slotted(self):
+        """Test the models don't have a per-instance __dict__, so they stay compact
+        """
+        my_track = SpotifyTrack("My Track", "abc123abc123", album=SpotifyAlbum("My Album", "album_id"),
+                                artists=[SpotifyArtist("Fulano", "artist_id")], audio_features=SpotifyAudioFeatures())
+
+        for instance in (my_track, my_track.album, my_track.artists[0], my_track.audio_features):
+            self.assertFalse(hasattr(instance, "__dict__"))
+
+        with self.assertRaises(AttributeError):
+            my_track.unknown_attribute = True
+
+    def test_spotify_track_dict_round_trip(self):
+        """Test a track, its album, artists and audio features survive the to_dict and from_dict round trip
+        """
+        my_track = SpotifyTrack("My Track", "abc123abc123", popularity=70, duration=216133, explicit=True,
+                                album=SpotifyAlbum("My Album", "album_id", album_type="album", total_tracks=12,
+                                                   release_date=SpotifyAlbumReleaseDate("2006-01-01", "day")),
+                                artists=[SpotifyArtist("Fulano", "artist_id")],
+                                audio_features=SpotifyAudioFeatures(energy=0.5, tempo=120.0, mode=1))
+
+        data = my_track.to_dict()
+        self.assertEqual(data["album"]["release_date"], {"released_on": "2006-01-01", "precision": "day"})
+        self.assertEqual([artist["artist_id"] for artist in data["artists"]], ["artist_id"])
+        self.assertEqual(data["audio_features"]["tempo"], 120.0)
+
+        copy = SpotifyTrack.from_dict(data)
+        self.assertEqual(copy.to_dict(), data)
+        self.assertTrue(copy.is_explicit)
+        self.assertEqual(copy.album.release_date.released_on, "2006-01-01")
+
+        bare_track = SpotifyTrack.from_dict({"name": "Bare", "track_id": "bare"})
+        self.assertIsNone(bare_track.album)
+        self.assertIsNone(bare_track.artists)
+        self.assertIsNone(bare_track.audio_features)
+
 
 if __name__ == '__main__':
     main()
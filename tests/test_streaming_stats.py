@@ -0,0 +1,132 @@
+import math
+import pickle
+import threading
+from unittest import TestCase, main
+
+import numpy as np
+
+from track_analyzer.audio_features_frame import AudioFeaturesFrame
+from track_analyzer.spotify_audio_features import SpotifyAudioFeatures
+from track_analyzer.spotify_track import SpotifyTrack
+from track_analyzer.streaming_stats import AudioFeaturesAggregator, KLLSketch, RunningStats
+
+
+class TestStreamingStats(TestCase):
+    """This class contains a collection of different test cases related to the streaming statistics
+    """
+
+    def setUp(self):
+        """Setup common values
+        """
+        self.values = np.random.default_rng(0).normal(120, 25, 50_000)
+
+    def _rank_error(self, values: np.ndarray, q: float, estimate: float) -> float:
+        """Get the distance between the rank of an estimated quantile in the values and the requested quantile
+        """
+        return abs(np.searchsorted(np.sort(values), estimate) / len(values) - q)
+
+    def test_running_stats(self):
+        """Test the running stats match NumPy, whether the values are added one by one, in batches or merged
+        """
+        one_by_one = RunningStats()
+        for value in self.values[:1000]:
+            one_by_one.update(value)
+
+        batched = RunningStats()
+        batched.update_many(self.values[:500])
+        merged = RunningStats()
+        merged.update_many(np.append(self.values[500:1000], np.nan))
+        batched.merge(merged)
+
+        for stats in (one_by_one, batched):
+            self.assertEqual(stats.count, 1000)
+            self.assertAlmostEqual(stats.mean, self.values[:1000].mean())
+            self.assertAlmostEqual(stats.variance, self.values[:1000].var())
+            self.assertEqual(stats.min, self.values[:1000].min())
+            self.assertEqual(stats.max, self.values[:1000].max())
+
+        self.assertTrue(math.isnan(RunningStats().std))
+
+    def test_kll_sketch(self):
+        """Test the quantiles are within the error bound of the sketch while it holds a small number of values
+        """
+        sketch = KLLSketch(seed=0)
+        sketch.update_many(self.values)
+
+        self.assertEqual(sketch.count, len(self.values))
+        self.assertLess(len(sketch), 3 * sketch.k)
+        for q, estimate in zip((0.01, 0.25, 0.5, 0.75, 0.99), sketch.quantiles([0.01, 0.25, 0.5, 0.75, 0.99])):
+            self.assertLess(self._rank_error(self.values, q, estimate), 0.0165)
+
+        self.assertTrue(math.isnan(KLLSketch().quantile(0.5)))
+        self.assertRaises(ValueError, sketch.quantile, 2)
+
+    def test_kll_sketch_merge(self):
+        """Test sketches fed by parallel workers can be merged within the same error bound
+        """
+        sketches = [KLLSketch(seed=i) for i in range(4)]
+        for i, sketch in enumerate(sketches):
+            for value in self.values[i::4]:
+                sketch.update(value)
+
+        for sketch in sketches[1:]:
+            sketches[0].merge(sketch)
+
+        self.assertEqual(sketches[0].count, len(self.values))
+        self.assertLess(self._rank_error(self.values, 0.5, sketches[0].quantile(0.5)), 0.0165)
+
+    def test_aggregator(self):
+        """Test the aggregator summarizes the audio features of tracks added one by one, in batches and merged from
+        another aggregator
+        """
+        tempos = self.values.clip(1, 249)[:3000]
+        tracks = [SpotifyTrack(f"Track {i}", f"track{i}", audio_features=SpotifyAudioFeatures(tempo=tempo, mode=i % 2))
+                  for i, tempo in enumerate(tempos)]
+        tracks.append(SpotifyTrack("Unknown", "unknown"))
+
+        aggregator = AudioFeaturesAggregator(["tempo", "mode"], seed=0)
+        for track in tracks[:1000]:
+            aggregator.add_track(track)
+        aggregator.add_tracks(tracks[1000:2000])
+
+        worker = AudioFeaturesAggregator(["tempo", "mode"], seed=1)
+        worker.add_frame(AudioFeaturesFrame.from_tracks(tracks[2000:]))
+        # Aggregators can be sent back from worker processes
+        aggregator.merge(pickle.loads(pickle.dumps(worker)))
+
+        summary = aggregator.summary()
+        self.assertEqual(aggregator.count, 3000)
+        self.assertAlmostEqual(summary["tempo"].mean, tempos.mean())
+        self.assertAlmostEqual(summary["tempo"].std, tempos.std())
+        self.assertEqual(summary["tempo"].max, tempos.max())
+        self.assertLess(self._rank_error(tempos, 0.5, summary["tempo"].median), 0.0165)
+        self.assertAlmostEqual(summary["mode"].mean, 0.5)
+
+        self.assertRaises(ValueError, aggregator.merge, AudioFeaturesAggregator())
+        self.assertRaises(ValueError, AudioFeaturesAggregator, ["unknown"])
+
+    def test_aggregator_self_and_crossed_merges(self):
+        """Test an aggregator can be merged with itself, and crossed merges from two threads don't deadlock
+        """
+        aggregator = AudioFeaturesAggregator(["tempo"], seed=0)
+        aggregator.add_frame(AudioFeaturesFrame(["a", "b"], {"tempo": np.array([100.0, 140.0])}))
+        aggregator.merge(aggregator)
+
+        summary = aggregator.summary()["tempo"]
+        self.assertEqual(summary.count, 4)
+        self.assertAlmostEqual(summary.mean, 120.0)
+        self.assertAlmostEqual(summary.std, 20.0)
+
+        other = AudioFeaturesAggregator(["tempo"], seed=1)
+        other.add_frame(AudioFeaturesFrame(["c"], {"tempo": np.array([120.0])}))
+        threads = [threading.Thread(target=lambda: [aggregator.merge(other) for _ in range(50)]),
+                   threading.Thread(target=lambda: [other.merge(aggregator) for _ in range(50)])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+            self.assertFalse(thread.is_alive())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+import os
+import tempfile
+import time
+from unittest import TestCase, main, mock
+
+from requests import codes
+
+from track_analyzer.auth import SpotifyAuth, SpotifyAccessToken
+from track_analyzer.token_cache import FileTokenCache
+
+
+@mock.patch('track_analyzer.auth.requests.post')  # Mock at class level as all the tests will use it
+class TestFileTokenCache(TestCase):
+    """This class contains a collection of different test cases related to the on-disk token cache
+    """
+
+    def setUp(self):
+        """Setup a token cache in a temporary directory
+        """
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary_directory.cleanup)
+        self.token_cache = FileTokenCache(self.temporary_directory.name)
+
+    def _mock_token_response(self, mock_requests_post, access_token: str = "new_access_token"):
+        """Mock a successful response of the accounts service with the given access token
+        """
+        mock_requests_post.return_value.status_code = codes.ok
+        mock_requests_post.return_value.json.return_value = {"access_token": access_token, "expires_in": 3600}
+
+    def test_store_and_load(self, mock_requests_post):
+        """Make sure a stored token can be loaded back and is only readable by the current user
+        """
+        token = SpotifyAccessToken("cached_access_token", 3595, time.time())
+        self.assertIsNone(self.token_cache.load('my_client_id'))
+
+        self.token_cache.store('my_client_id', token)
+
+        self.assertEqual(self.token_cache.load('my_client_id'), token)
+        self.assertIsNone(self.token_cache.load('another_client_id'))
+        self.assertEqual(os.stat(self.token_cache._path('my_client_id')).st_mode & 0o777, 0o600)
+        # No temporary files are left behind
+        self.assertEqual([name for name in os.listdir(self.temporary_directory.name) if name.endswith(".tmp")], [])
+
+    def test_load_corrupted_file(self, mock_requests_post):
+        """Make sure a corrupted token file is ignored
+        """
+        with open(self.token_cache._path('my_client_id'), "w") as token_file:
+            token_file.write("{not json")
+
+        with self.assertLogs() as log:
+            self.assertIsNone(self.token_cache.load('my_client_id'))
+            self.assertIn("Could not read the cached access token", log.output[0])
+
+    def test_auth_uses_cached_token(self, mock_requests_post):
+        """Make sure a new process starts with the valid token stored by another one, without requesting a new one
+        """
+        self._mock_token_response(mock_requests_post)
+        first_process_auth = SpotifyAuth('my_client_id', 'my_client_secret', token_cache=self.token_cache)
+        self.assertEqual(first_process_auth.access_token, "new_access_token")
+
+        second_process_auth = SpotifyAuth('my_client_id', 'my_client_secret',
+                                          token_cache=FileTokenCache(self.temporary_directory.name))
+        self.assertEqual(second_process_auth.access_token, "new_access_token")
+        mock_requests_post.assert_called_once()
+
+    def test_auth_refreshes_expired_cached_token(self, mock_requests_post):
+        """Make sure an expired cached token is replaced by a new one
+        """
+        self._mock_token_response(mock_requests_post)
+        self.token_cache.store('my_client_id', SpotifyAccessToken("expired_access_token", 3595, time.time() - 3600))
+
+        spotify_auth = SpotifyAuth('my_client_id', 'my_client_secret', token_cache=self.token_cache)
+        self.assertEqual(spotify_auth.access_token, "new_access_token")
+        self.assertEqual(self.token_cache.load('my_client_id').access_token, "new_access_token")
+        mock_requests_post.assert_called_once()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+import math
+import tempfile
+from unittest import TestCase, main
+
+import numpy as np
+
+from track_analyzer.identity_map import IdentityMap
+from track_analyzer.spotify_album import SpotifyAlbum, SpotifyAlbumReleaseDate
+from track_analyzer.spotify_artist import SpotifyArtist
+from track_analyzer.spotify_audio_features import SpotifyAudioFeatures
+from track_analyzer.spotify_track import SpotifyTrack
+from track_analyzer.track_library import TrackLibrary
+
+
+class TestTrackLibrary(TestCase):
+    """This class contains a collection of different test cases related to the TrackLibrary class
+    """
+
+    def setUp(self):
+        """Setup common values: a library with an enriched track, a track of the same album and a bare track
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        album = SpotifyAlbum("My Album", "album_id", album_type="album", total_tracks=2,
+                             release_date=SpotifyAlbumReleaseDate("2006-01-01", "day"))
+        artist = SpotifyArtist("Fulano", "artist_id")
+        self.tracks = [
+            SpotifyTrack("Ñandú", "track1", popularity=70, duration=216133, explicit=True, album=album,
+                         artists=[artist, SpotifyArtist("Mengano", "another_artist_id")],
+                         audio_features=SpotifyAudioFeatures(energy=0.734, tempo=118.211, loudness=-5.123, mode=1)),
+            SpotifyTrack("Second", "track2", explicit=False, album=album, artists=[artist]),
+            SpotifyTrack("Bare", "track3"),
+        ]
+        self.assertEqual(TrackLibrary.write(self.directory.name, self.tracks), 3)
+        self.library = TrackLibrary(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_lookup_by_id(self):
+        """Test the tracks are found by their ID and the unknown IDs are not
+        """
+        self.assertEqual(len(self.library), 3)
+        self.assertEqual([self.library.row(f"track{i}") for i in range(1, 4)], [0, 1, 2])
+        self.assertIn("track2", self.library)
+        self.assertNotIn("unknown", self.library)
+        self.assertIsNone(self.library.get("unknown"))
+        self.assertEqual(self.library.track_id(2), "track3")
+
+    def test_materialized_tracks(self):
+        """Test the materialized tracks have the same information as the tracks written
+        """
+        track = self.library.get("track1")
+
+        self.assertEqual((track.name, track.popularity, track.duration, track.is_explicit),
+                         ("Ñandú", 70, 216133, True))
+        self.assertEqual(track.human_duration, "3:36")
+        self.assertEqual((track.album.name, track.album.album_id, track.album.album_type, track.album.total_tracks),
+                         ("My Album", "album_id", "album", 2))
+        self.assertEqual(track.album.release_date, SpotifyAlbumReleaseDate("2006-01-01", "day"))
+        self.assertEqual([artist.artist_id for artist in track.artists], ["artist_id", "another_artist_id"])
+        self.assertEqual((track.audio_features.energy, track.audio_features.tempo, track.audio_features.mode),
+                         (0.734, 118.211, 1))
+        self.assertEqual(track.audio_features.to_dict(), self.tracks[0].audio_features.to_dict())
+
+        bare_track = self.library.get("track3")
+        self.assertIsNone(bare_track.popularity)
+        self.assertIsNone(bare_track.is_explicit)
+        self.assertIsNone(bare_track.album)
+        self.assertIsNone(bare_track.artists)
+        self.assertIsNone(bare_track.audio_features)
+        self.assertEqual([track.track_id for track in self.library], ["track1", "track2", "track3"])
+
+    def test_columns(self):
+        """Test the columns can be used without materializing the tracks
+        """
+        np.testing.assert_array_equal(self.library.popularity, [70, -1, -1])
+        self.assertIsInstance(self.library.audio_features["energy"], np.memmap)
+        self.assertEqual(self.library.audio_features["energy"][0], 0.734)
+        self.assertTrue(math.isnan(self.library.audio_features["energy"][1]))
+
+        frame = self.library.audio_features_frame()
+        self.assertEqual(list(frame.track_ids), ["track1", "track2", "track3"])
+        self.assertEqual(frame.describe()["tempo"].count, 1)
+
+    def test_identity_map(self):
+        """Test the albums and artists of the materialized tracks are shared through the identity map
+        """
+        library = TrackLibrary(self.directory.name, identity_map=IdentityMap())
+        first, second = library.get("track1"), library.get("track2")
+
+        self.assertIs(first.album, second.album)
+        self.assertIs(first.artists[0], second.artists[0])
+
+    def test_invalid_library(self):
+        """Test opening a directory without a library raises a FileNotFoundError
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertRaises(FileNotFoundError, TrackLibrary, directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,19 @@
-from .client import SpotifyClient
+from .client import SpotifyClient, SpotifySearchResult, LazySpotifyTrack
+from .audio_features_frame import AudioFeaturesFrame, AudioFeaturesSummary
+from .audio_features_loader import AudioFeaturesLoader, AudioFeaturesLoaderStats
+from .audio_features_store import SQLiteAudioFeaturesStore
+from .async_client import AsyncSpotifyClient
+from .identity_map import IdentityMap
+from .jsonl import JSONLWriter, read_jsonl, write_jsonl
+from .coalescing import SingleFlight, CoalescingStats
+from .clustering import MiniBatchKMeans
+from .streaming_stats import AudioFeaturesAggregator, KLLSketch, RunningStats
+from .similarity_index import SimilarityIndex, SimilarTrack
+from .rate_limiter import RateLimiter, RateLimiterState
+from .response_cache import ResponseCache, ResponseCacheStats
+from .retry import RetryPolicy, RetryBudget, RetryStats
+from .token_cache import FileTokenCache
+from .track_library import TrackLibrary
 from .spotify_track import SpotifyTrack
 from .spotify_album import SpotifyAlbum, SpotifyAlbumReleaseDate
 from .spotify_artist import SpotifyArtist
@@ -0,0 +1,219 @@
+import asyncio
+import logging
+from typing import Iterable, Optional
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is an optional dependency, only the AsyncSpotifyClient needs it
+    aiohttp = None
+
+from .auth import SpotifyAuth
+from .client import (SEARCH,
+                     AUDIO_FEATURES,
+                     AUDIO_FEATURES_BATCH_SIZE,
+                     _build_search_query_params,
+                     _extract_track_from_search_response,
+                     _extract_audio_features_from_response,
+                     _extract_audio_features_batch_from_response)
+from .exceptions import SpotifyException
+from .spotify_audio_features import SpotifyAudioFeatures
+from .spotify_track import SpotifyTrack
+from .utils import chunked, raise_for_status
+
+# The default maximum number of requests to the Spotify API in flight at the same time
+DEFAULT_MAX_CONCURRENCY: int = 100
+
+
+class AsyncSpotifyAuth:
+    """This class handles the authentication for the Spotify API from coroutines, on top of a SpotifyAuth instance.
+
+    When the token has expired, only the first coroutine requests a new one, the rest wait for it instead of flooding
+    the accounts service.
+    """
+
+    def __init__(self, auth: SpotifyAuth):
+        """Create an AsyncSpotifyAuth instance
+
+        Args:
+            auth (SpotifyAuth): the SpotifyAuth instance that holds the credentials and the access token
+        """
+        self._auth = auth
+        self._lock = asyncio.Lock()
+
+    async def access_token(self, http: "aiohttp.ClientSession") -> str:
+        """Return a valid access_token, generating a new one if needed
+
+        Args:
+            http (aiohttp.ClientSession): the session used to request a new access token
+
+        Returns: a valid access_token for using the Spotify API
+        """
+        if (access_token := self._auth.valid_access_token) is not None:
+            return access_token
+
+        async with self._lock:
+            # Another coroutine may have refreshed the token while this one was waiting for the lock
+            if (access_token := self._auth.valid_access_token) is not None:
+                return access_token
+
+            auth_url, body = self._auth.token_request()
+            async with http.post(auth_url, data=body) as response:
+                return self._auth.store_token(response.status,
+                                              await response.json() if response.status == 200 else None)
+
+
+class AsyncSpotifyClient:
+    """This class will handle authenticated requests to the Spotify API from coroutines. It mirrors the SpotifyClient
+    API and returns the same model classes.
+
+    Usage:
+        async with AsyncSpotifyClient(client_id, client_secret) as spotify_client:
+            tracks = await asyncio.gather(*(spotify_client.search_track(query) for query in queries))
+    """
+
+    def __init__(self, client_id: str, client_secret: str, *, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        """Create an AsyncSpotifyClient instance
+
+        Args:
+            client_id (str): the Spotify's Client ID obtained from the Developer dashboard
+            client_secret (str): the Spotify's Client Secret obtained from the Developer dashboard
+            -
+            max_concurrency (int): the maximum number of requests to the Spotify API in flight at the same time, any
+                other request waits for one of them to finish. Defaults to DEFAULT_MAX_CONCURRENCY
+        """
+        if aiohttp is None:
+            raise ImportError("The AsyncSpotifyClient requires aiohttp, install it with: pip install aiohttp")
+
+        if max_concurrency < 1:
+            raise ValueError("The maximum concurrency should be at least 1.")
+
+        self._auth = SpotifyAuth(client_id, client_secret)
+        self._async_auth = AsyncSpotifyAuth(self._auth)
+        self.base_url = 'https://api.spotify.com/v1'
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+        # The HTTP session must be created from a running event loop, so it is created on the first request
+        self._http: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the connections used by the client
+        """
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+
+    async def search_track(self,
+                           query: str,
+                           market: Optional[str] = None,
+                           include_artists: bool = True,
+                           include_album: bool = True,
+                           include_audio_features: bool = True) -> Optional[SpotifyTrack]:
+        """Search for a track using the Spotify API, see SpotifyClient.search_track
+
+        Args:
+            query (str): the name of the track to use in the search
+            market (Optional[str]): a country code. If a value is specified, only content that is available in the
+                market will be returned.
+            include_artists (bool): if returned, populate the artists information in the returned SpotifyTrack,
+                defaults to True
+            include_album (bool): if returned, populate the album information in the returned SpotifyTrack,
+                defaults to True
+            include_audio_features (bool): if returned, populate the audio features information in the returned
+                SpotifyTrack, defaults to True
+
+        Returns: if a matching track was found, a SpotifyTrack instance is returned, else None
+        """
+        result = await self._make_request(SEARCH, _build_search_query_params(query, market))
+
+        spotify_track = _extract_track_from_search_response(result, query, include_album, include_artists)
+        if not spotify_track:
+            return None
+
+        if include_audio_features:
+            if spotify_audio_features := await self._get_audio_features(spotify_track):
+                spotify_track.audio_features = spotify_audio_features
+            else:
+                logging.warning('Audio features were requested to be included in the track but they could not be '
+                                'fetched.')
+
+        return spotify_track
+
+    async def get_audio_features_batch(self, track_ids: Iterable[str]) -> dict[str, SpotifyAudioFeatures]:
+        """Retrieve the audio features for several tracks, see SpotifyClient.get_audio_features_batch. The batched
+        requests are sent concurrently.
+
+        Args:
+            track_ids (Iterable[str]): the Spotify IDs of the tracks, duplicated IDs are only requested once
+
+        Returns: a dict that maps each track ID to its SpotifyAudioFeatures instance
+        """
+        chunks = list(chunked(dict.fromkeys(track_ids), AUDIO_FEATURES_BATCH_SIZE))
+        results = await asyncio.gather(*(self._make_request(AUDIO_FEATURES, {"ids": ",".join(chunk)})
+                                         for chunk in chunks),
+                                       return_exceptions=True)
+
+        audio_features = {}
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, SpotifyException):
+                logging.warning(f"An error has occurred while trying to get the audio features for {len(chunk)} "
+                                f"tracks. {result}")
+                continue
+            elif isinstance(result, BaseException):
+                raise result
+
+            audio_features.update(_extract_audio_features_batch_from_response(chunk, result, trusted=True))
+
+        return audio_features
+
+    async def _get_audio_features(self, track: SpotifyTrack) -> Optional[SpotifyAudioFeatures]:
+        """Retrieve the audio features for the given track
+
+        Args:
+            track (SpotifyTrack): the track that needs its audio features fetched
+
+        Returns: a SpotifyAudioFeatures instance
+        """
+        try:
+            result = await self._make_request(f"{AUDIO_FEATURES}/{track.track_id}")
+
+            # Create and return the audio features
+            return _extract_audio_features_from_response(result)
+        except SpotifyException as e:
+            logging.warning(
+                f"An error has occurred while trying to get the audio features for the {track.track_id} track. {e}")
+            return None
+
+    async def _make_request(self, path: str, query_params: Optional[dict] = None) -> dict:
+        """Make an authorized GET request to the Spotify API, waiting for a free slot if max_concurrency requests are
+        already in flight
+
+        Args:
+            path (str): the path for the request
+            query_params (Optional[dict]): optional query params to be sent
+
+        Returns: the JSON representation of the API response
+        """
+        if self._http is None:
+            self._http = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self.max_concurrency))
+
+        access_token = await self._async_auth.access_token(self._http)
+        headers = {"Authorization": f"Bearer {access_token}"}
+
+        async with self._semaphore:
+            try:
+                async with self._http.get(f"{self.base_url}/{path}", params=query_params, headers=headers) as response:
+                    if response.status == 200:  # 200 OK
+                        return await response.json()
+
+                    raise_for_status('GET', path, response.status, response.headers)
+            except aiohttp.ClientError as e:
+                logging.critical(f"An unexpected error has occurred when trying to make a request to the Spotify API. "
+                                 f"{e=}")
+                raise
@@ -0,0 +1,267 @@
+import warnings
+from typing import Iterable, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+from .spotify_audio_features import SpotifyAudioFeatures, AUDIO_FEATURES_FIELDS
+from .spotify_track import SpotifyTrack
+
+# The normalization methods supported by AudioFeaturesFrame.normalize
+NORMALIZATION_METHODS: tuple[str, ...] = ("minmax", "zscore")
+
+
+class AudioFeaturesSummary(NamedTuple):
+    """Represents the summary statistics of a single audio feature, missing values are ignored
+
+    The AudioFeaturesSummary consists of:
+    * count (int): the number of tracks with the audio feature
+    * mean (float): the mean of the audio feature
+    * std (float): the standard deviation of the audio feature
+    * min (float): the minimum value of the audio feature
+    * p25 (float): the 25th percentile of the audio feature
+    * median (float): the median of the audio feature
+    * p75 (float): the 75th percentile of the audio feature
+    * max (float): the maximum value of the audio feature
+    """
+    count: int
+    mean: float
+    std: float
+    min: float
+    p25: float
+    median: float
+    p75: float
+    max: float
+
+
+class AudioFeaturesFrame:
+    """A columnar container of the audio features of several tracks, with a NumPy array per audio feature and an index
+    of the track IDs, so aggregates over a library are computed with vectorized operations.
+
+    Missing audio features are stored as NaN, every operation ignores them.
+
+    Usage:
+        frame = AudioFeaturesFrame.from_tracks(spotify_client.get_tracks(track_ids).values())
+        energetic_tracks = frame.filter(frame["energy"] > 0.8)
+        print(energetic_tracks.describe()["tempo"].mean)
+    """
+
+    def __init__(self, track_ids: Sequence[str], columns: dict[str, np.ndarray]):
+        """Create an AudioFeaturesFrame instance
+
+        Args:
+            track_ids (Sequence[str]): the Spotify IDs of the tracks, one per row
+            columns (dict[str, np.ndarray]): the values of every audio feature, one per row. Missing values are NaN
+        """
+        self.track_ids = np.asarray(track_ids, dtype=object)
+        self.columns = {field: np.asarray(values, dtype=np.float64) for field, values in columns.items()}
+
+        for field, values in self.columns.items():
+            if values.shape != self.track_ids.shape:
+                raise ValueError(f"The {field} column should have a value for each of the {len(self.track_ids)} "
+                                 f"tracks.")
+
+        self._index: Optional[dict[str, int]] = None
+
+    @classmethod
+    def from_audio_features(cls, audio_features: dict[str, Optional[SpotifyAudioFeatures]]) -> "AudioFeaturesFrame":
+        """Create an AudioFeaturesFrame from the audio features of several tracks, eg: the result of
+        SpotifyClient.get_audio_features_batch
+
+        Args:
+            audio_features (dict[str, Optional[SpotifyAudioFeatures]]): the audio features of every track, by track ID
+
+        Returns: an AudioFeaturesFrame with a row per track
+        """
+        return cls._from_rows(list(audio_features), list(audio_features.values()))
+
+    @classmethod
+    def from_tracks(cls, tracks: Iterable[SpotifyTrack]) -> "AudioFeaturesFrame":
+        """Create an AudioFeaturesFrame from several tracks, the tracks without audio features have NaN values
+
+        Args:
+            tracks (Iterable[SpotifyTrack]): the tracks
+
+        Returns: an AudioFeaturesFrame with a row per track
+        """
+        tracks = list(tracks)
+        return cls._from_rows([track.track_id for track in tracks], [track.audio_features for track in tracks])
+
+    @classmethod
+    def _from_rows(cls,
+                   track_ids: list[str],
+                   audio_features: list[Optional[SpotifyAudioFeatures]]) -> "AudioFeaturesFrame":
+        """Create an AudioFeaturesFrame transposing the audio features of every track into columns
+
+        Args:
+            track_ids (list[str]): the Spotify IDs of the tracks
+            audio_features (list[Optional[SpotifyAudioFeatures]]): the audio features of every track, in the same
+                order as track_ids
+
+        Returns: an AudioFeaturesFrame with a row per track
+        """
+        # Rows without audio features are filled with None, which NumPy converts to NaN
+        rows = [tuple(getattr(features, field) for field in AUDIO_FEATURES_FIELDS)
+                if features is not None else (None,) * len(AUDIO_FEATURES_FIELDS)
+                for features in audio_features]
+        matrix = np.array(rows, dtype=np.float64).reshape(len(rows), len(AUDIO_FEATURES_FIELDS))
+
+        return cls(track_ids, {field: matrix[:, i] for i, field in enumerate(AUDIO_FEATURES_FIELDS)})
+
+    def __len__(self) -> int:
+        """Returns the number of tracks in the frame
+        """
+        return len(self.track_ids)
+
+    def __contains__(self, track_id: str) -> bool:
+        """Returns if the track is in the frame
+        """
+        return track_id in self.index
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        """Returns the values of an audio feature, one per track
+        """
+        return self.columns[field]
+
+    @property
+    def fields(self) -> list[str]:
+        """Property method for fields.
+
+        Returns: the names of the audio features in the frame
+        """
+        return list(self.columns)
+
+    @property
+    def index(self) -> dict[str, int]:
+        """Property method for index, the mapping is built on first use.
+
+        Returns: a dict that maps each track ID to its row
+        """
+        if self._index is None:
+            self._index = {track_id: row for row, track_id in enumerate(self.track_ids)}
+
+        return self._index
+
+    def row(self, track_id: str) -> dict[str, float]:
+        """Get the audio features of a track
+
+        Args:
+            track_id (str): the Spotify ID of the track
+
+        Returns: a dict with the value of every audio feature of the track
+
+        Raises:
+            KeyError: if the track is not in the frame
+        """
+        row = self.index[track_id]
+        return {field: float(values[row]) for field, values in self.columns.items()}
+
+    def to_matrix(self, fields: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Get the audio features as a matrix with a row per track and a column per audio feature
+
+        Args:
+            fields (Optional[Sequence[str]]): the audio features to include, defaults to every audio feature
+
+        Returns: a 2-dimensional float array
+        """
+        fields = fields if fields is not None else self.fields
+        if not fields:
+            return np.empty((len(self), 0))
+
+        return np.column_stack([self.columns[field] for field in fields])
+
+    def missing(self) -> np.ndarray:
+        """Get which tracks have at least one missing audio feature
+
+        Returns: a bool array with a value per track
+        """
+        return np.isnan(self.to_matrix()).any(axis=1)
+
+    def filter(self, mask: Union[np.ndarray, Sequence[bool]]) -> "AudioFeaturesFrame":
+        """Get a new frame with the tracks selected by a mask, eg: frame.filter(frame["energy"] > 0.8). Comparisons
+        with missing values are False, so the tracks without the audio feature are left out.
+
+        Args:
+            mask (Union[np.ndarray, Sequence[bool]]): a bool value per track
+
+        Returns: a new AudioFeaturesFrame with the selected tracks, in the same order
+        """
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != self.track_ids.shape:
+            raise ValueError(f"The mask should have a value for each of the {len(self)} tracks.")
+
+        return AudioFeaturesFrame(self.track_ids[mask], {field: values[mask] for field, values in self.columns.items()})
+
+    def dropna(self) -> "AudioFeaturesFrame":
+        """Get a new frame without the tracks that have missing audio features
+
+        Returns: a new AudioFeaturesFrame with the complete tracks, in the same order
+        """
+        return self.filter(~self.missing())
+
+    def describe(self) -> dict[str, AudioFeaturesSummary]:
+        """Compute the summary statistics of every audio feature, ignoring the missing values. The statistics of an
+        audio feature without values are NaN.
+
+        Returns: a dict that maps each audio feature to its AudioFeaturesSummary
+        """
+        matrix = self.to_matrix()
+        counts = np.count_nonzero(~np.isnan(matrix), axis=0)
+
+        # The NaN-aware functions warn about the audio features without any value, their result is NaN as expected
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            means = np.nanmean(matrix, axis=0)
+            stds = np.nanstd(matrix, axis=0)
+            p0, p25, p50, p75, p100 = np.nanpercentile(matrix, [0, 25, 50, 75, 100], axis=0)
+
+        return {field: AudioFeaturesSummary(int(counts[i]), float(means[i]), float(stds[i]), float(p0[i]),
+                                            float(p25[i]), float(p50[i]), float(p75[i]), float(p100[i]))
+                for i, field in enumerate(self.fields)}
+
+    def corr(self, fields: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Compute the Pearson correlation between the audio features, using the tracks that have all of them
+
+        Args:
+            fields (Optional[Sequence[str]]): the audio features to correlate, defaults to every audio feature
+
+        Returns: a square matrix with the correlation between each pair of audio features, in the same order as fields.
+            The correlations of an audio feature with a constant value are NaN
+        """
+        matrix = self.to_matrix(fields)
+        matrix = matrix[~np.isnan(matrix).any(axis=1)]
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            return np.atleast_2d(np.corrcoef(matrix, rowvar=False))
+
+    def normalize(self, method: str = "minmax", fields: Optional[Sequence[str]] = None) -> "AudioFeaturesFrame":
+        """Get a new frame with the audio features rescaled, missing values are kept as NaN
+
+        Args:
+            method (str): "minmax" rescales the values to the [0, 1] range, "zscore" rescales them to a mean of 0 and
+                a standard deviation of 1. Defaults to "minmax"
+            fields (Optional[Sequence[str]]): the audio features to rescale, the rest are copied as they are. Defaults
+                to every audio feature
+
+        Returns: a new AudioFeaturesFrame with the rescaled audio features. An audio feature with a constant value is
+            rescaled to 0
+        """
+        if method not in NORMALIZATION_METHODS:
+            raise ValueError(f"{method} is not a valid normalization method.")
+
+        fields = list(fields) if fields is not None else self.fields
+        matrix = self.to_matrix(fields)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            if method == "minmax":
+                offset, scale = np.nanmin(matrix, axis=0), np.nanmax(matrix, axis=0) - np.nanmin(matrix, axis=0)
+            else:
+                offset, scale = np.nanmean(matrix, axis=0), np.nanstd(matrix, axis=0)
+
+        scale = np.where(scale > 0, scale, 1.0)
+        normalized = (matrix - offset) / scale
+
+        columns = dict(self.columns)
+        columns.update({field: normalized[:, i] for i, field in enumerate(fields)})
+        return AudioFeaturesFrame(self.track_ids, columns)
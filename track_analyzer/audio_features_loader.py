@@ -0,0 +1,141 @@
+import threading
+from concurrent.futures import Future
+from typing import Callable, NamedTuple, Optional
+
+from .spotify_audio_features import SpotifyAudioFeatures
+
+# The default number of seconds a batch waits for more track IDs before it is sent
+DEFAULT_BATCH_WINDOW: float = 0.01
+# The maximum number of track IDs accepted by Spotify's endpoint that fetches several audio features at once
+DEFAULT_MAX_BATCH_SIZE: int = 100
+
+
+class AudioFeaturesLoaderStats(NamedTuple):
+    """Represents a snapshot of the counters of an AudioFeaturesLoader
+
+    The AudioFeaturesLoaderStats consists of:
+    * loads (int): the number of audio features requested from the loader
+    * batches (int): the number of batches sent, each of them is a single request to the Spotify API
+    """
+    loads: int
+    batches: int
+
+
+class _Batch:
+    """Represents the track IDs collected during a batch window, each of them with the future of its audio features
+    """
+
+    def __init__(self):
+        self.futures: dict[str, Future] = {}
+        self.timer: Optional[threading.Timer] = None
+
+
+class AudioFeaturesLoader:
+    """Collects the audio features requested from different threads (or coroutines) within a short window and fetches
+    them with a single batched call, resolving the future of every caller.
+
+    A batch is sent once batch_window seconds have passed since its first track ID arrived, or as soon as it holds
+    max_batch_size track IDs, whichever comes first. Coroutines can await the futures with asyncio.wrap_future.
+
+    Usage:
+        loader = AudioFeaturesLoader(spotify_client.get_audio_features_batch)
+        audio_features = loader.load(track_id).result()
+    """
+
+    def __init__(self,
+                 batch_fn: Callable[[list[str]], dict[str, SpotifyAudioFeatures]],
+                 *,
+
+                 max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                 batch_window: float = DEFAULT_BATCH_WINDOW):
+        """Create an AudioFeaturesLoader instance
+
+        Args:
+            batch_fn (Callable[[list[str]], dict[str, SpotifyAudioFeatures]]): the function that fetches the audio
+                features of several tracks at once, eg: SpotifyClient.get_audio_features_batch
+            -
+            max_batch_size (int): the maximum number of track IDs per batch, defaults to DEFAULT_MAX_BATCH_SIZE
+            batch_window (float): the maximum number of seconds a batch waits for more track IDs, defaults to
+                DEFAULT_BATCH_WINDOW
+        """
+        if max_batch_size < 1:
+            raise ValueError("The maximum batch size should be at least 1.")
+
+        self._batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window
+
+        self._lock = threading.Lock()
+        self._batch: Optional[_Batch] = None
+        self._loads = 0
+        self._batches = 0
+
+    @property
+    def stats(self) -> AudioFeaturesLoaderStats:
+        """Property method for stats.
+
+        Returns: an AudioFeaturesLoaderStats with the current counters of the loader
+        """
+        with self._lock:
+            return AudioFeaturesLoaderStats(self._loads, self._batches)
+
+    def load(self, track_id: str) -> "Future[Optional[SpotifyAudioFeatures]]":
+        """Request the audio features of a track, they are fetched along with the rest of the current batch
+
+        Args:
+            track_id (str): the Spotify ID of the track
+
+        Returns: a Future that resolves to the SpotifyAudioFeatures of the track, or None if they could not be fetched
+        """
+        full_batch = None
+        with self._lock:
+            self._loads += 1
+            if (batch := self._batch) is None:
+                batch = self._batch = _Batch()
+                batch.timer = threading.Timer(self.batch_window, self._dispatch_expired, args=(batch,))
+                batch.timer.daemon = True
+                batch.timer.start()
+
+            if (future := batch.futures.get(track_id)) is None:
+                future = batch.futures[track_id] = Future()
+
+            if len(batch.futures) >= self.max_batch_size:
+                batch.timer.cancel()
+                full_batch, self._batch = batch, None
+                self._batches += 1
+
+        # A full batch is sent right away from the calling thread, which has to wait for it anyway
+        if full_batch is not None:
+            self._run(full_batch)
+
+        return future
+
+    def _dispatch_expired(self, batch: _Batch) -> None:
+        """Send the batch once its window has passed, unless it was already sent because it was full
+
+        Args:
+            batch (_Batch): the batch whose window has passed
+        """
+        with self._lock:
+            if self._batch is not batch:
+                return
+            self._batch = None
+            self._batches += 1
+
+        self._run(batch)
+
+    def _run(self, batch: _Batch) -> None:
+        """Fetch the audio features of the batch and resolve the future of every track ID
+
+        Args:
+            batch (_Batch): the batch to send
+        """
+        try:
+            audio_features = self._batch_fn(list(batch.futures))
+        except Exception as e:
+            for future in batch.futures.values():
+                future.set_exception(e)
+            return
+
+        for track_id, future in batch.futures.items():
+            future.set_result(audio_features.get(track_id))
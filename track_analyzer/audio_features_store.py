@@ -0,0 +1,108 @@
+import sqlite3
+import threading
+from typing import Iterable, Mapping
+
+from .spotify_audio_features import SpotifyAudioFeatures, AUDIO_FEATURES_FIELDS
+from .utils import chunked
+
+# The maximum number of track IDs looked up in a single query, well under SQLite's limit of host parameters
+LOOKUP_BATCH_SIZE: int = 500
+
+
+class SQLiteAudioFeaturesStore:
+    """A durable local store of audio features, keyed by track ID and backed by a SQLite database.
+
+    The audio features of a track never change, so once they are stored they never need to be requested from the
+    Spotify API again, not even after a restart. The database uses write-ahead logging (WAL), so readers don't block
+    each other nor the writer, and every thread gets its own connection. Since every connection opens the same file,
+    an in-memory database (":memory:") can't be shared between threads.
+    """
+
+    def __init__(self, path: str, *, timeout: float = 30.0):
+        """Create a SQLiteAudioFeaturesStore instance, creating the database if needed
+
+        Args:
+            path (str): the path of the SQLite database file
+            -
+            timeout (float): the maximum number of seconds to wait for a lock held by another connection, defaults
+                to 30 seconds
+        """
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connections_lock = threading.Lock()
+        self._connections: list[sqlite3.Connection] = []
+
+        columns = ", ".join(f"{field} REAL" for field in AUDIO_FEATURES_FIELDS)
+        with self._connection:
+            self._connection.execute(f"CREATE TABLE IF NOT EXISTS audio_features "
+                                     f"(track_id TEXT PRIMARY KEY, {columns}) WITHOUT ROWID")
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        """Property method for _connection. Returns the connection bound to the calling thread, opening it the first
+        time the thread uses it.
+
+        Returns: a sqlite3.Connection to the database
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            # With WAL, NORMAL is still safe against corruption and avoids a sync on every commit
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+
+        return connection
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM audio_features").fetchone()[0]
+
+    def get_many(self, track_ids: Iterable[str]) -> dict[str, SpotifyAudioFeatures]:
+        """Get the stored audio features of several tracks, using a single query for every LOOKUP_BATCH_SIZE IDs
+
+        Args:
+            track_ids (Iterable[str]): the Spotify IDs of the tracks
+
+        Returns: a dict that maps the ID of every stored track to its SpotifyAudioFeatures instance, tracks that are
+            not stored are left out
+        """
+        audio_features = {}
+        columns = ", ".join(AUDIO_FEATURES_FIELDS)
+        for chunk in chunked(dict.fromkeys(track_ids), LOOKUP_BATCH_SIZE):
+            placeholders = ", ".join("?" * len(chunk))
+            rows = self._connection.execute(f"SELECT track_id, {columns} FROM audio_features "
+                                            f"WHERE track_id IN ({placeholders})", chunk)
+            for track_id, *values in rows:
+                features = dict(zip(AUDIO_FEATURES_FIELDS, values))
+                if features["mode"] is not None:
+                    features["mode"] = int(features["mode"])
+                audio_features[track_id] = SpotifyAudioFeatures(**features)
+
+        return audio_features
+
+    def put_many(self, audio_features: Mapping[str, SpotifyAudioFeatures]) -> None:
+        """Store the audio features of several tracks in a single transaction, replacing any previous values
+
+        Args:
+            audio_features (Mapping[str, SpotifyAudioFeatures]): a mapping from track ID to its audio features
+        """
+        columns = ", ".join(AUDIO_FEATURES_FIELDS)
+        placeholders = ", ".join("?" * (len(AUDIO_FEATURES_FIELDS) + 1))
+        rows = ((track_id, *(getattr(features, field) for field in AUDIO_FEATURES_FIELDS))
+                for track_id, features in audio_features.items())
+
+        with self._connection:
+            self._connection.executemany(f"INSERT OR REPLACE INTO audio_features (track_id, {columns}) "
+                                         f"VALUES ({placeholders})", rows)
+
+    def close(self) -> None:
+        """Close the connections of every thread
+        """
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+        self._local = threading.local()
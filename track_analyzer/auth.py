@@ -1,9 +1,20 @@
 import time
 import logging
+import threading
 import requests
-from typing import NamedTuple, Optional
+from typing import NamedTuple, Optional, TYPE_CHECKING
 
 from .exceptions import SpotifyAuthenticationError
+from .session import SpotifySession
+
+if TYPE_CHECKING:
+    from .token_cache import FileTokenCache
+
+# The Spotify accounts service endpoint used to request access tokens
+AUTH_URL: str = 'https://accounts.spotify.com/api/token'
+
+# The default number of seconds before the token expires when a background refresh is started
+DEFAULT_REFRESH_MARGIN: float = 60.0
 
 
 class SpotifyAccessToken(NamedTuple):
@@ -12,30 +23,66 @@ class SpotifyAccessToken(NamedTuple):
     The SpotifyAccessToken consists of:
     * access_token (str): the access token
     * expires_in (int): the duration of the token in seconds, eg: 3600 for 1hr
-    * timestamp (time): the timestamp when the access token was generated
+    * timestamp (float): the wall clock time (see time.time) when the access token was generated
     """
     access_token: str
     expires_in: int
-    timestamp: time = time.time()
+    timestamp: float
+
+    def expires_within(self, seconds: float = 0.0) -> bool:
+        """Check if the token has expired or will expire within the given number of seconds
+
+        Args:
+            seconds (float): the number of seconds from now, defaults to 0, meaning: check if it has expired already
+
+        Returns: True if the token expires within the given number of seconds, else False
+        """
+        return (time.time() + seconds - self.timestamp) > self.expires_in
 
 
 class SpotifyAuth:
     """This class handles the authentication for the Spotify API.
     """
 
-    def __init__(self, client_id: str, client_secret: str):
+    def __init__(self,
+                 client_id: str,
+                 client_secret: str,
+                 *,
+
+                 session: Optional[SpotifySession] = None,
+                 background_refresh: bool = False,
+                 refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+                 token_cache: Optional["FileTokenCache"] = None):
         """Create a SpotifyAuth instance
 
         Args:
             client_id (str): the Spotify's Client ID obtained from the Developer dashboard
             client_secret (str): the Spotify's Client Secret obtained from the Developer dashboard
+            -
+            session (Optional[SpotifySession]): the pooled session used to request access tokens. If not provided, a
+                new connection is opened for every token request
+            background_refresh (bool): if True, once the token is about to expire a new one is requested from a
+                background thread while the current one keeps being used, defaults to False
+            refresh_margin (float): the number of seconds before the token expires when the background refresh is
+                started, defaults to DEFAULT_REFRESH_MARGIN
+            token_cache (Optional[FileTokenCache]): an on-disk cache shared with other processes. If provided, a valid
+                cached token is used instead of requesting a new one, and new tokens are stored in it
         """
         self._client_id = client_id
         self._client_secret = client_secret
-        self._auth_url = 'https://accounts.spotify.com/api/token'
+        self._auth_url = AUTH_URL
+        self._session = session
+        self._background_refresh = background_refresh
+        self._refresh_margin = refresh_margin
+        self._token_cache = token_cache
 
         # Store token
         self._credentials: Optional[SpotifyAccessToken] = None
+        # Only a single thread generates a new token at a time, the rest wait for it
+        self._lock = threading.Lock()
+        # A separate lock for starting the background refresh, so the hot path never waits for a token request
+        self._refresh_thread_lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
 
     @property
     def access_token(self) -> str:
@@ -43,35 +90,146 @@ class SpotifyAuth:
         * A token has never been generated before, or
         * A token has already been generated, but it has expired
 
+        If several threads find the token expired at the same time, only one of them generates a new token.
+
         Returns: a valid access_token for using the Spotify API
         """
-        if not self._credentials:
+        credentials = self._credentials
+        if not credentials or credentials.expires_within():
+            with self._lock:
+                # Another thread may have generated the token while this one was waiting for the lock
+                if not self._is_token_valid():
+                    self._load_or_generate_access_token()
+
+                return self._credentials.access_token
+
+        if self._background_refresh and credentials.expires_within(self._refresh_margin):
+            self._start_background_refresh()
+
+        return credentials.access_token
+
+    @property
+    def valid_access_token(self) -> Optional[str]:
+        """Property method for valid_access_token. Unlike access_token, this never requests a new token
+
+        Returns: the stored access token if it hasn't expired yet, else None
+        """
+        credentials = self._credentials
+        return credentials.access_token if credentials and not credentials.expires_within() else None
+
+    def token_request(self) -> tuple[str, dict]:
+        """Get the request for a new access token, for callers that send it with their own HTTP client (eg: from
+        asyncio code). Its response must be handled with store_token
+
+        Returns: a tuple with the URL of the Spotify accounts service and the form body of the POST request
+        """
+        return self._auth_url, self._token_request_body()
+
+    def store_token(self, status_code: int, token_response: Optional[dict]) -> str:
+        """Store the access token of a response of the Spotify accounts service, see token_request
+
+        Args:
+            status_code (int): the HTTP status code of the response
+            token_response (Optional[dict]): the JSON representation of the response, only needed if it succeeded
+
+        Returns: the new access token
+
+        Raises:
+            SpotifyAuthenticationError: if the response is not successful
+        """
+        if status_code != requests.codes.ok:
+            self._raise_authentication_error(status_code)
+
+        self._store_access_token(token_response)
+        return self._credentials.access_token
+
+    def _load_or_generate_access_token(self, min_time_to_live: float = 0.0) -> None:
+        """Load the access token from the token cache or, if there isn't a cached token that is valid for at least
+        min_time_to_live seconds, generate a new one and cache it. This must be called while holding the lock
+
+        Args:
+            min_time_to_live (float): the minimum number of seconds a cached token must still be valid for,
+                defaults to 0
+        """
+        if self._token_cache is None:
             self._generate_access_token()
-            return self._credentials.access_token
-        else:
-            # Check if token is not expired yet
-            current_time = time.time()
-            token_timestamp = self._credentials.timestamp
-            token_expiration_in_seconds = self._credentials.expires_in
+            return
 
-            if (current_time - token_timestamp) > token_expiration_in_seconds:
-                # Token has  expired
-                self._generate_access_token()
+        # Hold the cache lock, so a single process requests a new token while the rest wait and then load it
+        with self._token_cache.lock(self._client_id):
+            cached_credentials = self._token_cache.load(self._client_id)
+            if cached_credentials and not cached_credentials.expires_within(min_time_to_live):
+                self._credentials = cached_credentials
+                logging.info('Access token loaded from the token cache.')
+                return
 
-            return self._credentials.access_token
+            self._generate_access_token()
+            self._token_cache.store(self._client_id, self._credentials)
 
     def _generate_access_token(self) -> None:
         """Generate a new access token
         """
-        body = {"grant_type": "client_credentials", "client_id": self._client_id, "client_secret": self._client_secret}
-        req = requests.post(self._auth_url, data=body)
-
-        if req.status_code == requests.codes.ok:
-            resp = req.json()
-            self._credentials = SpotifyAccessToken(access_token=resp.get("access_token"),
-                                                   # Subtract 5 seconds just in case
-                                                   expires_in=(resp.get("expires_in") - 5))
-            logging.info('Access token generated successfully.')
-        else:
-            logging.error(f"Could not generate access token. Status code: {req.status_code}")
-            raise SpotifyAuthenticationError(req.status_code)
+        http = self._session if self._session is not None else requests
+        auth_url, body = self.token_request()
+        req = http.post(auth_url, data=body)
+
+        self.store_token(req.status_code, req.json() if req.status_code == requests.codes.ok else None)
+
+    def _is_token_valid(self) -> bool:
+        """Check if a token has already been generated and it hasn't expired yet
+
+        Returns: True if the stored token can still be used, else False
+        """
+        return bool(self._credentials) and not self._credentials.expires_within()
+
+    def _start_background_refresh(self) -> None:
+        """Start a thread that generates a new access token, unless one is already running
+        """
+        with self._refresh_thread_lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+
+            self._refresh_thread = threading.Thread(target=self._refresh_access_token, daemon=True)
+            self._refresh_thread.start()
+
+    def _refresh_access_token(self) -> None:
+        """Generate a new access token from the background refresh thread. Errors are only logged, since the current
+        token is still valid and a new one is requested again when it expires
+        """
+        try:
+            with self._lock:
+                if self._credentials and self._credentials.expires_within(self._refresh_margin):
+                    self._load_or_generate_access_token(self._refresh_margin)
+        except Exception as e:
+            logging.warning(f"Could not refresh the access token in the background. {e}")
+
+    def _token_request_body(self) -> dict:
+        """Build the body of the request for a new access token
+
+        Returns: a dict with the client credentials
+        """
+        return {"grant_type": "client_credentials", "client_id": self._client_id, "client_secret": self._client_secret}
+
+    def _store_access_token(self, resp: dict) -> None:
+        """Store the access token returned by the Spotify accounts service
+
+        Args:
+            resp (dict): the JSON representation of the accounts service response
+        """
+        self._credentials = SpotifyAccessToken(access_token=resp.get("access_token"),
+                                               # Subtract 5 seconds just in case
+                                               expires_in=(resp.get("expires_in") - 5),
+                                               timestamp=time.time())
+        logging.info('Access token generated successfully.')
+
+    def _raise_authentication_error(self, status_code: int) -> None:
+        """Log and raise the error for an unsuccessful access token request
+
+        Args:
+            status_code (int): the HTTP status code returned by the Spotify accounts service
+
+        Raises:
+            SpotifyAuthenticationError: always
+        """
+        logging.error(f"Could not generate access token. Status code: {status_code}")
+        raise SpotifyAuthenticationError(status_code)
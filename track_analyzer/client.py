@@ -1,14 +1,25 @@
 import logging
 import os
-from typing import Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional
 
-from .auth import SpotifyAuth
+from .audio_features_loader import AudioFeaturesLoader, AudioFeaturesLoaderStats
+from .audio_features_store import SQLiteAudioFeaturesStore
+from .auth import SpotifyAuth, AUTH_URL
+from .coalescing import SingleFlight, CoalescingStats
+from .identity_map import IdentityMap
+from .rate_limiter import RateLimiter, RateLimiterState
+from .response_cache import ResponseCache
+from .retry import RetryPolicy, RetryStats
+from .session import SpotifySession, DEFAULT_POOL_SIZE
 from .exceptions import SpotifyInvalidContentError, SpotifyException
-from .spotify_album import SpotifyAlbum, SpotifyAlbumReleaseDate
+from .spotify_album import SpotifyAlbum, SpotifyAlbumReleaseDate, ALLOWED_ALBUM_TYPES
 from .spotify_artist import SpotifyArtist
-from .spotify_audio_features import SpotifyAudioFeatures
+from .spotify_audio_features import SpotifyAudioFeatures, AUDIO_FEATURES_FIELDS
 from .spotify_track import SpotifyTrack
-from .utils import make_http_request
+from .token_cache import FileTokenCache
+from .utils import make_http_request, chunked, normalize_query_params
 
 DEFAULT_MARKET: str = os.environ.get('DEFAULT_MARKET', 'GT')  # Default the market to Guatemala
 
@@ -18,22 +29,159 @@ TRACK: str = "track"
 # Spotify's paths:
 SEARCH: str = "search"
 AUDIO_FEATURES: str = "audio-features"
+TRACKS: str = "tracks"
+ALBUMS: str = "albums"
+PLAYLISTS: str = "playlists"
+
+# The maximum number of track IDs accepted by Spotify's endpoints that fetch several objects at once
+AUDIO_FEATURES_BATCH_SIZE: int = 100
+TRACKS_BATCH_SIZE: int = 50
+# The maximum number of items Spotify returns in a single page of results, per endpoint
+SEARCH_PAGE_SIZE: int = 50
+ALBUM_TRACKS_PAGE_SIZE: int = 50
+PLAYLIST_TRACKS_PAGE_SIZE: int = 100
+
+# The audio features that must be between 0.0 and 1.0, see SpotifyAudioFeatures
+_UNIT_AUDIO_FEATURES: tuple[int, ...] = tuple(AUDIO_FEATURES_FIELDS.index(field)
+                                              for field in ("acousticness", "danceability", "energy", "valence"))
+_MODE_AUDIO_FEATURE: int = AUDIO_FEATURES_FIELDS.index("mode")
+
+
+class SpotifySearchResult(NamedTuple):
+    """Represents the result of a single query in a bulk search
+
+    The SpotifySearchResult consists of:
+    * query (str): the query used in the search
+    * track (Optional[SpotifyTrack]): the matching track, None if no track was found or the search failed
+    * error (Optional[SpotifyException]): the error raised by the search, None if the search was successful
+    """
+    query: str
+    track: Optional[SpotifyTrack] = None
+    error: Optional[SpotifyException] = None
 
 
 class SpotifyClient:
     """This class will handle authenticated requests to the Spotify API
     """
 
-    def __init__(self, client_id: str, client_secret: str):
+    def __init__(self,
+                 client_id: str,
+                 client_secret: str,
+                 *,
+
+                 pool_size: int = DEFAULT_POOL_SIZE,
+                 keep_alive: bool = True,
+                 warm_up: bool = False,
+                 rate_limit: Optional[float] = None,
+                 burst: Optional[int] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 background_token_refresh: bool = False,
+                 token_cache: Optional[FileTokenCache] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 audio_features_store: Optional[SQLiteAudioFeaturesStore] = None,
+                 coalesce_requests: bool = True,
+                 audio_features_batch_window: Optional[float] = None,
+                 identity_map: Optional[IdentityMap] = None,
+                 lazy_tracks: bool = False):
         """Create a SpotifyClient instance
 
         Args:
             client_id (str): the Spotify's Client ID obtained from the Developer dashboard
             client_secret (str): the Spotify's Client Secret obtained from the Developer dashboard
+            -
+            pool_size (int): the maximum number of connections kept alive per host, this is shared by the API and
+                authentication requests. Defaults to DEFAULT_POOL_SIZE
+            keep_alive (bool): if True, connections are reused between requests, defaults to True
+            warm_up (bool): if True, the connections to the Spotify API and accounts service are opened right away
+                instead of on the first request, defaults to False
+            rate_limit (Optional[float]): the number of requests per second the client is allowed to send. If not
+                provided, the requests are only paused when Spotify returns a rate limit exceeded error
+            burst (Optional[int]): the maximum number of requests sent at once after the client has been idle,
+                defaults to the number of requests allowed in a second
+            retry_policy (Optional[RetryPolicy]): the policy used to retry the failed requests, its retry budget is
+                shared by every request of the client. Defaults to a RetryPolicy with its default values
+            background_token_refresh (bool): if True, the access token is refreshed from a background thread shortly
+                before it expires, so requests never wait for the accounts service. Defaults to False
+            token_cache (Optional[FileTokenCache]): an on-disk cache that shares the access token with other
+                processes on the host, so a new process can start with a valid token
+            response_cache (Optional[ResponseCache]): an in-memory cache of the API responses. If provided, repeated
+                requests are answered from it instead of the network
+            audio_features_store (Optional[SQLiteAudioFeaturesStore]): a durable local store of audio features. If
+                provided, audio features are looked up in it before requesting them, and fetched ones are stored in it
+            coalesce_requests (bool): if True, identical requests made at the same time from different threads share a
+                single network call and its result. Defaults to True
+            audio_features_batch_window (Optional[float]): if provided, the audio features requested one track at a
+                time (eg: by concurrent calls to search_track) are collected for this number of seconds, or until
+                AUDIO_FEATURES_BATCH_SIZE tracks are collected, and fetched with a single batched request
+            identity_map (Optional[IdentityMap]): if provided, the artists and albums of the returned tracks are
+                interned in it, so tracks of the same artist or album share the same instance
+            lazy_tracks (bool): if True, the tracks returned by the bulk methods (get_tracks and the iter_* methods)
+                are LazySpotifyTracks, which only build their album and artists when they are first accessed.
+                Defaults to False
         """
-        self._auth = SpotifyAuth(client_id, client_secret)
+        self._session = SpotifySession(pool_size, keep_alive=keep_alive)
+        self._rate_limiter = RateLimiter(rate_limit, burst)
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self._response_cache = response_cache
+        self._audio_features_store = audio_features_store
+        self._single_flight = SingleFlight() if coalesce_requests else None
+        self._identity_map = identity_map
+        self._lazy_tracks = lazy_tracks
+        self._audio_features_loader = AudioFeaturesLoader(self.get_audio_features_batch,
+                                                          max_batch_size=AUDIO_FEATURES_BATCH_SIZE,
+                                                          batch_window=audio_features_batch_window) \
+            if audio_features_batch_window is not None else None
+        self._auth = SpotifyAuth(client_id, client_secret, session=self._session,
+                                 background_refresh=background_token_refresh, token_cache=token_cache)
         self.base_url = 'https://api.spotify.com/v1'
 
+        if warm_up:
+            self._session.warm_up([self.base_url, AUTH_URL])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled connections used by the client
+        """
+        self._session.close()
+
+    @property
+    def rate_limiter_state(self) -> RateLimiterState:
+        """Property method for rate_limiter_state.
+
+        Returns: a RateLimiterState with the current state of the client's rate limiter
+        """
+        return self._rate_limiter.state
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        """Property method for retry_stats.
+
+        Returns: a RetryStats with the current retry counters of the client
+        """
+        return self._retry_policy.stats
+
+    @property
+    def coalescing_stats(self) -> Optional[CoalescingStats]:
+        """Property method for coalescing_stats.
+
+        Returns: a CoalescingStats with the number of requests that were coalesced, None if coalescing is disabled
+        """
+        return self._single_flight.stats if self._single_flight is not None else None
+
+    @property
+    def audio_features_loader_stats(self) -> Optional[AudioFeaturesLoaderStats]:
+        """Property method for audio_features_loader_stats.
+
+        Returns: an AudioFeaturesLoaderStats with the number of audio features loaded and the number of batches sent,
+            None if the audio features are not batched
+        """
+        return self._audio_features_loader.stats if self._audio_features_loader is not None else None
+
     def search_track(self,
                      query: str,
                      market: Optional[str] = None,
@@ -56,29 +204,14 @@ class SpotifyClient:
 
         Returns: if a matching track was found, a SpotifyTrack instance is returned, else None
         """
-        # Build the query params for the request
-        query_params = {
-            "type": TRACK,
-            "market": market if market else DEFAULT_MARKET,
-            "limit": 1,
-            "q": query
-        }
         # Make the HTTP request
-        result = make_http_request(self.base_url, SEARCH, self._auth.access_token, query_params)
-
-        if "tracks" not in result:  # Return an error if "tracks" is not in the response
-            raise SpotifyInvalidContentError("GET", SEARCH, "'tracks' is missing in the response.")
+        result = self._make_request(SEARCH, _build_search_query_params(query, market))
 
-        tracks_section = result.get("tracks")
-        if not tracks_section.get("items"):  # Empty items means no matching track was found
-            logging.error(f"Could not find any matching track with the given query: {query}")
+        spotify_track = _extract_track_from_search_response(result, query, include_album, include_artists,
+                                                            identity_map=self._identity_map)
+        if not spotify_track:
             return None
 
-        # Extract the track info from the response
-        track_info_from_response = tracks_section.get("items")[0]
-        logging.info('Matching track found, extracting the the information from the response...')
-        spotify_track = _extract_track_info_from_response(track_info_from_response, include_album, include_artists)
-
         if include_audio_features:
             if spotify_audio_features := self._get_audio_features(spotify_track):
                 spotify_track.audio_features = spotify_audio_features
@@ -88,6 +221,225 @@ class SpotifyClient:
 
         return spotify_track
 
+    def iter_search_tracks(self,
+                           query: str,
+                           market: Optional[str] = None,
+                           include_artists: bool = True,
+                           include_album: bool = True,
+                           include_audio_features: bool = True,
+                           max_results: Optional[int] = None) -> Iterator[SpotifyTrack]:
+        """Lazily iterate over every track matching a search, in the order returned by the Spotify API. The results are
+        requested one page at a time and the next page is prefetched in the background while the current one is
+        consumed, so only two pages are held in memory regardless of the number of results.
+
+        Args:
+            query (str): the name of the track to use in the search
+            market (Optional[str]): a country code. If a value is specified, only content that is available in the
+                market will be returned.
+            include_artists (bool): if returned, populate the artists information in the yielded SpotifyTracks,
+                defaults to True
+            include_album (bool): if returned, populate the album information in the yielded SpotifyTracks,
+                defaults to True
+            include_audio_features (bool): if returned, populate the audio features information in the yielded
+                SpotifyTracks using a batched request per page, defaults to True
+            max_results (Optional[int]): the maximum number of tracks to yield, defaults to every matching track
+
+        Returns: an iterator of SpotifyTrack instances
+        """
+        if max_results is not None and max_results < 1:
+            return
+
+        page_size = min(SEARCH_PAGE_SIZE, max_results) if max_results is not None else SEARCH_PAGE_SIZE
+        yield from self._iter_paginated_tracks(SEARCH, _build_search_query_params(query, market, limit=page_size),
+                                               lambda page: _extract_tracks_batch_from_response(
+                                                   page, include_album, include_artists,
+                                                   identity_map=self._identity_map, trusted=True,
+                                                   lazy=self._lazy_tracks),
+                                               page_key="tracks",
+                                               max_items=max_results,
+                                               include_audio_features=include_audio_features)
+
+    def iter_album_tracks(self,
+                          album_id: str,
+                          market: Optional[str] = None,
+                          include_artists: bool = True,
+                          include_album: bool = True,
+                          include_audio_features: bool = True) -> Iterator[SpotifyTrack]:
+        """Lazily iterate over the tracks of an album, in the album's order. The tracks are requested one page at a
+        time while the next page is prefetched in the background, see iter_search_tracks.
+
+        Args:
+            album_id (str): the Spotify ID of the album
+            market (Optional[str]): a country code. If a value is specified, only content that is available in the
+                market will be returned.
+            include_artists (bool): if returned, populate the artists information in the yielded SpotifyTracks,
+                defaults to True
+            include_album (bool): populate the album information in the yielded SpotifyTracks, this takes an extra
+                request since the album's tracks don't include it. Defaults to True
+            include_audio_features (bool): if returned, populate the audio features information in the yielded
+                SpotifyTracks using a batched request per page, defaults to True
+
+        Returns: an iterator of SpotifyTrack instances
+        """
+        market = market if market else DEFAULT_MARKET
+        # Every track shares the same SpotifyAlbum instance
+        if include_album:
+            spotify_album = _extract_album_info_from_response(self._make_request(f"{ALBUMS}/{album_id}",
+                                                                                 {"market": market}),
+                                                              identity_map=self._identity_map)
+        else:
+            spotify_album = None
+
+        def extract_tracks(page: list[dict]) -> list[SpotifyTrack]:
+            spotify_tracks = _extract_tracks_batch_from_response(page, include_album=False,
+                                                                 include_artists=include_artists,
+                                                                 identity_map=self._identity_map, trusted=True,
+                                                                 lazy=self._lazy_tracks)
+            for spotify_track in spotify_tracks:
+                spotify_track.album = spotify_album
+            return spotify_tracks
+
+        yield from self._iter_paginated_tracks(f"{ALBUMS}/{album_id}/{TRACKS}",
+                                               {"market": market, "limit": ALBUM_TRACKS_PAGE_SIZE},
+                                               extract_tracks,
+                                               include_audio_features=include_audio_features)
+
+    def iter_playlist_tracks(self,
+                             playlist_id: str,
+                             market: Optional[str] = None,
+                             include_artists: bool = True,
+                             include_album: bool = True,
+                             include_audio_features: bool = True) -> Iterator[SpotifyTrack]:
+        """Lazily iterate over the tracks of a playlist, in the playlist's order. The tracks are requested one page at
+        a time while the next page is prefetched in the background, see iter_search_tracks. Episodes, local files and
+        removed tracks are skipped.
+
+        Args:
+            playlist_id (str): the Spotify ID of the playlist
+            market (Optional[str]): a country code. If a value is specified, only content that is available in the
+                market will be returned.
+            include_artists (bool): if returned, populate the artists information in the yielded SpotifyTracks,
+                defaults to True
+            include_album (bool): if returned, populate the album information in the yielded SpotifyTracks,
+                defaults to True
+            include_audio_features (bool): if returned, populate the audio features information in the yielded
+                SpotifyTracks using a batched request per page, defaults to True
+
+        Returns: an iterator of SpotifyTrack instances
+        """
+        def extract_tracks(page: list[dict]) -> list[SpotifyTrack]:
+            tracks_info = [track_info for playlist_item in page
+                           if (track_info := playlist_item.get("track"))
+                           and track_info.get("type", TRACK) == TRACK and track_info.get("id")]
+
+            return _extract_tracks_batch_from_response(tracks_info, include_album, include_artists,
+                                                       identity_map=self._identity_map, trusted=True,
+                                                       lazy=self._lazy_tracks)
+
+        yield from self._iter_paginated_tracks(f"{PLAYLISTS}/{playlist_id}/{TRACKS}",
+                                               {"market": market if market else DEFAULT_MARKET,
+                                                "limit": PLAYLIST_TRACKS_PAGE_SIZE},
+                                               extract_tracks,
+                                               include_audio_features=include_audio_features)
+
+    def search_tracks(self,
+                      queries: Iterable[str],
+                      market: Optional[str] = None,
+                      include_artists: bool = True,
+                      include_album: bool = True,
+                      include_audio_features: bool = True,
+                      max_workers: Optional[int] = None) -> list[SpotifySearchResult]:
+        """Search for several tracks at once, see search_track. The searches are sent concurrently from a thread pool
+        and, if requested, the audio features of all the matching tracks are populated afterwards using batched
+        requests, see add_audio_features.
+
+        A failed search doesn't abort the rest of them, its error is returned in its result instead.
+
+        Args:
+            queries (Iterable[str]): the names of the tracks to use in the searches
+            market (Optional[str]): a country code. If a value is specified, only content that is available in the
+                market will be returned.
+            include_artists (bool): if returned, populate the artists information in the returned SpotifyTracks,
+                defaults to True
+            include_album (bool): if returned, populate the album information in the returned SpotifyTracks,
+                defaults to True
+            include_audio_features (bool): if returned, populate the audio features information in the returned
+                SpotifyTracks, defaults to True
+            max_workers (Optional[int]): the maximum number of searches in flight at the same time, defaults to the
+                size of the connection pool
+
+        Returns: a list with a SpotifySearchResult for every query, in the same order as queries
+        """
+        def search(query: str) -> SpotifySearchResult:
+            try:
+                return SpotifySearchResult(query, track=self.search_track(query, market, include_artists,
+                                                                          include_album, include_audio_features=False))
+            except SpotifyException as e:
+                logging.warning(f"An error has occurred while searching for {query}. {e}")
+                return SpotifySearchResult(query, error=e)
+
+        with ThreadPoolExecutor(max_workers=max_workers or self._session.pool_size) as executor:
+            results = list(executor.map(search, queries))
+
+        if include_audio_features:
+            if spotify_tracks := [result.track for result in results if result.track]:
+                self.add_audio_features(spotify_tracks)
+
+        return results
+
+    def get_tracks(self,
+                   track_ids: Iterable[str],
+                   market: Optional[str] = None,
+                   include_artists: bool = True,
+                   include_album: bool = True,
+                   include_audio_features: bool = True) -> dict[str, SpotifyTrack]:
+        """Retrieve several tracks by their Spotify IDs, using a single request for every TRACKS_BATCH_SIZE track IDs.
+        If requested, the audio features are populated afterwards using batched requests, see add_audio_features.
+
+        Unknown tracks are left out of the returned mapping. If a request fails, the error is logged and the tracks in
+        that request are left out, but the remaining requests are still made.
+
+        Args:
+            track_ids (Iterable[str]): the Spotify IDs of the tracks, duplicated IDs are only requested once
+            market (Optional[str]): a country code. If a value is specified, only content that is available in the
+                market will be returned.
+            include_artists (bool): if returned, populate the artists information in the returned SpotifyTracks,
+                defaults to True
+            include_album (bool): if returned, populate the album information in the returned SpotifyTracks,
+                defaults to True
+            include_audio_features (bool): if returned, populate the audio features information in the returned
+                SpotifyTracks, defaults to True
+
+        Returns: a dict that maps each track ID to its SpotifyTrack instance, in the same order as track_ids
+        """
+        spotify_tracks = {}
+        for chunk in chunked(dict.fromkeys(track_ids), TRACKS_BATCH_SIZE):
+            query_params = {"ids": ",".join(chunk), "market": market if market else DEFAULT_MARKET}
+            try:
+                result = self._make_request(TRACKS, query_params)
+            except SpotifyException as e:
+                logging.warning(f"An error has occurred while trying to get {len(chunk)} tracks. {e}")
+                continue
+
+            # Spotify returns the tracks in the same order as the IDs, with null for unknown IDs
+            tracks_info_by_track_id = {}
+            for track_id, track_info_from_response in zip(chunk, result.get("tracks") or []):
+                if track_info_from_response:
+                    tracks_info_by_track_id[track_id] = track_info_from_response
+                else:
+                    logging.warning(f"Spotify did not return the {track_id} track.")
+
+            spotify_tracks.update(zip(tracks_info_by_track_id,
+                                      _extract_tracks_batch_from_response(list(tracks_info_by_track_id.values()),
+                                                                          include_album, include_artists,
+                                                                          identity_map=self._identity_map,
+                                                                          trusted=True, lazy=self._lazy_tracks)))
+
+        if include_audio_features and spotify_tracks:
+            self.add_audio_features(spotify_tracks.values())
+
+        return spotify_tracks
+
     def _get_audio_features(self, track: SpotifyTrack) -> Optional[SpotifyAudioFeatures]:
         """Retrieve the audio features for the given track
 
@@ -96,27 +448,212 @@ class SpotifyClient:
 
         Returns: a SpotifyAudioFeatures instance
         """
+        if self._audio_features_loader is not None:
+            # Wait for the audio features to be fetched along with the rest of the current batch
+            return self._audio_features_loader.load(track.track_id).result()
+
+        if self._audio_features_store is not None:
+            if stored_audio_features := self._audio_features_store.get_many([track.track_id]):
+                return stored_audio_features[track.track_id]
+
         path = f"{AUDIO_FEATURES}/{track.track_id}"
         # Make the HTTP request
         try:
-            result = make_http_request(self.base_url, path, self._auth.access_token)
+            result = self._make_request(path)
 
             # Create and return the audio features
-            return SpotifyAudioFeatures(danceability=result.get("danceability"), energy=result.get("energy"),
-                                        loudness=result.get("loudness"), mode=result.get("mode"),
-                                        speechiness=result.get("speechiness"), tempo=result.get("tempo"),
-                                        acousticness=result.get("acousticness"),
-                                        instrumentalness=result.get("instrumentalness"),
-                                        liveness=result.get("liveness"), valence=result.get("valence"))
+            spotify_audio_features = _extract_audio_features_from_response(result)
+            if self._audio_features_store is not None:
+                self._audio_features_store.put_many({track.track_id: spotify_audio_features})
+
+            return spotify_audio_features
         except SpotifyException as e:
             logging.warning(
                 f"An error has occurred while trying to get the audio features for the {track.track_id} track. {e}")
             return None
 
+    def get_audio_features_batch(self, track_ids: Iterable[str]) -> dict[str, SpotifyAudioFeatures]:
+        """Retrieve the audio features for several tracks, using a single request for every AUDIO_FEATURES_BATCH_SIZE
+        track IDs.
+
+        Tracks without audio features are left out of the returned mapping. If a request fails, the error is logged and
+        the tracks in that request are left out, but the remaining requests are still made. If the client has an audio
+        features store, only the tracks that are not stored are requested.
+
+        Args:
+            track_ids (Iterable[str]): the Spotify IDs of the tracks, duplicated IDs are only requested once
+
+        Returns: a dict that maps each track ID to its SpotifyAudioFeatures instance
+        """
+        track_ids = list(dict.fromkeys(track_ids))
+        if self._audio_features_store is not None:
+            audio_features = self._audio_features_store.get_many(track_ids)
+            missing_track_ids = [track_id for track_id in track_ids if track_id not in audio_features]
+        else:
+            audio_features = {}
+            missing_track_ids = track_ids
+
+        fetched_audio_features = {}
+        for chunk in chunked(missing_track_ids, AUDIO_FEATURES_BATCH_SIZE):
+            try:
+                result = self._make_request(AUDIO_FEATURES, {"ids": ",".join(chunk)})
+            except SpotifyException as e:
+                logging.warning(f"An error has occurred while trying to get the audio features for {len(chunk)} "
+                                f"tracks. {e}")
+                continue
+
+            fetched_audio_features.update(_extract_audio_features_batch_from_response(chunk, result, trusted=True))
+
+        if self._audio_features_store is not None and fetched_audio_features:
+            self._audio_features_store.put_many(fetched_audio_features)
+
+        audio_features.update(fetched_audio_features)
+        return {track_id: audio_features[track_id] for track_id in track_ids if track_id in audio_features}
+
+    def add_audio_features(self, tracks: Iterable[SpotifyTrack]) -> int:
+        """Populate the audio features of the given tracks in place, using batched requests. See
+        get_audio_features_batch.
+
+        Args:
+            tracks (Iterable[SpotifyTrack]): the tracks that need their audio features fetched
+
+        Returns: the number of tracks whose audio features were populated
+        """
+        tracks = list(tracks)
+        audio_features = self.get_audio_features_batch(track.track_id for track in tracks)
+
+        enriched = 0
+        for track in tracks:
+            if spotify_audio_features := audio_features.get(track.track_id):
+                track.audio_features = spotify_audio_features
+                enriched += 1
+
+        return enriched
+
+    def _iter_paginated_tracks(self,
+                               path: str,
+                               query_params: dict,
+                               extract_tracks: Callable[[list[dict]], list[SpotifyTrack]],
+                               *,
+
+                               page_key: Optional[str] = None,
+                               max_items: Optional[int] = None,
+                               include_audio_features: bool = True) -> Iterator[SpotifyTrack]:
+        """Iterate over the tracks of a paginated endpoint of the Spotify API, see _iter_pages. The audio features of
+        every page are populated with a single batched request before its tracks are yielded.
+
+        Args:
+            path (str): the path for the request
+            query_params (dict): the query params to be sent, they must include the "limit" of every page
+            extract_tracks (Callable[[list[dict]], list[SpotifyTrack]]): builds the SpotifyTracks of the items of a
+                page, the items it leaves out are skipped
+            -
+            page_key (Optional[str]): the section of the response that holds the paging object, defaults to the whole
+                response
+            max_items (Optional[int]): the maximum number of tracks to yield
+            include_audio_features (bool): populate the audio features of the yielded tracks, defaults to True
+
+        Returns: an iterator of SpotifyTrack instances
+        """
+        yielded = 0
+        for page in self._iter_pages(path, query_params, page_key=page_key, max_items=max_items):
+            spotify_tracks = extract_tracks([item for item in page if item])
+            if max_items is not None:
+                spotify_tracks = spotify_tracks[:max_items - yielded]
+
+            if include_audio_features and spotify_tracks:
+                self.add_audio_features(spotify_tracks)
+
+            yield from spotify_tracks
+            yielded += len(spotify_tracks)
+
+    def _iter_pages(self,
+                    path: str,
+                    query_params: dict,
+                    *,
+
+                    page_key: Optional[str] = None,
+                    max_items: Optional[int] = None) -> Iterator[list]:
+        """Iterate over the pages of a paginated endpoint of the Spotify API, following the offset of every page until
+        there isn't a next one. While a page is being consumed, the next one is requested from a background thread.
+
+        Args:
+            path (str): the path for the request
+            query_params (dict): the query params to be sent, they must include the "limit" of every page
+            -
+            page_key (Optional[str]): the section of the response that holds the paging object, eg: "tracks" for a
+                search. Defaults to the whole response
+            max_items (Optional[int]): stop requesting pages once this number of items has been returned
+
+        Returns: an iterator with the list of items of every page
+
+        Raises:
+            SpotifyInvalidContentError: if the response doesn't include the paging object
+        """
+        def fetch_page(offset: int) -> dict:
+            result = self._make_request(path, {**query_params, "offset": offset})
+            page = result.get(page_key) if page_key else result
+            if page is None:
+                raise SpotifyInvalidContentError("GET", path, f"'{page_key}' is missing in the response.")
+
+            return page
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            offset = 0
+            next_page = executor.submit(fetch_page, offset)
+            while next_page is not None:
+                page = next_page.result()
+                items = page.get("items") or []
+                offset += len(items)
+
+                # Prefetch the next page before handing the current one to the caller
+                if page.get("next") and items and (max_items is None or offset < max_items):
+                    next_page = executor.submit(fetch_page, offset)
+                else:
+                    next_page = None
+
+                yield items
+        finally:
+            # The caller may stop iterating early, a prefetched page that is no longer needed is discarded
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _make_request(self, path: str, query_params: Optional[dict] = None) -> dict:
+        """Make an authorized GET request to the Spotify API through the pooled session, once the rate limiter
+        allows it. Failed attempts are retried according to the client's retry policy, successful responses are
+        cached if the client has a response cache, and identical requests in flight are coalesced
+
+        Args:
+            path (str): the path for the request
+            query_params (Optional[dict]): optional query params to be sent
+
+        Returns: the JSON representation of the API response
+        """
+        if self._response_cache is not None and (cached := self._response_cache.get(path, query_params)) is not None:
+            return cached
+
+        def request() -> dict:
+            result = make_http_request(self.base_url, path, self._auth.access_token, query_params,
+                                       session=self._session, rate_limiter=self._rate_limiter,
+                                       retry_policy=self._retry_policy)
+
+            if self._response_cache is not None:
+                self._response_cache.set(path, query_params, result)
+
+            return result
+
+        if self._single_flight is None:
+            return request()
+
+        return self._single_flight.do(('GET', path, normalize_query_params(query_params)), request)
+
 
 def _extract_track_info_from_response(track_info_from_response: dict,
                                       include_album: bool = True,
-                                      include_artists: bool = True) -> SpotifyTrack:
+                                      include_artists: bool = True,
+                                      *,
+
+                                      identity_map: Optional[IdentityMap] = None) -> SpotifyTrack:
     """Extract the track information from the Spotify's API response.
 
     Args:
@@ -125,28 +662,20 @@ def _extract_track_info_from_response(track_info_from_response: dict,
                 defaults to True
         include_artists (bool): if returned, populate the album information in the returned SpotifyTrack,
                 defaults to True
+        -
+        identity_map (Optional[IdentityMap]): if provided, the album and artists are interned in it
 
     Returns: a SpotifyTrack instance
     """
     # If album needs to be included, check if it exists in the response and get the info
     if include_album and (album_info := track_info_from_response.get("album")):
-        if ((release_date := album_info.get("release_date"))
-                and (release_precision := album_info.get("release_date_precision"))):
-            album_release_date = SpotifyAlbumReleaseDate(released_on=release_date, precision=release_precision)
-        else:
-            album_release_date = None
-
-        spotify_album = SpotifyAlbum(album_info.get("name"), album_info.get("id"),
-                                     album_type=album_info.get("type"), release_date=album_release_date,
-                                     total_tracks=album_info.get("total_tracks"))
+        spotify_album = _extract_album_info_from_response(album_info, identity_map=identity_map)
     else:
         spotify_album = None
 
     # If artists need to be included, check if they exist in the response and get the info
     if include_artists and (artists_info := track_info_from_response.get("artists")):
-        spotify_artists = []
-        for artist in artists_info:
-            spotify_artists.append(SpotifyArtist(artist.get("name"), artist.get("id")))
+        spotify_artists = _extract_artists_info_from_response(artists_info, identity_map=identity_map)
     else:
         spotify_artists = None
 
@@ -160,3 +689,405 @@ def _extract_track_info_from_response(track_info_from_response: dict,
 
     return spotify_track
 
+
+def _extract_artists_info_from_response(artists_info_from_response: list[dict],
+                                        *,
+
+                                        identity_map: Optional[IdentityMap] = None) -> list[SpotifyArtist]:
+    """Extract the artists information from the Spotify's API response.
+
+    Args:
+        artists_info_from_response (list[dict]): the response section that includes the artists information
+        -
+        identity_map (Optional[IdentityMap]): if provided, the artists are interned in it
+
+    Returns: a list of SpotifyArtist instances
+    """
+    spotify_artists = [SpotifyArtist(artist.get("name"), artist.get("id")) for artist in artists_info_from_response]
+    if identity_map is not None:
+        return [identity_map.artist(spotify_artist) for spotify_artist in spotify_artists]
+
+    return spotify_artists
+
+
+def _extract_album_info_from_response(album_info_from_response: dict,
+                                      *,
+
+                                      identity_map: Optional[IdentityMap] = None) -> SpotifyAlbum:
+    """Extract the album information from the Spotify's API response.
+
+    Args:
+        album_info_from_response (dict): the response section that includes the album information
+        -
+        identity_map (Optional[IdentityMap]): if provided, the album is interned in it
+
+    Returns: a SpotifyAlbum instance
+    """
+    if ((release_date := album_info_from_response.get("release_date"))
+            and (release_precision := album_info_from_response.get("release_date_precision"))):
+        album_release_date = SpotifyAlbumReleaseDate(released_on=release_date, precision=release_precision)
+    else:
+        album_release_date = None
+
+    spotify_album = SpotifyAlbum(album_info_from_response.get("name"), album_info_from_response.get("id"),
+                                 album_type=album_info_from_response.get("type"), release_date=album_release_date,
+                                 total_tracks=album_info_from_response.get("total_tracks"))
+
+    return identity_map.album(spotify_album) if identity_map is not None else spotify_album
+
+
+def _extract_tracks_batch_from_response(tracks_info_from_response: list[dict],
+                                        include_album: bool = True,
+                                        include_artists: bool = True,
+                                        *,
+
+                                        identity_map: Optional[IdentityMap] = None,
+                                        trusted: bool = False,
+                                        lazy: bool = False) -> list[SpotifyTrack]:
+    """Extract the tracks of a page of the Spotify's API response in a single pass, see
+    _extract_track_info_from_response.
+
+    In trusted mode, the popularity and album type columns of the whole page are validated at once and the models are
+    built without running their constructors, which would validate every track again. If a column has an invalid value,
+    the page is extracted track by track instead, so the same error is raised for the same track.
+
+    Args:
+        tracks_info_from_response (list[dict]): the response sections that include the information of every track
+        include_album (bool): if returned, populate the album information in the returned SpotifyTracks,
+                defaults to True
+        include_artists (bool): if returned, populate the artists information in the returned SpotifyTracks,
+                defaults to True
+        -
+        identity_map (Optional[IdentityMap]): if provided, the albums and artists are interned in it
+        trusted (bool): validate the page by columns instead of track by track, defaults to False
+        lazy (bool): return LazySpotifyTracks, which build their album and artists when they are first accessed.
+            Defaults to False
+
+    Returns: a list of SpotifyTrack instances, in the same order as tracks_info_from_response
+    """
+    if lazy:
+        # A valid page skips the per track validation, an invalid one raises the same error for the same track
+        validate = not trusted or not _is_tracks_batch_valid(tracks_info_from_response, include_album)
+        return [LazySpotifyTrack(track_info, include_album, include_artists, identity_map=identity_map,
+                                 validate=validate)
+                for track_info in tracks_info_from_response]
+
+    if not trusted or not _is_tracks_batch_valid(tracks_info_from_response, include_album):
+        return [_extract_track_info_from_response(track_info, include_album, include_artists, identity_map=identity_map)
+                for track_info in tracks_info_from_response]
+
+    spotify_tracks = []
+    for track_info in tracks_info_from_response:
+        if include_album and (album_info := track_info.get("album")):
+            if ((release_date := album_info.get("release_date"))
+                    and (release_precision := album_info.get("release_date_precision"))):
+                album_release_date = SpotifyAlbumReleaseDate(release_date, release_precision)
+            else:
+                album_release_date = None
+
+            spotify_album = SpotifyAlbum._unchecked(album_info.get("name"), album_info.get("id"),
+                                                    album_info.get("type"), album_info.get("total_tracks"),
+                                                    album_release_date)
+            if identity_map is not None:
+                spotify_album = identity_map.album(spotify_album)
+        else:
+            spotify_album = None
+
+        if include_artists and (artists_info := track_info.get("artists")):
+            spotify_artists = [SpotifyArtist._unchecked(artist.get("name"), artist.get("id"))
+                               for artist in artists_info]
+            if identity_map is not None:
+                spotify_artists = [identity_map.artist(spotify_artist) for spotify_artist in spotify_artists]
+        else:
+            spotify_artists = None
+
+        spotify_tracks.append(SpotifyTrack._unchecked(track_info.get("name"), track_info.get("id"),
+                                                      track_info.get("popularity"), track_info.get("duration_ms"),
+                                                      track_info.get("explicit"), spotify_album, spotify_artists))
+
+    logging.info(f"Finished extracting track data for {len(spotify_tracks)} tracks")
+    return spotify_tracks
+
+
+def _is_tracks_batch_valid(tracks_info_from_response: list[dict], include_album: bool) -> bool:
+    """Validate the popularity and, if the albums are included, the album type columns of a page of tracks
+
+    Args:
+        tracks_info_from_response (list[dict]): the response sections that include the information of every track
+        include_album (bool): validate the album types too
+
+    Returns: True if every value is valid, else False
+    """
+    if not _is_column_in_range([track_info.get("popularity") for track_info in tracks_info_from_response], 0, 100):
+        return False
+
+    if include_album:
+        album_types = {album_info.get("type") for track_info in tracks_info_from_response
+                       if (album_info := track_info.get("album"))}
+        album_types.discard(None)
+        return album_types.issubset(ALLOWED_ALBUM_TYPES)
+
+    return True
+
+
+def _is_column_in_range(column: Iterable, low: float, high: float) -> bool:
+    """Check every value of a column is between low and high, None values are skipped
+
+    Args:
+        column (Iterable): the values of the column
+        low (float): the minimum valid value
+        high (float): the maximum valid value
+
+    Returns: True if every value is in range, else False
+    """
+    values = [value for value in column if value is not None]
+    return not values or (low <= min(values) and max(values) <= high)
+
+
+class LazySpotifyTrack(SpotifyTrack):
+    """A SpotifyTrack that keeps the response section it was extracted from and only builds its album and artists the
+    first time they are accessed, so reading the name, ID or audio features of many tracks doesn't pay for them.
+
+    It behaves like the SpotifyTrack returned by _extract_track_info_from_response: the popularity and album type, the
+    only values the track, album and artist constructors validate, are still validated when it is created, and it is
+    pickled with its album and artists already built. A malformed album or artists section (eg: one that is not an
+    object) is only detected when it is first accessed, and raises on every access since nothing is built. Reading the
+    album or artists from several threads at once is safe, they are only built once.
+    """
+
+    __slots__ = ("_album_info", "_artists_info", "_identity_map")
+
+    def __init__(self,
+                 track_info_from_response: dict,
+                 include_album: bool = True,
+                 include_artists: bool = True,
+                 *,
+
+                 identity_map: Optional[IdentityMap] = None,
+                 validate: bool = True):
+        """Create a LazySpotifyTrack instance
+
+        Args:
+            track_info_from_response (dict): the response section that includes the track information
+            include_album (bool): if returned, populate the album information of the track, defaults to True
+            include_artists (bool): if returned, populate the artists information of the track, defaults to True
+            -
+            identity_map (Optional[IdentityMap]): if provided, the album and artists are interned in it when they
+                are built
+            validate (bool): validate the popularity and album type, they can be skipped if the whole page was
+                already validated, see _extract_tracks_batch_from_response. Defaults to True
+        """
+        popularity = track_info_from_response.get("popularity")
+        album_info = track_info_from_response.get("album") if include_album else None
+        if validate:
+            if popularity is not None and not (0 <= popularity <= 100):
+                raise ValueError("The popularity of the artist should be between 0 and 100.")
+
+            if album_info and (album_type := album_info.get("type")) is not None \
+                    and album_type not in ALLOWED_ALBUM_TYPES:
+                raise ValueError(f"{album_type} is not a valid album type.")
+
+        # The slots are set directly, the album and artists setters would take the lock just to store None
+        self.name = track_info_from_response.get("name")
+        self.track_id = track_info_from_response.get("id")
+        self.popularity = popularity
+        self.duration = track_info_from_response.get("duration_ms")
+        self._explicit = track_info_from_response.get("explicit")
+        self.audio_features = None
+        _TRACK_ALBUM.__set__(self, None)
+        _TRACK_ARTISTS.__set__(self, None)
+
+        self._album_info = album_info or None
+        self._artists_info = (track_info_from_response.get("artists") or None) if include_artists else None
+        self._identity_map = identity_map
+
+    @classmethod
+    def from_dict(cls, data: dict) -> SpotifyTrack:
+        """Create a SpotifyTrack from its plain dict representation, see SpotifyTrack.from_dict. The dict doesn't
+        include a response section, so an eager SpotifyTrack is returned
+
+        Args:
+            data (dict): the plain dict representation of the track
+
+        Returns: a SpotifyTrack instance
+        """
+        return SpotifyTrack.from_dict(data)
+
+    @property
+    def album(self) -> Optional[SpotifyAlbum]:
+        """Property method for album, it is built from the response on the first access
+
+        Returns: the album associated to the track
+        """
+        if self._album_info is not None:
+            with _LAZY_TRACKS_LOCK:
+                # Another thread may have built the album while this one was waiting for the lock
+                if self._album_info is not None:
+                    _TRACK_ALBUM.__set__(self, _extract_album_info_from_response(self._album_info,
+                                                                                 identity_map=self._identity_map))
+                    self._album_info = None
+
+        return _TRACK_ALBUM.__get__(self)
+
+    @album.setter
+    def album(self, album: Optional[SpotifyAlbum]) -> None:
+        with _LAZY_TRACKS_LOCK:
+            self._album_info = None
+            _TRACK_ALBUM.__set__(self, album)
+
+    @property
+    def artists(self) -> Optional[list[SpotifyArtist]]:
+        """Property method for artists, they are built from the response on the first access
+
+        Returns: the artists associated to the track
+        """
+        if self._artists_info is not None:
+            with _LAZY_TRACKS_LOCK:
+                if self._artists_info is not None:
+                    _TRACK_ARTISTS.__set__(self, _extract_artists_info_from_response(self._artists_info,
+                                                                                     identity_map=self._identity_map))
+                    self._artists_info = None
+
+        return _TRACK_ARTISTS.__get__(self)
+
+    @artists.setter
+    def artists(self, artists: Optional[list[SpotifyArtist]]) -> None:
+        with _LAZY_TRACKS_LOCK:
+            self._artists_info = None
+            _TRACK_ARTISTS.__set__(self, artists)
+
+    def __getstate__(self):
+        # Reading the slots builds the album and artists, the response and the identity map are not pickled
+        _, state = super().__getstate__()
+        state.update(_album_info=None, _artists_info=None, _identity_map=None)
+        return None, state
+
+
+# The slots of SpotifyTrack that store the album and artists, LazySpotifyTrack shadows them with properties
+_TRACK_ALBUM = SpotifyTrack.album
+_TRACK_ARTISTS = SpotifyTrack.artists
+# Guards the first access to the album and artists of every LazySpotifyTrack, a lock per track would double its size
+_LAZY_TRACKS_LOCK = threading.Lock()
+
+
+def _extract_audio_features_from_response(audio_features_from_response: dict) -> SpotifyAudioFeatures:
+    """Extract the audio features from the Spotify's API response.
+
+    Args:
+        audio_features_from_response (dict): the response section that includes the audio features of a track
+
+    Returns: a SpotifyAudioFeatures instance
+    """
+    return SpotifyAudioFeatures(danceability=audio_features_from_response.get("danceability"),
+                                energy=audio_features_from_response.get("energy"),
+                                loudness=audio_features_from_response.get("loudness"),
+                                mode=audio_features_from_response.get("mode"),
+                                speechiness=audio_features_from_response.get("speechiness"),
+                                tempo=audio_features_from_response.get("tempo"),
+                                acousticness=audio_features_from_response.get("acousticness"),
+                                instrumentalness=audio_features_from_response.get("instrumentalness"),
+                                liveness=audio_features_from_response.get("liveness"),
+                                valence=audio_features_from_response.get("valence"))
+
+
+def _build_search_query_params(query: str, market: Optional[str] = None, limit: int = 1) -> dict:
+    """Build the query params for a track search, by default it only returns the top match
+
+    Args:
+        query (str): the name of the track to use in the search
+        market (Optional[str]): a country code, defaults to DEFAULT_MARKET
+        limit (int): the number of tracks per page of results, defaults to 1
+
+    Returns: a dict with the query params
+    """
+    return {
+        "type": TRACK,
+        "market": market if market else DEFAULT_MARKET,
+        "limit": limit,
+        "q": query
+    }
+
+
+def _extract_track_from_search_response(result: dict,
+                                        query: str,
+                                        include_album: bool = True,
+                                        include_artists: bool = True,
+                                        *,
+
+                                        identity_map: Optional[IdentityMap] = None) -> Optional[SpotifyTrack]:
+    """Extract the top matching track from the Spotify's search response.
+
+    Args:
+        result (dict): the JSON representation of the search response
+        query (str): the query used in the search
+        include_album (bool): if returned, populate the album information in the returned SpotifyTrack,
+                defaults to True
+        include_artists (bool): if returned, populate the artists information in the returned SpotifyTrack,
+                defaults to True
+        -
+        identity_map (Optional[IdentityMap]): if provided, the album and artists are interned in it
+
+    Returns: if a matching track was found, a SpotifyTrack instance is returned, else None
+
+    Raises:
+        SpotifyInvalidContentError: if the response doesn't include the "tracks" section
+    """
+    if "tracks" not in result:  # Return an error if "tracks" is not in the response
+        raise SpotifyInvalidContentError("GET", SEARCH, "'tracks' is missing in the response.")
+
+    tracks_section = result.get("tracks")
+    if not tracks_section.get("items"):  # Empty items means no matching track was found
+        logging.error(f"Could not find any matching track with the given query: {query}")
+        return None
+
+    # Extract the track info from the response
+    track_info_from_response = tracks_section.get("items")[0]
+    logging.info('Matching track found, extracting the the information from the response...')
+    return _extract_track_info_from_response(track_info_from_response, include_album, include_artists,
+                                             identity_map=identity_map)
+
+
+def _extract_audio_features_batch_from_response(track_ids: list[str],
+                                                result: dict,
+                                                *,
+
+                                                trusted: bool = False) -> dict[str, SpotifyAudioFeatures]:
+    """Extract the audio features from the response of Spotify's several audio features endpoint. Tracks whose audio
+    features are missing or invalid are logged and left out.
+
+    In trusted mode, every audio feature of the whole response is validated as a column and the models are built
+    without running their constructors. If a column has an invalid value, the audio features are extracted one by one
+    instead, so only the invalid ones are left out.
+
+    Args:
+        track_ids (list[str]): the track IDs sent in the request
+        result (dict): the JSON representation of the response
+        -
+        trusted (bool): validate the response by columns instead of track by track, defaults to False
+
+    Returns: a dict that maps each track ID to its SpotifyAudioFeatures instance
+    """
+    features_info_by_track_id = {}
+    # Spotify returns the audio features in the same order as the IDs, with null for unknown IDs
+    for track_id, features_info in zip(track_ids, result.get("audio_features") or []):
+        if features_info:
+            features_info_by_track_id[track_id] = features_info
+        else:
+            logging.warning(f"Spotify did not return the audio features for the {track_id} track.")
+
+    if trusted:
+        rows = {track_id: tuple(map(features_info.get, AUDIO_FEATURES_FIELDS))
+                for track_id, features_info in features_info_by_track_id.items()}
+        columns = list(zip(*rows.values()))
+        if not columns or (all(_is_column_in_range(columns[i], 0.0, 1.0) for i in _UNIT_AUDIO_FEATURES)
+                           and set(columns[_MODE_AUDIO_FEATURE]).issubset((None, 0, 1))):
+            return {track_id: SpotifyAudioFeatures._unchecked(values) for track_id, values in rows.items()}
+
+    audio_features = {}
+    for track_id, features_info in features_info_by_track_id.items():
+        try:
+            audio_features[track_id] = _extract_audio_features_from_response(features_info)
+        except ValueError as e:
+            logging.warning(f"Invalid audio features were returned for the {track_id} track. {e}")
+
+    return audio_features
@@ -0,0 +1,211 @@
+from typing import Optional
+
+import numpy as np
+
+# The maximum number of distances computed at once, this bounds the memory used when assigning many vectors
+_DISTANCES_BLOCK_SIZE: int = 4 * 1024 * 1024
+
+
+class MiniBatchKMeans:
+    """Groups normalized audio feature vectors (see similarity_index.feature_vectors) into clusters with mini-batch
+    k-means (Sculley, 2010): every iteration moves the centroids towards a small random batch of vectors, so the memory
+    used doesn't depend on the size of the library and new tracks can be added as they arrive with partial_fit.
+
+    Usage:
+        kmeans = MiniBatchKMeans(n_clusters=8).fit(feature_vectors(frame.dropna()))
+        clusters = kmeans.predict(feature_vectors(new_frame.dropna()))
+    """
+
+    def __init__(self,
+                 n_clusters: int,
+                 *,
+
+                 batch_size: int = 1024,
+                 max_iterations: int = 100,
+                 tolerance: float = 1e-6,
+                 seed: Optional[int] = None):
+        """Create a MiniBatchKMeans instance
+
+        Args:
+            n_clusters (int): the number of clusters
+            -
+            batch_size (int): the number of vectors in every mini-batch, defaults to 1024
+            max_iterations (int): the maximum number of mini-batches used by fit, defaults to 100
+            tolerance (float): fit stops early once the centroids move less than this, measured as the mean squared
+                distance moved by the centroids in the last iteration. Defaults to 1e-6
+            seed (Optional[int]): the seed used to pick the initial centroids and the mini-batches, for reproducible
+                results
+        """
+        if n_clusters < 1:
+            raise ValueError("The number of clusters should be at least 1.")
+
+        if batch_size < 1 or max_iterations < 1:
+            raise ValueError("The batch size and the maximum number of iterations should be at least 1.")
+
+        self.n_clusters = n_clusters
+        self.batch_size = batch_size
+        self.max_iterations = max_iterations
+        self.tolerance = tolerance
+
+        self._random = np.random.default_rng(seed)
+        self.centroids: Optional[np.ndarray] = None
+        # The number of vectors every centroid has been moved towards, it makes the centroids settle over time
+        self.counts: Optional[np.ndarray] = None
+
+    @property
+    def is_fitted(self) -> bool:
+        """Property method for is_fitted.
+
+        Returns: True if the centroids have been initialized, else False
+        """
+        return self.centroids is not None
+
+    def fit(self, vectors: np.ndarray) -> "MiniBatchKMeans":
+        """Fit the centroids to the vectors, using up to max_iterations random mini-batches. The vectors can be a
+        memory-mapped array larger than the available memory, only a mini-batch is read at a time.
+
+        Args:
+            vectors (np.ndarray): a matrix with a row per vector
+
+        Returns: the MiniBatchKMeans instance
+        """
+        if len(vectors) < self.n_clusters:
+            raise ValueError(f"At least {self.n_clusters} vectors are needed to fit {self.n_clusters} clusters.")
+
+        batch_size = min(self.batch_size, len(vectors))
+        for _ in range(self.max_iterations):
+            # Sorted indices read memory-mapped arrays sequentially
+            batch = vectors[np.sort(self._random.choice(len(vectors), batch_size, replace=False))]
+            previous_centroids = self.centroids.copy() if self.centroids is not None else None
+            self.partial_fit(batch)
+
+            if previous_centroids is not None and \
+                    np.mean(np.sum(np.square(self.centroids - previous_centroids), axis=1)) < self.tolerance:
+                break
+
+        return self
+
+    def partial_fit(self, vectors: np.ndarray) -> "MiniBatchKMeans":
+        """Move the centroids towards a mini-batch of vectors, eg: the tracks that have just been fetched. The first
+        mini-batch initializes the centroids with k-means++, so it needs at least n_clusters vectors.
+
+        Args:
+            vectors (np.ndarray): a matrix with a row per vector
+
+        Returns: the MiniBatchKMeans instance
+        """
+        vectors = np.asarray(vectors, dtype=np.float64)
+        if self.centroids is None:
+            if len(vectors) < self.n_clusters:
+                raise ValueError(f"At least {self.n_clusters} vectors are needed to initialize {self.n_clusters} "
+                                 f"clusters.")
+
+            self.centroids = _kmeans_plus_plus(vectors, self.n_clusters, self._random)
+            self.counts = np.zeros(self.n_clusters, dtype=np.int64)
+
+        if len(vectors) == 0:
+            return self
+
+        labels = closest_centroids(vectors, self.centroids)
+        batch_counts = np.bincount(labels, minlength=self.n_clusters)
+        batch_sums = np.column_stack([np.bincount(labels, weights=vectors[:, j], minlength=self.n_clusters)
+                                      for j in range(vectors.shape[1])])
+
+        # Every centroid moves towards each of its vectors with a learning rate of 1 / count, which makes it the mean
+        # of every vector it has been assigned so far
+        self.counts += batch_counts
+        moved = batch_counts > 0
+        self.centroids[moved] += (batch_sums[moved] - batch_counts[moved, None] * self.centroids[moved]) \
+            / self.counts[moved, None]
+
+        return self
+
+    def predict(self, vectors: np.ndarray) -> np.ndarray:
+        """Assign every vector to its closest cluster, the vectors are processed in blocks to bound the memory used
+
+        Args:
+            vectors (np.ndarray): a matrix with a row per vector
+
+        Returns: the cluster of every vector
+        """
+        if self.centroids is None:
+            raise ValueError("The clusters have not been fitted yet.")
+
+        return closest_centroids(np.asarray(vectors, dtype=np.float64), self.centroids)
+
+    def inertia(self, vectors: np.ndarray) -> float:
+        """Compute the sum of the squared distances between every vector and its closest centroid, lower is better
+
+        Args:
+            vectors (np.ndarray): a matrix with a row per vector
+
+        Returns: the inertia of the vectors
+        """
+        vectors = np.asarray(vectors, dtype=np.float64)
+        labels = self.predict(vectors)
+        return float(np.sum(np.square(vectors - self.centroids[labels])))
+
+
+def squared_distances(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Compute the squared euclidean distance between every vector and every centroid
+
+    Args:
+        vectors (np.ndarray): a matrix with a row per vector
+        centroids (np.ndarray): a matrix with a row per centroid
+
+    Returns: a matrix with a row per vector and a column per centroid
+    """
+    return (np.einsum("ij,ij->i", vectors, vectors)[:, None] - 2 * vectors @ centroids.T
+            + np.einsum("ij,ij->i", centroids, centroids))
+
+
+def closest_centroids(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Find the closest centroid of every vector, computing the distances in blocks to bound the memory used
+
+    Args:
+        vectors (np.ndarray): a matrix with a row per vector
+        centroids (np.ndarray): a matrix with a row per centroid
+
+    Returns: the index of the closest centroid of every vector
+    """
+    block_size = max(1, _DISTANCES_BLOCK_SIZE // len(centroids))
+    closest = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), block_size):
+        closest[start:start + block_size] = np.argmin(squared_distances(vectors[start:start + block_size], centroids),
+                                                      axis=1)
+
+    return closest
+
+
+def _kmeans_plus_plus(vectors: np.ndarray, k: int, random: np.random.Generator) -> np.ndarray:
+    """Pick k initial centroids out of the vectors with greedy k-means++: candidates are drawn with a probability
+    proportional to their squared distance to the closest centroid already picked, and the candidate that reduces the
+    inertia the most becomes the next centroid
+
+    Args:
+        vectors (np.ndarray): a matrix with a row per vector
+        k (int): the number of centroids
+        random (np.random.Generator): the random generator
+
+    Returns: a matrix with a row per centroid
+    """
+    n_candidates = 2 + int(np.log(k))
+    centroids = np.empty((k, vectors.shape[1]), dtype=np.float64)
+    centroids[0] = vectors[random.integers(len(vectors))]
+    closest_distances = np.sum(np.square(vectors - centroids[0]), axis=1)
+
+    for i in range(1, k):
+        total = closest_distances.sum()
+        if total > 0:
+            candidates = random.choice(len(vectors), n_candidates, p=closest_distances / total)
+        else:  # Every vector is already a centroid, the rest of the centroids are picked uniformly
+            candidates = random.integers(len(vectors), size=1)
+
+        # The rounding errors of squared_distances may give tiny negative distances
+        candidate_distances = np.minimum(closest_distances,
+                                         np.maximum(squared_distances(vectors[candidates], vectors), 0.0))
+        best = np.argmin(candidate_distances.sum(axis=1))
+        centroids[i] = vectors[candidates[best]]
+        closest_distances = candidate_distances[best]
+
+    return centroids
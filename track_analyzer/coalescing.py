@@ -0,0 +1,92 @@
+import threading
+from typing import Any, Callable, Hashable, NamedTuple, Optional
+
+
+class CoalescingStats(NamedTuple):
+    """Represents a snapshot of the counters of a SingleFlight group
+
+    The CoalescingStats consists of:
+    * calls (int): the number of calls made to the group
+    * executions (int): the number of calls that were actually executed
+    * coalesced (int): the number of calls that waited for an identical call in flight and shared its result
+    """
+    calls: int
+    executions: int
+    coalesced: int
+
+
+class _Call:
+    """Represents a call in flight, whose result is shared with every identical call made while it runs
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesces identical calls in flight: while a call with a given key runs, any other call with the same key waits
+    for it and gets its result (or its exception) instead of running again.
+
+    Usage:
+        single_flight = SingleFlight()
+        result = single_flight.do(("GET", "search", params), lambda: make_http_request(...))
+    """
+
+    def __init__(self):
+        """Create a SingleFlight instance
+        """
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._calls_count = 0
+        self._executions = 0
+        self._coalesced = 0
+
+    @property
+    def stats(self) -> CoalescingStats:
+        """Property method for stats.
+
+        Returns: a CoalescingStats with the current counters of the group
+        """
+        with self._lock:
+            return CoalescingStats(self._calls_count, self._executions, self._coalesced)
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run fn, unless an identical call is already in flight, in which case wait for it and share its result
+
+        Args:
+            key (Hashable): the key that identifies identical calls
+            fn (Callable[[], Any]): the call to run
+
+        Returns: the value returned by fn, or by the identical call in flight
+
+        Raises:
+            Exception: the exception raised by fn, or by the identical call in flight
+        """
+        with self._lock:
+            self._calls_count += 1
+            if (call := self._calls.get(key)) is not None:
+                self._coalesced += 1
+                is_leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self._executions += 1
+                is_leader = True
+
+        if is_leader:
+            try:
+                call.result = fn()
+            except BaseException as e:
+                call.error = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+        else:
+            call.done.wait()
+
+        if call.error is not None:
+            raise call.error
+
+        return call.result
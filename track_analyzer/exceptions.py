@@ -42,8 +42,13 @@ class SpotifyLimitExceededError(SpotifyException):
     """Exception raised for Spotify's rate limit exceeded error
     """
 
-    def __init__(self):
-        super().__init__(f"The app has exceeded its rate limits. Try again later.")
+    def __init__(self, retry_after: Optional[float] = None):
+        self.retry_after = retry_after
+
+        exception_message = "The app has exceeded its rate limits. Try again later." \
+            if retry_after is None \
+            else f"The app has exceeded its rate limits. Try again in {retry_after} seconds."
+        super().__init__(exception_message)
 
 
 class SpotifyUnknownStatusError(SpotifyException):
@@ -0,0 +1,103 @@
+import threading
+import weakref
+from typing import TypeVar, Union
+
+from .spotify_album import SpotifyAlbum
+from .spotify_artist import SpotifyArtist
+
+_Entity = TypeVar("_Entity", SpotifyAlbum, SpotifyArtist)
+
+
+class IdentityMap:
+    """Interns the artists and albums extracted from the responses of the Spotify API, so every track of an artist or
+    an album shares the same instance and enriching it (eg: with its genres or followers) updates every track at once.
+
+    The map only holds weak references, an artist or album is dropped from it once no track references it. An
+    IdentityMap can be shared by several clients.
+
+    Usage:
+        identity_map = IdentityMap()
+        spotify_client = SpotifyClient(client_id, client_secret, identity_map=identity_map)
+    """
+
+    def __init__(self):
+        """Create an IdentityMap instance
+        """
+        self._lock = threading.Lock()
+        self._artists: weakref.WeakValueDictionary[str, SpotifyArtist] = weakref.WeakValueDictionary()
+        self._albums: weakref.WeakValueDictionary[str, SpotifyAlbum] = weakref.WeakValueDictionary()
+
+    def __len__(self) -> int:
+        """Returns the number of artists and albums currently interned
+        """
+        return len(self._artists) + len(self._albums)
+
+    def artist(self, artist: SpotifyArtist) -> SpotifyArtist:
+        """Get the interned instance of an artist, see intern
+
+        Args:
+            artist (SpotifyArtist): the artist to intern
+
+        Returns: the SpotifyArtist instance shared by every track of the artist
+        """
+        return self._intern(self._artists, artist.artist_id, artist)
+
+    def album(self, album: SpotifyAlbum) -> SpotifyAlbum:
+        """Get the interned instance of an album, see intern
+
+        Args:
+            album (SpotifyAlbum): the album to intern
+
+        Returns: the SpotifyAlbum instance shared by every track of the album
+        """
+        return self._intern(self._albums, album.album_id, album)
+
+    def intern(self, entity: Union[SpotifyArtist, SpotifyAlbum]) -> Union[SpotifyArtist, SpotifyAlbum]:
+        """Get the instance already interned with the same ID as the given artist or album. The information missing in
+        the interned instance is filled with the given one. If there isn't an interned instance, the given one is
+        interned and returned. Entities without an ID are never interned.
+
+        Args:
+            entity (Union[SpotifyArtist, SpotifyAlbum]): the artist or album to intern
+
+        Returns: the interned instance
+        """
+        if isinstance(entity, SpotifyArtist):
+            return self.artist(entity)
+
+        return self.album(entity)
+
+    def clear(self) -> None:
+        """Forget every interned artist and album, the instances already in use are not changed
+        """
+        with self._lock:
+            self._artists.clear()
+            self._albums.clear()
+
+    def _intern(self,
+                entities: "weakref.WeakValueDictionary[str, _Entity]",
+                entity_id: str,
+                entity: _Entity) -> _Entity:
+        """Intern an entity in the given mapping, merging it into the interned instance if there is one
+
+        Args:
+            entities (weakref.WeakValueDictionary[str, _Entity]): the interned entities of the same type, by ID
+            entity_id (str): the Spotify ID of the entity
+            entity (_Entity): the entity to intern
+
+        Returns: the interned instance
+        """
+        if not entity_id:
+            return entity
+
+        with self._lock:
+            if (interned := entities.get(entity_id)) is None:
+                entities[entity_id] = entity
+                return entity
+
+            if interned is not entity:
+                for field in type(entity).__slots__:
+                    if field != "__weakref__" and getattr(interned, field) is None:
+                        setattr(interned, field, getattr(entity, field))
+
+            return interned
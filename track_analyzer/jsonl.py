@@ -0,0 +1,163 @@
+import gzip
+import json
+from typing import BinaryIO, Callable, Iterable, Iterator, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional dependency, the standard json module is used without it
+    orjson = None
+
+from .spotify_track import SpotifyTrack
+
+# The JSON libraries supported by the JSONL writer and reader, orjson is used by default when it is installed
+JSON_BACKENDS: tuple[str, ...] = ("orjson", "json")
+DEFAULT_JSON_BACKEND: str = "orjson" if orjson is not None else "json"
+# The number of lines serialized before they are written to the file at once
+_WRITE_BATCH_SIZE: int = 1000
+
+
+def _json_functions(backend: str) -> tuple[Callable[[dict], bytes], Callable[[bytes], dict]]:
+    """Get the functions that serialize a dict into a JSON line and parse it back with the given JSON library
+
+    Args:
+        backend (str): the JSON library, see JSON_BACKENDS
+
+    Returns: a tuple with the serializing and the parsing functions
+    """
+    if backend == "orjson":
+        if orjson is None:
+            raise ImportError("The orjson backend requires orjson, install it with: pip install orjson")
+
+        return lambda data: orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE), orjson.loads
+
+    if backend == "json":
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+        return lambda data: f"{encoder.encode(data)}\n".encode(), json.loads
+
+    raise ValueError(f"{backend} is not a valid JSON backend.")
+
+
+def _open(file: Union[str, BinaryIO], mode: str) -> BinaryIO:
+    """Open a file in binary mode, compressed with gzip if its name ends with .gz
+
+    Args:
+        file (Union[str, BinaryIO]): the path of the file, or a file already opened in binary mode
+        mode (str): "rb" or "wb"
+
+    Returns: the binary file
+    """
+    if not isinstance(file, str):
+        return file
+
+    return gzip.open(file, mode) if file.endswith(".gz") else open(file, mode)
+
+
+class JSONLWriter:
+    """Writes tracks as JSON lines (one JSON object per track, see SpotifyTrack.to_dict) to a file, one batch of lines
+    at a time, so any number of tracks can be written in constant memory.
+
+    Usage:
+        with JSONLWriter("library.jsonl.gz") as writer:
+            writer.write_many(spotify_client.iter_playlist_tracks(playlist_id))
+    """
+
+    def __init__(self, file: Union[str, BinaryIO], *, backend: str = DEFAULT_JSON_BACKEND):
+        """Create a JSONLWriter instance
+
+        Args:
+            file (Union[str, BinaryIO]): the path of the file, it is compressed with gzip if it ends with .gz. A file
+                already opened in binary mode can be provided instead, it is not closed by the writer
+            -
+            backend (str): the JSON library used, see JSON_BACKENDS. Defaults to DEFAULT_JSON_BACKEND
+        """
+        self._dumps, _ = _json_functions(backend)
+        self._file = _open(file, "wb")
+        self._owns_file = isinstance(file, str)
+        self.count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def write(self, track: SpotifyTrack) -> None:
+        """Write a track
+
+        Args:
+            track (SpotifyTrack): the track to write
+        """
+        self._file.write(self._dumps(track.to_dict()))
+        self.count += 1
+
+    def write_many(self, tracks: Iterable[SpotifyTrack]) -> int:
+        """Write several tracks, the tracks are consumed lazily
+
+        Args:
+            tracks (Iterable[SpotifyTrack]): the tracks to write
+
+        Returns: the number of tracks written
+        """
+        written = 0
+        lines = []
+        for track in tracks:
+            lines.append(self._dumps(track.to_dict()))
+            if len(lines) == _WRITE_BATCH_SIZE:
+                self._file.write(b"".join(lines))
+                written += len(lines)
+                lines.clear()
+
+        self._file.write(b"".join(lines))
+        written += len(lines)
+        self.count += written
+        return written
+
+    def close(self) -> None:
+        """Flush the written tracks and close the file, unless it was opened by the caller
+        """
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+
+def write_jsonl(file: Union[str, BinaryIO],
+                tracks: Iterable[SpotifyTrack],
+                *,
+
+                backend: str = DEFAULT_JSON_BACKEND) -> int:
+    """Write tracks as JSON lines, see JSONLWriter
+
+    Args:
+        file (Union[str, BinaryIO]): the path of the file, it is compressed with gzip if it ends with .gz
+        tracks (Iterable[SpotifyTrack]): the tracks to write
+        -
+        backend (str): the JSON library used, see JSON_BACKENDS. Defaults to DEFAULT_JSON_BACKEND
+
+    Returns: the number of tracks written
+    """
+    with JSONLWriter(file, backend=backend) as writer:
+        return writer.write_many(tracks)
+
+
+def read_jsonl(file: Union[str, BinaryIO], *, backend: str = DEFAULT_JSON_BACKEND) -> Iterator[SpotifyTrack]:
+    """Lazily read the tracks of a JSON lines file, one line at a time, so any number of tracks can be read in constant
+    memory. Blank lines are skipped.
+
+    Args:
+        file (Union[str, BinaryIO]): the path of the file, it is decompressed with gzip if it ends with .gz. A file
+            already opened in binary mode can be provided instead, it is not closed by the reader
+        -
+        backend (str): the JSON library used, see JSON_BACKENDS. Defaults to DEFAULT_JSON_BACKEND
+
+    Returns: an iterator of SpotifyTrack instances
+    """
+    _, loads = _json_functions(backend)
+    binary_file = _open(file, "rb")
+    try:
+        for line in binary_file:
+            if line.strip():
+                yield SpotifyTrack.from_dict(loads(line))
+    finally:
+        if isinstance(file, str):
+            binary_file.close()
@@ -0,0 +1,121 @@
+import logging
+import threading
+import time
+from typing import NamedTuple, Optional
+
+
+class RateLimiterState(NamedTuple):
+    """Represents a snapshot of the state of a RateLimiter
+
+    The RateLimiterState consists of:
+    * tokens_available (float): the number of requests that can be sent right away, without waiting
+    * paused_for (float): the number of seconds left before the requests are resumed after a rate limit exceeded
+        error, 0.0 if the requests are not paused
+    * throttled_requests (int): the number of requests that had to wait before being sent
+    * throttled_time (float): the total number of seconds the requests spent waiting
+    """
+    tokens_available: float
+    paused_for: float
+    throttled_requests: int
+    throttled_time: float
+
+
+class RateLimiter:
+    """A thread-safe token bucket rate limiter for the requests to the Spotify API.
+
+    The bucket holds up to burst tokens and is refilled at rate tokens per second, every request takes a token or waits
+    until one is available. When Spotify returns a rate limit exceeded error, every request sharing the limiter is
+    paused until the Retry-After window has passed.
+    """
+
+    def __init__(self, rate: Optional[float] = None, burst: Optional[int] = None):
+        """Create a RateLimiter instance
+
+        Args:
+            rate (Optional[float]): the number of requests allowed per second. If not provided, the requests are only
+                limited by the pauses requested by Spotify
+            burst (Optional[int]): the maximum number of requests that can be sent at once after the limiter has been
+                idle, defaults to the number of requests allowed in a second
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError("The rate should be greater than 0.")
+
+        if burst is not None and burst < 1:
+            raise ValueError("The burst should be at least 1.")
+
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate or 1))
+
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._throttled_requests = 0
+        self._throttled_time = 0.0
+
+    @property
+    def state(self) -> RateLimiterState:
+        """Property method for state.
+
+        Returns: a RateLimiterState with the current state of the limiter
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return RateLimiterState(tokens_available=self._tokens if self.rate else float("inf"),
+                                    paused_for=max(0.0, self._paused_until - now),
+                                    throttled_requests=self._throttled_requests,
+                                    throttled_time=self._throttled_time)
+
+    def acquire(self) -> float:
+        """Wait until a request can be sent, taking a token from the bucket
+
+        Returns: the number of seconds the request had to wait
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+
+                if self._paused_until > now:
+                    wait = self._paused_until - now
+                elif not self.rate:
+                    break
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    break
+                else:
+                    wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+            waited += wait
+
+        if waited:
+            with self._lock:
+                self._throttled_requests += 1
+                self._throttled_time += waited
+
+        return waited
+
+    def pause(self, seconds: float) -> None:
+        """Pause every request sharing the limiter for the given number of seconds, eg: after a rate limit exceeded
+        error. If the requests are already paused for longer, nothing changes.
+
+        Args:
+            seconds (float): the number of seconds to pause the requests for
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+        logging.warning(f"Requests to the Spotify API are paused for {seconds} seconds.")
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens generated since the last refill to the bucket, this must be called while holding the lock
+
+        Args:
+            now (float): the current value of time.monotonic()
+        """
+        if self.rate:
+            self._tokens = min(float(self.burst), self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
@@ -0,0 +1,176 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+from .utils import normalize_query_params
+
+# The default number of seconds a response is cached for, per endpoint type. Audio features never change, while search
+# results may change whenever new tracks are released
+DEFAULT_TTLS: dict[str, float] = {
+    "search": 5 * 60,
+    "tracks": 60 * 60,
+    "audio-features": 24 * 60 * 60
+}
+DEFAULT_TTL: float = 5 * 60
+DEFAULT_MAX_ENTRIES: int = 10_000
+DEFAULT_MAX_BYTES: int = 64 * 1024 * 1024
+
+
+class ResponseCacheStats(NamedTuple):
+    """Represents a snapshot of the counters of a ResponseCache
+
+    The ResponseCacheStats consists of:
+    * hits (int): the number of lookups that found a cached response
+    * misses (int): the number of lookups that didn't find a cached response, expired responses included
+    * evictions (int): the number of responses removed to make room for new ones
+    * expirations (int): the number of responses removed because their TTL had passed
+    * entries (int): the number of responses currently cached
+    * size_bytes (int): the approximate size of the responses currently cached
+    """
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    entries: int
+    size_bytes: int
+
+
+class _CacheEntry(NamedTuple):
+    """Represents a cached response, along with its size and the monotonic time when it expires
+    """
+    value: dict
+    size_bytes: int
+    expires_at: float
+
+
+class ResponseCache:
+    """A thread-safe, in-memory LRU cache of the responses of the Spotify API.
+
+    Responses are keyed by path and normalized query params, and expire after a TTL that depends on the endpoint type
+    (the first segment of the path, eg: "search" or "audio-features"). The least recently used responses are evicted
+    once the cache has more than max_entries responses or their size exceeds max_bytes.
+    """
+
+    def __init__(self,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_MAX_BYTES,
+                 *,
+
+                 ttls: Optional[dict[str, float]] = None,
+                 default_ttl: float = DEFAULT_TTL):
+        """Create a ResponseCache instance
+
+        Args:
+            max_entries (int): the maximum number of cached responses, defaults to DEFAULT_MAX_ENTRIES
+            max_bytes (int): the maximum size of the cached responses, measured as the length of their JSON
+                representation. Defaults to DEFAULT_MAX_BYTES
+            -
+            ttls (Optional[dict[str, float]]): the number of seconds a response is cached for, per endpoint type. A TTL
+                of 0 disables the cache for the endpoint type. Defaults to DEFAULT_TTLS
+            default_ttl (float): the number of seconds a response is cached for if its endpoint type is not in ttls,
+                defaults to DEFAULT_TTL
+        """
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("The maximum number of entries and the maximum size should be at least 1.")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttls = ttls if ttls is not None else DEFAULT_TTLS
+        self.default_ttl = default_ttl
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple, _CacheEntry] = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @property
+    def stats(self) -> ResponseCacheStats:
+        """Property method for stats.
+
+        Returns: a ResponseCacheStats with the current counters of the cache
+        """
+        with self._lock:
+            return ResponseCacheStats(self._hits, self._misses, self._evictions, self._expirations,
+                                      len(self._entries), self._size_bytes)
+
+    def ttl(self, path: str) -> float:
+        """Get the number of seconds a response of the given path is cached for
+
+        Args:
+            path (str): the path of the request
+
+        Returns: the TTL of the endpoint type of the path
+        """
+        return self.ttls.get(path.split("/", 1)[0], self.default_ttl)
+
+    def get(self, path: str, query_params: Optional[dict] = None) -> Optional[dict]:
+        """Get the cached response of a request
+
+        Args:
+            path (str): the path of the request
+            query_params (Optional[dict]): the query params of the request
+
+        Returns: the cached response, None if it is not cached or it has expired
+        """
+        key = (path, normalize_query_params(query_params))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self._expirations += 1
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.value
+
+    def set(self, path: str, query_params: Optional[dict], value: dict) -> None:
+        """Cache the response of a request, evicting the least recently used responses if needed
+
+        Args:
+            path (str): the path of the request
+            query_params (Optional[dict]): the query params of the request
+            value (dict): the JSON representation of the response
+        """
+        if (ttl := self.ttl(path)) <= 0:
+            return
+
+        size_bytes = len(json.dumps(value))
+        if size_bytes > self.max_bytes:  # The response would evict everything else and still not fit
+            return
+
+        key = (path, normalize_query_params(query_params))
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = _CacheEntry(value, size_bytes, time.monotonic() + ttl)
+            self._size_bytes += size_bytes
+
+            while len(self._entries) > self.max_entries or self._size_bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove every cached response
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def _remove(self, key: tuple) -> None:
+        """Remove a cached response, this must be called while holding the lock
+
+        Args:
+            key (tuple): the key of the response
+        """
+        self._size_bytes -= self._entries.pop(key).size_bytes
@@ -0,0 +1,231 @@
+import logging
+import random
+import threading
+import time
+from collections import deque
+from typing import NamedTuple, Optional
+
+from requests import ConnectionError, Timeout
+
+# The HTTP status codes that are retried by default: 429 Too Many Requests and the transient 5xx errors
+DEFAULT_RETRY_STATUS_CODES: tuple[int, ...] = (429, 500, 502, 503, 504)
+# The exceptions raised by requests that are retried by default, this includes connection resets
+DEFAULT_RETRY_EXCEPTIONS: tuple[type[Exception], ...] = (ConnectionError, Timeout)
+
+
+class RetryStats(NamedTuple):
+    """Represents a snapshot of the retry counters of a RetryPolicy
+
+    The RetryStats consists of:
+    * requests (int): the number of requests made with the policy, a request and all its retries count as one
+    * retries (int): the number of retries made
+    * exhausted (int): the number of requests that failed after using all their attempts
+    * budget_exceeded (int): the number of retries that were not made because the retry budget was spent
+    """
+    requests: int
+    retries: int
+    exhausted: int
+    budget_exceeded: int
+
+
+class RetryBudget:
+    """Caps the number of retries to a ratio of the requests made in a sliding window, so retries can't grow into a
+    retry storm while the Spotify API is down.
+
+    A retry is allowed as long as the retries in the window stay under: min_retries_per_second * window +
+    ratio * requests in the window.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries_per_second: float = 1.0, window: int = 10):
+        """Create a RetryBudget instance
+
+        Args:
+            ratio (float): the number of retries allowed per request, eg: 0.2 allows 1 retry for every 5 requests.
+                Defaults to 0.2
+            min_retries_per_second (float): the number of retries allowed per second regardless of the number of
+                requests, so a low traffic client can still retry. Defaults to 1.0
+            window (int): the length of the sliding window in seconds, defaults to 10
+        """
+        if ratio < 0 or min_retries_per_second < 0:
+            raise ValueError("The ratio and the minimum retries per second can't be negative.")
+
+        if window < 1:
+            raise ValueError("The window should be at least 1 second.")
+
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.window = window
+
+        self._lock = threading.Lock()
+        # One [second, requests, retries] bucket for every second in the window
+        self._buckets: deque[list[int]] = deque()
+
+    def record_request(self) -> None:
+        """Record a new request in the window
+        """
+        with self._lock:
+            self._current_bucket()[1] += 1
+
+    def try_spend(self) -> bool:
+        """Spend a retry from the budget if there is one available
+
+        Returns: True if the retry can be made, else False
+        """
+        with self._lock:
+            bucket = self._current_bucket()
+            requests = sum(requests for _, requests, _ in self._buckets)
+            retries = sum(retries for _, _, retries in self._buckets)
+
+            if retries >= self.min_retries_per_second * self.window + self.ratio * requests:
+                return False
+
+            bucket[2] += 1
+            return True
+
+    def _current_bucket(self) -> list[int]:
+        """Drop the buckets that are out of the window and return the bucket for the current second, this must be
+        called while holding the lock
+
+        Returns: the [second, requests, retries] bucket for the current second
+        """
+        now = int(time.monotonic())
+        while self._buckets and self._buckets[0][0] <= now - self.window:
+            self._buckets.popleft()
+
+        if not self._buckets or self._buckets[-1][0] != now:
+            self._buckets.append([now, 0, 0])
+
+        return self._buckets[-1]
+
+
+class RetryPolicy:
+    """Decides which failed requests to the Spotify API are retried and how long to wait before each retry.
+
+    The wait grows exponentially with every attempt and uses full jitter: a random value between 0 and
+    min(backoff_max, backoff_base * 2 ** (attempt - 1)), so clients that failed at the same time don't retry at the
+    same time. The policy is meant to be shared by every request of a client, so its budget and counters are
+    client-wide.
+    """
+
+    def __init__(self,
+                 max_attempts: int = 3,
+                 *,
+
+                 retry_on_status_codes: tuple[int, ...] = DEFAULT_RETRY_STATUS_CODES,
+                 retry_on_exceptions: tuple[type[Exception], ...] = DEFAULT_RETRY_EXCEPTIONS,
+                 backoff_base: float = 0.5,
+                 backoff_max: float = 30.0,
+                 budget: Optional[RetryBudget] = None):
+        """Create a RetryPolicy instance
+
+        Args:
+            max_attempts (int): the maximum number of attempts per request, including the first one. Defaults to 3
+            -
+            retry_on_status_codes (tuple[int, ...]): the HTTP status codes that are retried,
+                defaults to DEFAULT_RETRY_STATUS_CODES
+            retry_on_exceptions (tuple[type[Exception], ...]): the exceptions raised by requests that are retried,
+                defaults to DEFAULT_RETRY_EXCEPTIONS
+            backoff_base (float): the maximum number of seconds to wait before the first retry, defaults to 0.5
+            backoff_max (float): the maximum number of seconds to wait before any retry. A Retry-After window longer
+                than this is not retried. Defaults to 30
+            budget (Optional[RetryBudget]): the retry budget shared by every request, defaults to a RetryBudget with
+                its default values
+        """
+        if max_attempts < 1:
+            raise ValueError("The maximum number of attempts should be at least 1.")
+
+        self.max_attempts = max_attempts
+        self.retry_on_status_codes = retry_on_status_codes
+        self.retry_on_exceptions = retry_on_exceptions
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.budget = budget if budget is not None else RetryBudget()
+
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._retries = 0
+        self._exhausted = 0
+        self._budget_exceeded = 0
+
+    @property
+    def stats(self) -> RetryStats:
+        """Property method for stats.
+
+        Returns: a RetryStats with the current retry counters
+        """
+        with self._lock:
+            return RetryStats(self._requests, self._retries, self._exhausted, self._budget_exceeded)
+
+    def record_request(self) -> None:
+        """Record a new request, this must be called once per request, not once per attempt
+        """
+        self.budget.record_request()
+        with self._lock:
+            self._requests += 1
+
+    def is_retryable(self, *, status_code: Optional[int] = None, exception: Optional[Exception] = None) -> bool:
+        """Check if a failed attempt can be retried according to its status code or exception
+
+        Args:
+            -
+            status_code (Optional[int]): the HTTP status code returned by the Spotify API
+            exception (Optional[Exception]): the exception raised while making the request
+
+        Returns: True if the failure is retryable, else False
+        """
+        if exception is not None:
+            return isinstance(exception, self.retry_on_exceptions)
+
+        return status_code in self.retry_on_status_codes
+
+    def backoff(self, attempt: int) -> float:
+        """Get a random number of seconds to wait before retrying, using exponential backoff with full jitter
+
+        Args:
+            attempt (int): the number of the attempt that failed, starting at 1
+
+        Returns: the number of seconds to wait
+        """
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+    def wait_for_retry(self,
+                       attempt: int,
+                       path: str,
+                       reason: str,
+                       retry_after: Optional[float] = None,
+                       *,
+
+                       paused: bool = False) -> bool:
+        """Decide if a failed attempt is retried and, if so, wait before the retry. The failure must be retryable,
+        see is_retryable.
+
+        Args:
+            attempt (int): the number of the attempt that failed, starting at 1
+            path (str): the path of the request
+            reason (str): a description of the failure, used in the logs
+            retry_after (Optional[float]): the minimum number of seconds to wait, eg: from the Retry-After header
+            -
+            paused (bool): if True, the Retry-After window is already waited for elsewhere (eg: by a paused
+                RateLimiter), so only the backoff is waited here. The window is still checked against backoff_max
+
+        Returns: True if the request should be retried, else False
+        """
+        if attempt >= self.max_attempts or (retry_after is not None and retry_after > self.backoff_max):
+            with self._lock:
+                self._exhausted += 1
+            return False
+
+        if not self.budget.try_spend():
+            logging.warning(f"The retry budget is spent, the request to Spotify's {path} will not be retried.")
+            with self._lock:
+                self._budget_exceeded += 1
+            return False
+
+        delay = self.backoff(attempt) if paused else max(self.backoff(attempt), retry_after or 0.0)
+        logging.warning(f"The request to Spotify's {path} failed ({reason}), retrying in {delay:.2f} seconds "
+                        f"(attempt {attempt + 1} of {self.max_attempts}).")
+        with self._lock:
+            self._retries += 1
+
+        time.sleep(delay)
+        return True
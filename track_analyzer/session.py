@@ -0,0 +1,93 @@
+import logging
+import threading
+from typing import Iterable
+from urllib.parse import urlsplit
+
+import requests
+from requests import RequestException
+from requests.adapters import HTTPAdapter
+
+# The default number of connections kept alive per host
+DEFAULT_POOL_SIZE: int = 10
+
+
+class SpotifySession:
+    """A thread-safe pool of keep-alive HTTP connections shared by the Spotify API and authentication calls.
+
+    requests.Session instances are not guaranteed to be thread-safe, so every thread gets its own Session. All of them
+    mount the same HTTPAdapter, which means the underlying urllib3 connection pool (which is thread-safe) and its
+    keep-alive connections are shared across threads.
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, *, keep_alive: bool = True, pool_block: bool = False):
+        """Create a SpotifySession instance
+
+        Args:
+            pool_size (int): the maximum number of connections kept alive per host, defaults to DEFAULT_POOL_SIZE
+            -
+            keep_alive (bool): if True, connections are reused between requests, else every request asks the server
+                to close the connection once the response is sent. Defaults to True
+            pool_block (bool): if True, requests wait for a free connection once pool_size connections to a host are
+                in use, else extra connections are opened and discarded after use. Defaults to False
+        """
+        if pool_size < 1:
+            raise ValueError("The pool size should be at least 1.")
+
+        self.pool_size = pool_size
+        self.keep_alive = keep_alive
+        self._adapter = HTTPAdapter(pool_maxsize=pool_size, pool_block=pool_block)
+        self._local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        """Property method for session. Returns the requests.Session bound to the calling thread, creating it the
+        first time the thread uses it.
+
+        Returns: a requests.Session instance that uses the shared connection pool
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+            session.headers["Connection"] = "keep-alive" if self.keep_alive else "close"
+            self._local.session = session
+
+        return session
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request using the shared connection pool, see requests.Session.get
+        """
+        return self.session.get(url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """Send a POST request using the shared connection pool, see requests.Session.post
+        """
+        return self.session.post(url, **kwargs)
+
+    def warm_up(self, urls: Iterable[str], timeout: float = 5.0) -> int:
+        """Open a connection to the host of each of the given URLs so the first real request doesn't pay for the
+        TCP and TLS handshakes. Failures are logged and ignored, since warming up is only an optimization.
+
+        Args:
+            urls (Iterable[str]): the URLs whose hosts should be connected to
+            timeout (float): the maximum number of seconds to wait for each host, defaults to 5 seconds
+
+        Returns: the number of hosts that were warmed up successfully
+        """
+        warmed_up = 0
+        origins = {f"{parts.scheme}://{parts.netloc}" for parts in map(urlsplit, urls)}
+        for origin in origins:
+            try:
+                # Any response (even a 404) means the connection is now open and back in the pool
+                self.session.head(origin, timeout=timeout)
+                warmed_up += 1
+            except RequestException as e:
+                logging.warning(f"Could not warm up the connection to {origin}. {e}")
+
+        return warmed_up
+
+    def close(self) -> None:
+        """Close every pooled connection
+        """
+        self._adapter.close()
@@ -0,0 +1,405 @@
+import threading
+from typing import Iterable, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from .audio_features_frame import AudioFeaturesFrame
+from .clustering import MiniBatchKMeans, closest_centroids, squared_distances
+from .spotify_audio_features import AUDIO_FEATURES_FIELDS
+from .spotify_track import SpotifyTrack
+
+# The range of every audio feature, used to rescale them to [0, 1] so every audio feature weighs the same in the
+# distance between two tracks. The ranges are fixed, so inserting new tracks never changes the existing vectors
+FEATURE_RANGES: dict[str, tuple[float, float]] = {
+    "acousticness": (0.0, 1.0),
+    "danceability": (0.0, 1.0),
+    "energy": (0.0, 1.0),
+    "instrumentalness": (0.0, 1.0),
+    "liveness": (0.0, 1.0),
+    "loudness": (-60.0, 0.0),
+    "mode": (0.0, 1.0),
+    "speechiness": (0.0, 1.0),
+    "tempo": (0.0, 250.0),
+    "valence": (0.0, 1.0)
+}
+# The default number of partitions searched by an approximate query
+DEFAULT_N_PROBE: int = 8
+# The maximum number of distances computed at once, this bounds the memory used by batch queries
+_DISTANCES_BLOCK_SIZE: int = 4 * 1024 * 1024
+_INITIAL_CAPACITY: int = 1024
+
+
+class SimilarTrack(NamedTuple):
+    """Represents a track returned by a similarity query
+
+    The SimilarTrack consists of:
+    * track_id (str): the Spotify ID of the track
+    * distance (float): the euclidean distance between the normalized audio features of the track and the query
+    """
+    track_id: str
+    distance: float
+
+
+def feature_vectors(frame: AudioFeaturesFrame, fields: Sequence[str] = AUDIO_FEATURES_FIELDS) -> np.ndarray:
+    """Get the normalized audio features of the tracks of a frame, see FEATURE_RANGES
+
+    Args:
+        frame (AudioFeaturesFrame): the audio features of the tracks
+        fields (Sequence[str]): the audio features to include, defaults to every audio feature
+
+    Returns: a float32 matrix with a row per track, the tracks with missing audio features have NaN values
+    """
+    lower = np.array([FEATURE_RANGES[field][0] for field in fields])
+    upper = np.array([FEATURE_RANGES[field][1] for field in fields])
+
+    return ((frame.to_matrix(fields) - lower) / (upper - lower)).astype(np.float32)
+
+
+class SimilarityIndex:
+    """A nearest neighbour index over the normalized audio features of a library of tracks, used to find the tracks
+    that sound the most like a given one.
+
+    Every query can be answered exactly, comparing the query with every track in the index, or approximately with an
+    inverted file: the tracks are split into n_partitions clusters and only the n_probe clusters closest to the query
+    are compared. The clusters are trained on the tracks in the index the first time they are needed, tracks inserted
+    afterwards are added to their closest cluster. Call train to rebuild the clusters once the library has grown.
+
+    Usage:
+        index = SimilarityIndex(n_partitions=1024)
+        index.add_tracks(spotify_tracks)
+        similar_tracks = index.query_track(track_id, k=10)
+    """
+
+    def __init__(self,
+                 fields: Sequence[str] = AUDIO_FEATURES_FIELDS,
+                 *,
+
+                 n_partitions: Optional[int] = None,
+                 n_probe: int = DEFAULT_N_PROBE,
+                 seed: Optional[int] = None):
+        """Create a SimilarityIndex instance
+
+        Args:
+            fields (Sequence[str]): the audio features compared between tracks, defaults to every audio feature
+            -
+            n_partitions (Optional[int]): the number of clusters used by the approximate queries. If not provided, every
+                query is exact. A value around the square root of the number of tracks works well
+            n_probe (int): the number of clusters searched by an approximate query, more clusters give more accurate
+                results but slower queries. Defaults to DEFAULT_N_PROBE
+            seed (Optional[int]): the seed used to train the clusters, for reproducible results
+        """
+        if unknown_fields := set(fields) - set(FEATURE_RANGES):
+            raise ValueError(f"{', '.join(sorted(unknown_fields))} are not valid audio features.")
+
+        if n_partitions is not None and n_partitions < 1:
+            raise ValueError("The number of partitions should be at least 1.")
+
+        if n_probe < 1:
+            raise ValueError("The number of partitions searched should be at least 1.")
+
+        self.fields = tuple(fields)
+        self.n_partitions = n_partitions
+        self.n_probe = n_probe
+
+        self._lock = threading.RLock()
+        self._random = np.random.default_rng(seed)
+        self._vectors = np.empty((_INITIAL_CAPACITY, len(self.fields)), dtype=np.float32)
+        self._track_ids: list[str] = []
+        self._rows: dict[str, int] = {}
+
+        # The inverted file: the centroid of every cluster, the cluster of every row and the rows of every cluster
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments = np.empty(_INITIAL_CAPACITY, dtype=np.int32)
+        self._partitions: list[set[int]] = []
+        self._partition_arrays: dict[int, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        """Returns the number of tracks in the index
+        """
+        return len(self._track_ids)
+
+    def __contains__(self, track_id: str) -> bool:
+        """Returns if the track is in the index
+        """
+        return track_id in self._rows
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """Property method for vectors.
+
+        Returns: the normalized audio features of the tracks in the index, a row per track in insertion order
+        """
+        return self._vectors[:len(self)]
+
+    @property
+    def is_trained(self) -> bool:
+        """Property method for is_trained.
+
+        Returns: True if the clusters used by the approximate queries have been trained, else False
+        """
+        return self._centroids is not None
+
+    def add_tracks(self, tracks: Iterable[SpotifyTrack]) -> int:
+        """Insert several tracks in the index, see add_frame
+
+        Args:
+            tracks (Iterable[SpotifyTrack]): the tracks to insert
+
+        Returns: the number of tracks inserted
+        """
+        return self.add_frame(AudioFeaturesFrame.from_tracks(tracks))
+
+    def add_frame(self, frame: AudioFeaturesFrame) -> int:
+        """Insert the tracks of a frame in the index, the tracks with missing audio features are skipped
+
+        Args:
+            frame (AudioFeaturesFrame): the audio features of the tracks to insert
+
+        Returns: the number of tracks inserted
+        """
+        vectors = feature_vectors(frame, self.fields)
+        complete = ~np.isnan(vectors).any(axis=1)
+
+        return self.add(frame.track_ids[complete], vectors[complete])
+
+    def add(self, track_ids: Sequence[str], vectors: np.ndarray) -> int:
+        """Insert several tracks in the index given their normalized audio features, see feature_vectors. A track that
+        is already in the index has its audio features replaced, if a track ID is repeated its last vector is used.
+
+        Args:
+            track_ids (Sequence[str]): the Spotify IDs of the tracks
+            vectors (np.ndarray): a matrix with the normalized audio features of every track, a row per track
+
+        Returns: the number of tracks inserted, repeated track IDs are only counted once
+        """
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, len(self.fields))
+        if len(track_ids) != len(vectors):
+            raise ValueError("There should be a vector for each track.")
+
+        # Map every track ID to the position of its last vector
+        last_positions = {track_id: i for i, track_id in enumerate(track_ids)}
+        if len(last_positions) != len(track_ids):
+            track_ids = list(last_positions)
+            vectors = vectors[list(last_positions.values())]
+
+        with self._lock:
+            rows = np.empty(len(track_ids), dtype=np.int64)
+            replaced = []
+            for i, track_id in enumerate(track_ids):
+                if (row := self._rows.get(track_id)) is not None:
+                    replaced.append(row)
+                else:
+                    row = self._rows[track_id] = len(self._track_ids)
+                    self._track_ids.append(track_id)
+                rows[i] = row
+
+            self._reserve(len(self._track_ids))
+            self._vectors[rows] = vectors
+
+            if self._centroids is not None:
+                for row in replaced:
+                    old_partition = int(self._assignments[row])
+                    self._partitions[old_partition].discard(row)
+                    self._partition_arrays.pop(old_partition, None)
+                self._assign(rows)
+
+        return len(track_ids)
+
+    def train(self, *, max_iterations: int = 100, batch_size: Optional[int] = None) -> None:
+        """Train the clusters used by the approximate queries on the tracks in the index, with mini-batch k-means, and
+        assign every track to its closest cluster
+
+        Args:
+            -
+            max_iterations (int): the maximum number of mini-batches, defaults to 100
+            batch_size (Optional[int]): the number of tracks in every mini-batch, defaults to 4 tracks per cluster and
+                at least 1024
+        """
+        if self.n_partitions is None:
+            raise ValueError("The index has no partitions, every query is exact.")
+
+        with self._lock:
+            if len(self) == 0:
+                raise ValueError("The index is empty.")
+
+            n_clusters = min(self.n_partitions, len(self))
+            kmeans = MiniBatchKMeans(n_clusters, batch_size=batch_size or max(1024, 4 * n_clusters),
+                                     max_iterations=max_iterations, seed=int(self._random.integers(2 ** 32)))
+
+            self._centroids = kmeans.fit(self.vectors).centroids.astype(np.float32)
+            self._partitions = [set() for _ in range(n_clusters)]
+            self._partition_arrays.clear()
+            self._assign(np.arange(len(self)))
+
+    def query(self, vector: np.ndarray, k: int = 10, *, exact: Optional[bool] = None) -> list[SimilarTrack]:
+        """Find the tracks closest to the given normalized audio features, see query_batch
+
+        Args:
+            vector (np.ndarray): the normalized audio features to compare with, see feature_vectors
+            k (int): the number of tracks to return, defaults to 10
+            -
+            exact (Optional[bool]): if True, compare with every track. Defaults to False if the index has partitions
+
+        Returns: a list with up to k SimilarTracks, from the closest to the farthest
+        """
+        return self.query_batch(np.asarray(vector).reshape(1, -1), k, exact=exact)[0]
+
+    def query_track(self, track_id: str, k: int = 10, *, exact: Optional[bool] = None) -> list[SimilarTrack]:
+        """Find the tracks that sound the most like a track in the index, the track itself is not returned
+
+        Args:
+            track_id (str): the Spotify ID of the track
+            k (int): the number of tracks to return, defaults to 10
+            -
+            exact (Optional[bool]): if True, compare with every track. Defaults to False if the index has partitions
+
+        Returns: a list with up to k SimilarTracks, from the closest to the farthest
+
+        Raises:
+            KeyError: if the track is not in the index
+        """
+        with self._lock:
+            vector = self._vectors[self._rows[track_id]].copy()
+            similar_tracks = self.query(vector, k + 1, exact=exact)
+
+        return [similar_track for similar_track in similar_tracks if similar_track.track_id != track_id][:k]
+
+    def query_batch(self,
+                    vectors: np.ndarray,
+                    k: int = 10,
+                    *,
+
+                    exact: Optional[bool] = None) -> list[list[SimilarTrack]]:
+        """Find the tracks closest to each of the given normalized audio features
+
+        Args:
+            vectors (np.ndarray): a matrix with the normalized audio features to compare with, a row per query
+            k (int): the number of tracks to return per query, defaults to 10
+            -
+            exact (Optional[bool]): if True, compare with every track. Defaults to False if the index has partitions
+
+        Returns: a list with the SimilarTracks of every query, each of them from the closest to the farthest
+        """
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, len(self.fields))
+        exact = exact if exact is not None else self.n_partitions is None
+
+        with self._lock:
+            if len(self) == 0 or k < 1:
+                return [[] for _ in vectors]
+
+            if exact:
+                return self._query_exact(vectors, k)
+
+            if self._centroids is None:
+                self.train()
+
+            return self._query_partitions(vectors, k)
+
+    def _query_exact(self, vectors: np.ndarray, k: int) -> list[list[SimilarTrack]]:
+        """Compare every query with every track in the index, this must be called while holding the lock
+
+        Args:
+            vectors (np.ndarray): the normalized audio features of every query
+            k (int): the number of tracks to return per query
+
+        Returns: the SimilarTracks of every query
+        """
+        indexed = self.vectors
+        indexed_norms = np.einsum("ij,ij->i", indexed, indexed)
+        block_size = max(1, _DISTANCES_BLOCK_SIZE // len(indexed))
+
+        results = []
+        for start in range(0, len(vectors), block_size):
+            block = vectors[start:start + block_size]
+            # ||a - b||^2 = ||a||^2 - 2ab + ||b||^2, computed for the whole block with a single matrix product
+            distances = np.einsum("ij,ij->i", block, block)[:, None] - 2 * block @ indexed.T + indexed_norms
+            results.extend(self._top_k(np.arange(len(indexed)), row_distances, k) for row_distances in distances)
+
+        return results
+
+    def _query_partitions(self, vectors: np.ndarray, k: int) -> list[list[SimilarTrack]]:
+        """Compare every query with the tracks of its n_probe closest clusters, this must be called while holding the
+        lock
+
+        Args:
+            vectors (np.ndarray): the normalized audio features of every query
+            k (int): the number of tracks to return per query
+
+        Returns: the SimilarTracks of every query
+        """
+        n_probe = min(self.n_probe, len(self._centroids))
+        centroid_distances = squared_distances(vectors, self._centroids)
+        probes = np.argpartition(centroid_distances, n_probe - 1, axis=1)[:, :n_probe]
+
+        results = []
+        for vector, probe in zip(vectors, probes):
+            rows = np.concatenate([self._partition_rows(partition) for partition in probe])
+            if len(rows) == 0:
+                results.append([])
+                continue
+
+            difference = self._vectors[rows] - vector
+            results.append(self._top_k(rows, np.einsum("ij,ij->i", difference, difference), k))
+
+        return results
+
+    def _top_k(self, rows: np.ndarray, squared_distances: np.ndarray, k: int) -> list[SimilarTrack]:
+        """Get the k closest tracks out of the given candidates
+
+        Args:
+            rows (np.ndarray): the rows of the candidate tracks
+            squared_distances (np.ndarray): the squared distance to every candidate
+            k (int): the number of tracks to return
+
+        Returns: the SimilarTracks, from the closest to the farthest
+        """
+        if len(rows) > k:
+            closest = np.argpartition(squared_distances, k - 1)[:k]
+        else:
+            closest = np.arange(len(rows))
+        closest = closest[np.argsort(squared_distances[closest], kind="stable")]
+
+        return [SimilarTrack(self._track_ids[rows[i]], float(np.sqrt(max(squared_distances[i], 0.0))))
+                for i in closest]
+
+    def _assign(self, rows: np.ndarray) -> None:
+        """Assign the given rows to their closest cluster, this must be called while holding the lock
+
+        Args:
+            rows (np.ndarray): the rows to assign
+        """
+        assignments = closest_centroids(self._vectors[rows], self._centroids)
+        self._assignments[rows] = assignments
+        for row, partition in zip(rows.tolist(), assignments.tolist()):
+            self._partitions[partition].add(row)
+            self._partition_arrays.pop(partition, None)
+
+    def _partition_rows(self, partition: int) -> np.ndarray:
+        """Get the rows of a cluster as an array, the array is cached until the cluster changes
+
+        Args:
+            partition (int): the cluster
+
+        Returns: the rows of the cluster
+        """
+        if (rows := self._partition_arrays.get(partition)) is None:
+            rows = self._partition_arrays[partition] = np.sort(np.fromiter(self._partitions[partition], dtype=np.int64))
+
+        return rows
+
+    def _reserve(self, capacity: int) -> None:
+        """Grow the storage, doubling its size, so it can hold the given number of tracks
+
+        Args:
+            capacity (int): the number of tracks to hold
+        """
+        if capacity <= len(self._vectors):
+            return
+
+        new_capacity = max(capacity, 2 * len(self._vectors))
+        vectors = np.empty((new_capacity, len(self.fields)), dtype=np.float32)
+        vectors[:len(self._vectors)] = self._vectors
+        assignments = np.empty(new_capacity, dtype=np.int32)
+        assignments[:len(self._assignments)] = self._assignments
+
+        self._vectors, self._assignments = vectors, assignments
@@ -14,11 +14,25 @@ class SpotifyAlbumReleaseDate(NamedTuple):
     released_on: str
     precision: str  # day, month or year
 
+    def to_dict(self) -> dict:
+        """Returns a plain dict representation of the release date, see from_dict
+        """
+        return {"released_on": self.released_on, "precision": self.precision}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SpotifyAlbumReleaseDate":
+        """Create a SpotifyAlbumReleaseDate from its plain dict representation, see to_dict
+        """
+        return cls(data["released_on"], data["precision"])
+
 
 class SpotifyAlbum:
     """This class represents a Spotify album
     """
 
+    __slots__ = ("name", "album_id", "album_type", "genres", "image_url", "popularity", "total_tracks", "label",
+                 "release_date", "__weakref__")
+
     def __init__(self,
                  name: str,
                  album_id: str,
@@ -65,3 +79,55 @@ class SpotifyAlbum:
         self.total_tracks = total_tracks
         self.label = label
         self.release_date = release_date
+
+    @classmethod
+    def _unchecked(cls,
+                   name: str,
+                   album_id: str,
+                   album_type: Optional[str],
+                   total_tracks: Optional[int],
+                   release_date: Optional[SpotifyAlbumReleaseDate]) -> "SpotifyAlbum":
+        """Create a SpotifyAlbum without running __init__, so its album type is not validated. This is meant for the
+        batch extraction of the responses of the Spotify API, which validates the album types of a whole page at once.
+        The attributes that are not given are None
+
+        Args:
+            name (str): the name of the album
+            album_id (str): the Spotify ID of the album
+            album_type (Optional[str]): the album type, it must be one of ALLOWED_ALBUM_TYPES
+            total_tracks (Optional[int]): the number of tracks the album has
+            release_date (Optional[SpotifyAlbumReleaseDate]): the album's release date
+
+        Returns: a SpotifyAlbum instance
+        """
+        album = cls.__new__(cls)
+        album.name = name
+        album.album_id = album_id
+        album.album_type = album_type
+        album.total_tracks = total_tracks
+        album.release_date = release_date
+        album.genres = album.image_url = album.popularity = album.label = None
+        return album
+
+    def to_dict(self) -> dict:
+        """Returns a plain dict representation of the album that can be serialized as JSON, see from_dict
+        """
+        return {"name": self.name, "album_id": self.album_id, "album_type": self.album_type, "genres": self.genres,
+                "image_url": self.image_url, "popularity": self.popularity, "total_tracks": self.total_tracks,
+                "label": self.label,
+                "release_date": self.release_date.to_dict() if self.release_date is not None else None}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SpotifyAlbum":
+        """Create a SpotifyAlbum from its plain dict representation, see to_dict. Missing keys are left unset
+
+        Args:
+            data (dict): the plain dict representation of the album
+
+        Returns: a SpotifyAlbum instance
+        """
+        release_date = data.get("release_date")
+        return cls(data.get("name"), data.get("album_id"), album_type=data.get("album_type"), genres=data.get("genres"),
+                   image_url=data.get("image_url"), popularity=data.get("popularity"),
+                   total_tracks=data.get("total_tracks"), label=data.get("label"),
+                   release_date=SpotifyAlbumReleaseDate.from_dict(release_date) if release_date is not None else None)
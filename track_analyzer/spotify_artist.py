@@ -5,6 +5,8 @@ class SpotifyArtist:
     """This class represents a Spotify artist
     """
 
+    __slots__ = ("name", "artist_id", "followers", "genres", "image_url", "popularity", "__weakref__")
+
     def __init__(self,
                  name: str,
                  artist_id: str,
@@ -37,3 +39,38 @@ class SpotifyArtist:
         self.genres = genres
         self.image_url = image_url
         self.popularity = popularity
+
+    @classmethod
+    def _unchecked(cls, name: str, artist_id: str) -> "SpotifyArtist":
+        """Create a SpotifyArtist without running __init__, for the batch extraction of the responses of the Spotify
+        API. Only the name and ID are set, the rest of the attributes are None
+
+        Args:
+            name (str): the name of the artist
+            artist_id (str): the Spotify ID of the artist
+
+        Returns: a SpotifyArtist instance
+        """
+        artist = cls.__new__(cls)
+        artist.name = name
+        artist.artist_id = artist_id
+        artist.followers = artist.genres = artist.image_url = artist.popularity = None
+        return artist
+
+    def to_dict(self) -> dict:
+        """Returns a plain dict representation of the artist that can be serialized as JSON, see from_dict
+        """
+        return {"name": self.name, "artist_id": self.artist_id, "followers": self.followers, "genres": self.genres,
+                "image_url": self.image_url, "popularity": self.popularity}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SpotifyArtist":
+        """Create a SpotifyArtist from its plain dict representation, see to_dict. Missing keys are left unset
+
+        Args:
+            data (dict): the plain dict representation of the artist
+
+        Returns: a SpotifyArtist instance
+        """
+        return cls(data.get("name"), data.get("artist_id"), followers=data.get("followers"), genres=data.get("genres"),
+                   image_url=data.get("image_url"), popularity=data.get("popularity"))
@@ -1,10 +1,16 @@
 from typing import Optional
 
+# The names of the audio features of a track
+AUDIO_FEATURES_FIELDS: tuple[str, ...] = ("acousticness", "danceability", "energy", "instrumentalness", "liveness",
+                                          "loudness", "mode", "speechiness", "tempo", "valence")
+
 
 class SpotifyAudioFeatures:
     """This class represents a Spotify track's audio feature
     """
 
+    __slots__ = AUDIO_FEATURES_FIELDS
+
     def __init__(self,
                  *,
                  acousticness: float = 0.0,
@@ -67,3 +73,36 @@ class SpotifyAudioFeatures:
         self.speechiness = speechiness
         self.tempo = tempo
         self.valence = valence
+
+    @classmethod
+    def _unchecked(cls, values: tuple) -> "SpotifyAudioFeatures":
+        """Create a SpotifyAudioFeatures without running __init__, so its values are not validated. This is meant for
+        the batch extraction of the responses of the Spotify API, which validates the values of a whole page at once
+
+        Args:
+            values (tuple): the value of every audio feature, in the same order as AUDIO_FEATURES_FIELDS
+
+        Returns: a SpotifyAudioFeatures instance
+        """
+        audio_features = cls.__new__(cls)
+        (audio_features.acousticness, audio_features.danceability, audio_features.energy,
+         audio_features.instrumentalness, audio_features.liveness, audio_features.loudness, audio_features.mode,
+         audio_features.speechiness, audio_features.tempo, audio_features.valence) = values
+        return audio_features
+
+    def to_dict(self) -> dict:
+        """Returns a plain dict representation of the audio features that can be serialized as JSON, see from_dict
+        """
+        return {field: getattr(self, field) for field in AUDIO_FEATURES_FIELDS}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SpotifyAudioFeatures":
+        """Create a SpotifyAudioFeatures from its plain dict representation, see to_dict. Missing keys take their
+        default value
+
+        Args:
+            data (dict): the plain dict representation of the audio features
+
+        Returns: a SpotifyAudioFeatures instance
+        """
+        return cls(**{field: data[field] for field in AUDIO_FEATURES_FIELDS if field in data})
@@ -9,6 +9,9 @@ class SpotifyTrack:
     """This class represents a Spotify track
     """
 
+    # Slots keep the instances compact, a library may hold millions of them
+    __slots__ = ("name", "track_id", "popularity", "album", "artists", "duration", "audio_features", "_explicit")
+
     def __init__(self,
                  name: str,
                  track_id: str,
@@ -58,6 +61,68 @@ class SpotifyTrack:
         """
         return f"SpotifyTrack({self.name}, {self.track_id})"
 
+    def to_dict(self) -> dict:
+        """Returns a plain dict representation of the track, its album, artists and audio features included, that can
+        be serialized as JSON, see from_dict
+        """
+        return {"name": self.name, "track_id": self.track_id, "popularity": self.popularity, "duration": self.duration,
+                "explicit": self._explicit,
+                "album": self.album.to_dict() if self.album is not None else None,
+                "artists": [artist.to_dict() for artist in self.artists] if self.artists is not None else None,
+                "audio_features": self.audio_features.to_dict() if self.audio_features is not None else None}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SpotifyTrack":
+        """Create a SpotifyTrack from its plain dict representation, see to_dict. Missing keys are left unset
+
+        Args:
+            data (dict): the plain dict representation of the track
+
+        Returns: a SpotifyTrack instance
+        """
+        album, artists, audio_features = data.get("album"), data.get("artists"), data.get("audio_features")
+        return cls(data.get("name"), data.get("track_id"), popularity=data.get("popularity"),
+                   duration=data.get("duration"), explicit=data.get("explicit"),
+                   album=SpotifyAlbum.from_dict(album) if album is not None else None,
+                   artists=[SpotifyArtist.from_dict(artist) for artist in artists] if artists is not None else None,
+                   audio_features=SpotifyAudioFeatures.from_dict(audio_features)
+                   if audio_features is not None else None)
+
+    @classmethod
+    def _unchecked(cls,
+                   name: str,
+                   track_id: str,
+                   popularity: Optional[int],
+                   duration: Optional[int],
+                   explicit: Optional[bool],
+                   album: Optional[SpotifyAlbum],
+                   artists: Optional[list[SpotifyArtist]]) -> "SpotifyTrack":
+        """Create a SpotifyTrack without running __init__, so its popularity is not validated. This is meant for the
+        batch extraction of the responses of the Spotify API, which validates the popularity of a whole page at once.
+        The audio features are None
+
+        Args:
+            name (str): the name of the song
+            track_id (str): the Spotify ID of the track
+            popularity (Optional[int]): the popularity of the track, it must be a value from 0 to 100
+            duration (Optional[int]): the duration of the track in milliseconds
+            explicit (Optional[bool]): indicates if the track is explicit or not
+            album (Optional[SpotifyAlbum]): the album associated to the track
+            artists (Optional[list[SpotifyArtist]]): the artists associated to the track
+
+        Returns: a SpotifyTrack instance
+        """
+        track = cls.__new__(cls)
+        track.name = name
+        track.track_id = track_id
+        track.popularity = popularity
+        track.duration = duration
+        track._explicit = explicit
+        track.album = album
+        track.artists = artists
+        track.audio_features = None
+        return track
+
     @property
     def is_explicit(self) -> Optional[bool]:
         """Returns if the track is explicit or not
@@ -0,0 +1,108 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # fcntl is not available on Windows, the cache still works but without cross-process locking
+    fcntl = None
+
+from .auth import SpotifyAccessToken
+
+
+def _default_cache_directory() -> str:
+    """Get the default directory for the token cache: $XDG_CACHE_HOME/track_analyzer, or ~/.cache/track_analyzer
+
+    Returns: the path of the directory
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "track_analyzer")
+
+
+class FileTokenCache:
+    """An on-disk store of access tokens shared by every process on the host, keyed by client ID.
+
+    Short-lived processes (eg: batch workers or cron jobs) can start with the token generated by another process
+    instead of requesting a new one. Tokens are written to a temporary file that atomically replaces the previous
+    one, so readers never see a partial file, and a lock file makes sure a single process refreshes an expired token
+    at a time. Expiration is tracked with the wall clock, which is the same for every process.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """Create a FileTokenCache instance
+
+        Args:
+            directory (Optional[str]): the directory where the tokens are stored, it is created if needed. Defaults
+                to $XDG_CACHE_HOME/track_analyzer, or ~/.cache/track_analyzer
+        """
+        self.directory = directory if directory is not None else _default_cache_directory()
+        # Tokens are secrets, only the current user can access them
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+
+    def _path(self, client_id: str) -> str:
+        """Get the path of the file that stores the token of the given client ID
+
+        Args:
+            client_id (str): the Spotify's Client ID
+
+        Returns: the path of the token file
+        """
+        return os.path.join(self.directory, f"{hashlib.sha256(client_id.encode()).hexdigest()[:32]}.json")
+
+    @contextmanager
+    def lock(self, client_id: str) -> Iterator[None]:
+        """Hold an exclusive lock, shared across processes, on the token of the given client ID
+
+        Args:
+            client_id (str): the Spotify's Client ID
+        """
+        with open(f"{self._path(client_id)}.lock", "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def load(self, client_id: str) -> Optional[SpotifyAccessToken]:
+        """Load the stored token of the given client ID, it may have expired already
+
+        Args:
+            client_id (str): the Spotify's Client ID
+
+        Returns: the stored SpotifyAccessToken, None if there isn't one or it can't be read
+        """
+        try:
+            with open(self._path(client_id)) as token_file:
+                token = json.load(token_file)
+            return SpotifyAccessToken(access_token=token["access_token"], expires_in=token["expires_in"],
+                                      timestamp=token["timestamp"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logging.warning(f"Could not read the cached access token. {e}")
+            return None
+
+    def store(self, client_id: str, token: SpotifyAccessToken) -> None:
+        """Store the token of the given client ID, replacing the previous one atomically
+
+        Args:
+            client_id (str): the Spotify's Client ID
+            token (SpotifyAccessToken): the token to store
+        """
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "w") as token_file:
+                json.dump(token._asdict(), token_file)
+                token_file.flush()
+                os.fsync(token_file.fileno())
+            os.replace(temporary_path, self._path(client_id))
+        except OSError as e:
+            logging.warning(f"Could not cache the access token. {e}")
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
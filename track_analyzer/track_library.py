@@ -0,0 +1,370 @@
+import hashlib
+import json
+import os
+from typing import Iterable, Iterator, Optional, Sequence
+
+import numpy as np
+
+from .audio_features_frame import AudioFeaturesFrame
+from .identity_map import IdentityMap
+from .spotify_album import SpotifyAlbum, SpotifyAlbumReleaseDate
+from .spotify_artist import SpotifyArtist
+from .spotify_audio_features import SpotifyAudioFeatures, AUDIO_FEATURES_FIELDS
+from .spotify_track import SpotifyTrack
+
+# The name and version of the format, stored in the metadata of every library
+FORMAT_NAME: str = "track_analyzer.track_library"
+FORMAT_VERSION: int = 1
+_METADATA_FILE: str = "metadata.json"
+# The value stored in the integer columns for missing values
+_MISSING: int = -1
+
+
+def _hash_track_id(track_id: str) -> int:
+    """Hash a track ID into the 64-bit value stored in the lookup column, it is stable across processes
+
+    Args:
+        track_id (str): the Spotify ID of the track
+
+    Returns: the hash of the track ID
+    """
+    return int.from_bytes(hashlib.blake2b(track_id.encode(), digest_size=8).digest(), "little")
+
+
+class _StringTable:
+    """A column of strings stored as the UTF-8 bytes of every string one after the other, the offsets where every
+    string starts and a flag for the missing strings
+    """
+
+    def __init__(self, data: np.ndarray, offsets: np.ndarray, nulls: np.ndarray):
+        """Create a _StringTable instance
+
+        Args:
+            data (np.ndarray): the UTF-8 bytes of every string
+            offsets (np.ndarray): the offset of every string in data, plus the offset of the end of the last string
+            nulls (np.ndarray): a flag for every missing string
+        """
+        self._data = data
+        self._offsets = offsets
+        self._nulls = nulls
+
+    def __len__(self) -> int:
+        """Returns the number of strings in the table
+        """
+        return len(self._nulls)
+
+    def __getitem__(self, row: int) -> Optional[str]:
+        """Returns the string in the given row, None if it is missing
+        """
+        if self._nulls[row]:
+            return None
+
+        return self._data[self._offsets[row]:self._offsets[row + 1]].tobytes().decode()
+
+    @classmethod
+    def load(cls, directory: str, name: str) -> "_StringTable":
+        """Open a string table as memory-mapped arrays, see write
+
+        Args:
+            directory (str): the directory of the library
+            name (str): the name of the column
+
+        Returns: a _StringTable instance
+        """
+        return cls(*(np.load(os.path.join(directory, f"{name}.{part}.npy"), mmap_mode="r")
+                     for part in ("data", "offsets", "nulls")))
+
+    @staticmethod
+    def write(directory: str, name: str, strings: Sequence[Optional[str]]) -> None:
+        """Write a column of strings as a string table
+
+        Args:
+            directory (str): the directory of the library
+            name (str): the name of the column
+            strings (Sequence[Optional[str]]): the strings of the column, None for the missing ones
+        """
+        encoded = [string.encode() if string is not None else b"" for string in strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(string) for string in encoded], out=offsets[1:])
+
+        np.save(os.path.join(directory, f"{name}.data.npy"), np.frombuffer(b"".join(encoded), dtype=np.uint8))
+        np.save(os.path.join(directory, f"{name}.offsets.npy"), offsets)
+        np.save(os.path.join(directory, f"{name}.nulls.npy"), np.array([string is None for string in strings],
+                                                                       dtype=bool))
+
+
+class TrackLibrary:
+    """A compact on-disk library of enriched tracks that opens instantly: every column is a NumPy file mapped into
+    memory, so nothing is read or parsed until it is used, and the pages are shared by every process that opens the
+    library.
+
+    The library is a directory with:
+    * fixed-width columns for the popularity, duration and explicit flag (-1 when missing) and for every audio feature
+      (float64, NaN when missing, so the values read back are the same as the values written)
+    * string tables for the IDs and names of the tracks
+    * album and artist tables, every album and artist is stored once and referenced by row from the tracks
+    * a sorted column of the hashes of the track IDs, used to look up a track by ID with a binary search
+
+    SpotifyTrack instances are only built when they are requested, the columns can be used directly for analysis.
+
+    Usage:
+        TrackLibrary.write("library", spotify_tracks)
+        library = TrackLibrary("library")
+        spotify_track = library.get(track_id)
+        energy = library.audio_features["energy"]
+    """
+
+    def __init__(self, path: str, *, identity_map: Optional[IdentityMap] = None):
+        """Open a TrackLibrary
+
+        Args:
+            path (str): the directory of the library
+            -
+            identity_map (Optional[IdentityMap]): if provided, the albums and artists of the materialized tracks are
+                interned in it
+        """
+        with open(os.path.join(path, _METADATA_FILE)) as metadata_file:
+            metadata = json.load(metadata_file)
+
+        if metadata.get("format") != FORMAT_NAME or metadata.get("version") != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a track library with a supported version.")
+
+        self.path = path
+        self._identity_map = identity_map
+
+        def load(name: str) -> np.ndarray:
+            return np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+
+        self.popularity = load("popularity")
+        self.duration = load("duration")
+        self.explicit = load("explicit")
+        self.audio_features = {field: load(f"audio_features.{field}") for field in AUDIO_FEATURES_FIELDS}
+
+        self._track_ids = _StringTable.load(path, "track_id")
+        self._names = _StringTable.load(path, "name")
+        self._id_hashes = load("track_id.hashes")
+        self._id_rows = load("track_id.rows")
+
+        self._album_rows = load("album_row")
+        self._album_ids = _StringTable.load(path, "album.album_id")
+        self._album_names = _StringTable.load(path, "album.name")
+        self._album_types = _StringTable.load(path, "album.album_type")
+        self._album_release_dates = _StringTable.load(path, "album.released_on")
+        self._album_release_precisions = _StringTable.load(path, "album.precision")
+        self._album_total_tracks = load("album.total_tracks")
+
+        # The artists of the track in row i are in artist_rows[artist_offsets[i]:artist_offsets[i + 1]]
+        self._artist_offsets = load("artist_offsets")
+        self._artist_nulls = load("artist_nulls")
+        self._artist_rows = load("artist_rows")
+        self._artist_ids = _StringTable.load(path, "artist.artist_id")
+        self._artist_names = _StringTable.load(path, "artist.name")
+
+    def __len__(self) -> int:
+        """Returns the number of tracks in the library
+        """
+        return len(self.popularity)
+
+    def __contains__(self, track_id: str) -> bool:
+        """Returns if the track is in the library
+        """
+        return self.row(track_id) is not None
+
+    def __iter__(self) -> Iterator[SpotifyTrack]:
+        """Returns an iterator that materializes the tracks of the library one at a time, in order
+        """
+        return (self.track(row) for row in range(len(self)))
+
+    def row(self, track_id: str) -> Optional[int]:
+        """Find the row of a track with a binary search over the hashes of the track IDs
+
+        Args:
+            track_id (str): the Spotify ID of the track
+
+        Returns: the row of the track, None if it is not in the library
+        """
+        track_id_hash = np.uint64(_hash_track_id(track_id))
+        start = np.searchsorted(self._id_hashes, track_id_hash, side="left")
+        end = np.searchsorted(self._id_hashes, track_id_hash, side="right")
+
+        # Different IDs may share a hash, the IDs themselves are compared
+        for row in self._id_rows[start:end]:
+            if self._track_ids[row] == track_id:
+                return int(row)
+
+        return None
+
+    def get(self, track_id: str) -> Optional[SpotifyTrack]:
+        """Materialize the track with the given ID
+
+        Args:
+            track_id (str): the Spotify ID of the track
+
+        Returns: a SpotifyTrack instance, None if the track is not in the library
+        """
+        return self.track(row) if (row := self.row(track_id)) is not None else None
+
+    def track_id(self, row: int) -> str:
+        """Get the ID of the track in a row without materializing the track
+
+        Args:
+            row (int): the row of the track
+
+        Returns: the Spotify ID of the track
+        """
+        return self._track_ids[row]
+
+    def track(self, row: int) -> SpotifyTrack:
+        """Materialize the track in a row
+
+        Args:
+            row (int): the row of the track
+
+        Returns: a SpotifyTrack instance
+        """
+        popularity, duration, explicit = int(self.popularity[row]), int(self.duration[row]), int(self.explicit[row])
+
+        return SpotifyTrack(self._names[row], self._track_ids[row],
+                            popularity=popularity if popularity != _MISSING else None,
+                            duration=duration if duration != _MISSING else None,
+                            explicit=bool(explicit) if explicit != _MISSING else None,
+                            album=self._album(int(self._album_rows[row])),
+                            artists=self._artists(row),
+                            audio_features=self._audio_features(row))
+
+    def audio_features_frame(self) -> AudioFeaturesFrame:
+        """Get the audio features of every track as an AudioFeaturesFrame, the tracks without audio features have NaN
+        values
+
+        Returns: an AudioFeaturesFrame with a row per track, in the same order as the library
+        """
+        return AudioFeaturesFrame([self._track_ids[row] for row in range(len(self))],
+                                  {field: np.asarray(column) for field, column in self.audio_features.items()})
+
+    def _album(self, album_row: int) -> Optional[SpotifyAlbum]:
+        """Build the album in a row of the album table
+
+        Args:
+            album_row (int): the row of the album, -1 if the track has no album
+
+        Returns: a SpotifyAlbum instance, None if the track has no album
+        """
+        if album_row == _MISSING:
+            return None
+
+        released_on, precision = self._album_release_dates[album_row], self._album_release_precisions[album_row]
+        total_tracks = int(self._album_total_tracks[album_row])
+        album = SpotifyAlbum(self._album_names[album_row], self._album_ids[album_row],
+                             album_type=self._album_types[album_row],
+                             release_date=SpotifyAlbumReleaseDate(released_on, precision) if released_on else None,
+                             total_tracks=total_tracks if total_tracks != _MISSING else None)
+
+        return self._identity_map.album(album) if self._identity_map is not None else album
+
+    def _artists(self, row: int) -> Optional[list[SpotifyArtist]]:
+        """Build the artists of the track in a row
+
+        Args:
+            row (int): the row of the track
+
+        Returns: a list of SpotifyArtist instances, None if the track has no artists
+        """
+        if self._artist_nulls[row]:
+            return None
+
+        artists = []
+        for artist_row in self._artist_rows[self._artist_offsets[row]:self._artist_offsets[row + 1]]:
+            artist = SpotifyArtist(self._artist_names[artist_row], self._artist_ids[artist_row])
+            artists.append(self._identity_map.artist(artist) if self._identity_map is not None else artist)
+
+        return artists
+
+    def _audio_features(self, row: int) -> Optional[SpotifyAudioFeatures]:
+        """Build the audio features of the track in a row
+
+        Args:
+            row (int): the row of the track
+
+        Returns: a SpotifyAudioFeatures instance, None if the track has no audio features
+        """
+        values = {field: float(column[row]) for field, column in self.audio_features.items()}
+        if all(np.isnan(value) for value in values.values()):
+            return None
+
+        values = {field: value if not np.isnan(value) else None for field, value in values.items()}
+        values["mode"] = int(values["mode"]) if values["mode"] is not None else None
+        return SpotifyAudioFeatures(**values)
+
+    @staticmethod
+    def write(path: str, tracks: Iterable[SpotifyTrack]) -> int:
+        """Write a library with the given tracks, the directory is created if needed and any previous library in it is
+        replaced
+
+        Args:
+            path (str): the directory of the library
+            tracks (Iterable[SpotifyTrack]): the tracks, a track ID that appears more than once is only stored once
+
+        Returns: the number of tracks written
+        """
+        tracks = list({track.track_id: track for track in tracks}.values())
+        os.makedirs(path, exist_ok=True)
+        # A previous library in the directory stops being valid while its columns are replaced
+        if os.path.exists(metadata_path := os.path.join(path, _METADATA_FILE)):
+            os.remove(metadata_path)
+
+        def save(name: str, values: np.ndarray) -> None:
+            np.save(os.path.join(path, f"{name}.npy"), values)
+
+        def integers(values: Iterable[Optional[int]], dtype: type) -> np.ndarray:
+            return np.array([value if value is not None else _MISSING for value in values], dtype=dtype)
+
+        save("popularity", integers((track.popularity for track in tracks), np.int16))
+        save("duration", integers((track.duration for track in tracks), np.int32))
+        save("explicit", integers((track.is_explicit for track in tracks), np.int8))
+        for field in AUDIO_FEATURES_FIELDS:
+            save(f"audio_features.{field}",
+                 np.array([getattr(track.audio_features, field) if track.audio_features is not None else None
+                           for track in tracks], dtype=np.float64))
+
+        track_ids = [track.track_id for track in tracks]
+        _StringTable.write(path, "track_id", track_ids)
+        _StringTable.write(path, "name", [track.name for track in tracks])
+        id_hashes = np.array([_hash_track_id(track_id) for track_id in track_ids], dtype=np.uint64)
+        order = np.argsort(id_hashes, kind="stable")
+        save("track_id.hashes", id_hashes[order])
+        save("track_id.rows", order.astype(np.int64))
+
+        # Every album is stored once, keyed by its ID, or by the instance if it has no ID
+        albums: dict = {}
+        album_rows = [_MISSING if track.album is None else
+                      albums.setdefault(track.album.album_id or id(track.album), (len(albums), track.album))[0]
+                      for track in tracks]
+        albums = [album for _, album in albums.values()]
+        save("album_row", np.array(album_rows, dtype=np.int32))
+        _StringTable.write(path, "album.album_id", [album.album_id for album in albums])
+        _StringTable.write(path, "album.name", [album.name for album in albums])
+        _StringTable.write(path, "album.album_type", [album.album_type for album in albums])
+        _StringTable.write(path, "album.released_on", [album.release_date.released_on if album.release_date else None
+                                                       for album in albums])
+        _StringTable.write(path, "album.precision", [album.release_date.precision if album.release_date else None
+                                                     for album in albums])
+        save("album.total_tracks", integers((album.total_tracks for album in albums), np.int32))
+
+        artists: dict = {}
+        artist_offsets, artist_rows = [0], []
+        for track in tracks:
+            artist_rows.extend(artists.setdefault(artist.artist_id or id(artist), (len(artists), artist))[0]
+                               for artist in track.artists or [])
+            artist_offsets.append(len(artist_rows))
+        artists = [artist for _, artist in artists.values()]
+        save("artist_offsets", np.array(artist_offsets, dtype=np.int64))
+        save("artist_nulls", np.array([track.artists is None for track in tracks], dtype=bool))
+        save("artist_rows", np.array(artist_rows, dtype=np.int32))
+        _StringTable.write(path, "artist.artist_id", [artist.artist_id for artist in artists])
+        _StringTable.write(path, "artist.name", [artist.name for artist in artists])
+
+        # The metadata is written last, a library is only valid once every column is in place
+        with open(metadata_path, "w") as metadata_file:
+            json.dump({"format": FORMAT_NAME, "version": FORMAT_VERSION, "tracks": len(tracks)}, metadata_file)
+
+        return len(tracks)
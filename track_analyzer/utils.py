@@ -1,5 +1,6 @@
 import logging
-from typing import Optional
+from itertools import islice
+from typing import Iterable, Iterator, Mapping, Optional
 
 import requests
 from requests import RequestException
@@ -9,11 +10,49 @@ from .exceptions import (SpotifyForbiddenOperationError,
                          SpotifyUnauthorizedError,
                          SpotifyLimitExceededError,
                          SpotifyUnknownStatusError)
+from .rate_limiter import RateLimiter
+from .retry import RetryPolicy
+from .session import SpotifySession
 
 # A list of the currently supported HTTP methods
 SUPPORTED_METHODS = ['GET']
 
 
+def normalize_query_params(query_params: Optional[dict]) -> tuple[tuple[str, str], ...]:
+    """Normalize the query params of a request, so equivalent requests get the same value regardless of the order or
+    the type of the params
+
+    Args:
+        query_params (Optional[dict]): the query params of the request
+
+    Returns: a sorted tuple of (name, value) pairs, with the values converted to strings
+
+    Examples:
+        {"q": "Porcelain", "limit": 1} -> (("limit", "1"), ("q", "Porcelain"))
+    """
+    if not query_params:
+        return ()
+
+    return tuple(sorted((str(name), str(value)) for name, value in query_params.items() if value is not None))
+
+
+def chunked(iterable: Iterable, size: int) -> Iterator[list]:
+    """Split an iterable into lists of at most size elements
+
+    Args:
+        iterable (Iterable): the values to split
+        size (int): the maximum number of values per chunk
+
+    Returns: an iterator over the chunks
+
+    Examples:
+        chunked([1, 2, 3, 4, 5], 2) -> [1, 2], [3, 4], [5]
+    """
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
 class SpotifyAuthHeaders(AuthBase):
     """Attaches a Bearer token to every Spotify request
     """
@@ -34,7 +73,8 @@ class SpotifyAuthHeaders(AuthBase):
 
 
 def make_http_request(base_url: str, path: str, access_token: str, query_params: Optional[dict] = None,
-                      method: str = 'GET') -> dict:
+                      method: str = 'GET', session: Optional[SpotifySession] = None,
+                      rate_limiter: Optional[RateLimiter] = None, retry_policy: Optional[RetryPolicy] = None) -> dict:
     """Make a new HTTP request to the Spotify API using the path, query_params and method provided.
 
     Since the access_token is expected, this function is only intended to be used with authorized Spotify API calls. Any
@@ -42,7 +82,6 @@ def make_http_request(base_url: str, path: str, access_token: str, query_params:
 
     TODO:
         Add support for POST requests.
-        Implement a retry mechanism for errors returned by the Spotify API
 
     Args:
         base_url (str): the base URL for the request
@@ -50,6 +89,12 @@ def make_http_request(base_url: str, path: str, access_token: str, query_params:
         access_token (str): the access token for authorization
         query_params (Optional[dict]): optional query params to be sent
         method (str): the method for the request
+        session (Optional[SpotifySession]): the pooled session used to send the request. If not provided, a new
+            connection is opened for the request
+        rate_limiter (Optional[RateLimiter]): the rate limiter the request has to wait for, if Spotify returns a rate
+            limit exceeded error, it is paused for the Retry-After window
+        retry_policy (Optional[RetryPolicy]): the policy that decides which failed attempts are retried. If not
+            provided, the request is not retried
 
     Returns:
         dict: the JSON representation of the API response
@@ -64,30 +109,94 @@ def make_http_request(base_url: str, path: str, access_token: str, query_params:
     # Make sure only the supported methods are used
     assert method in SUPPORTED_METHODS, f"{method} method not supported yet."
 
-    # Handle GET requests
+    # Reuse the pooled connections if a session was given
+    http = session if session is not None else requests
+
+    if retry_policy is not None:
+        retry_policy.record_request()
+
+    attempt = 1
+    while True:
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+
+        # Handle GET requests
+        try:
+            if method == 'GET':
+                response = http.get(f"{base_url}/{path}", params=query_params, auth=SpotifyAuthHeaders(access_token))
+
+        except RequestException as e:
+            if (retry_policy is not None and retry_policy.is_retryable(exception=e)
+                    and retry_policy.wait_for_retry(attempt, path, f"{e=}")):
+                attempt += 1
+                continue
+
+            logging.critical(f"An unexpected error has occurred when trying to make a request to the Spotify API. {e=}")
+            raise
+
+        if response.status_code == requests.codes.ok:  # 200 OK
+            return response.json()
+
+        retry_after = None
+        paused = False
+        if response.status_code == requests.codes.too_many_requests:
+            retry_after = parse_retry_after(response.headers)
+            # Pause every request sharing the limiter instead of letting them hit the API again right away
+            if rate_limiter is not None and retry_after is not None:
+                rate_limiter.pause(retry_after)
+                paused = True
+
+        if (retry_policy is not None and retry_policy.is_retryable(status_code=response.status_code)
+                and retry_policy.wait_for_retry(attempt, path, f"status {response.status_code}", retry_after,
+                                                paused=paused)):
+            attempt += 1
+            continue
+
+        raise_for_status(method, path, response.status_code, response.headers)
+
+
+def parse_retry_after(headers: Optional[Mapping]) -> Optional[float]:
+    """Get the number of seconds to wait before retrying from the Retry-After header of a response
+
+    Args:
+        headers (Optional[Mapping]): the headers of the response
+
+    Returns: the number of seconds to wait, None if the header is missing or invalid
+    """
+    if not headers or (retry_after := headers.get("Retry-After")) is None:
+        return None
+
     try:
-        if method == 'GET':
-            response = requests.get(f"{base_url}/{path}", params=query_params, auth=SpotifyAuthHeaders(access_token))
+        return max(0.0, float(retry_after))
+    except (TypeError, ValueError):
+        return None
+
 
-    except RequestException as e:
-        logging.critical(f"An unexpected error has occurred when trying to make a request to the Spotify API. {e=}")
-        raise
+def raise_for_status(method: str, path: str, status_code: int, headers: Optional[Mapping] = None) -> None:
+    """Raise the exception that matches the unsuccessful HTTP status code returned by the Spotify API
 
-    if response.status_code == requests.codes.ok:  # 200 OK
-        return response.json()
+    Args:
+        method (str): the method of the request
+        path (str): the path of the request
+        status_code (int): the HTTP status code returned by the Spotify API
+        headers (Optional[Mapping]): the headers of the response, used to get the Retry-After window
+
+    Raises:
+        SpotifyUnauthorizedError: if an authorization error is returned by the Spotify API
+        SpotifyForbiddenOperationError: if a forbidden error is returned by the Spotify API
+        SpotifyLimitExceededError: if a rate limit exceeded error is returned by the Spotify API
+        SpotifyUnknownStatusError: if an unhandled HTTP status code is returned by the Spotify API
+    """
+    logging.error(f"Spotify returned {status_code} status.")
 
-    if response.status_code == requests.codes.unauthorized:  # 401 Unauthorized
-        logging.error(f"Spotify returned {response.status_code} status.")
+    if status_code == requests.codes.unauthorized:  # 401 Unauthorized
         raise SpotifyUnauthorizedError(path)
 
-    elif response.status_code == requests.codes.forbidden:  # 403 Forbidden
-        logging.error(f"Spotify returned {response.status_code} status.")
+    elif status_code == requests.codes.forbidden:  # 403 Forbidden
         raise SpotifyForbiddenOperationError(path)
 
-    elif response.status_code == requests.codes.too_many_requests:  # 429 Too Many Requests
-        logging.error(f"Spotify returned {response.status_code} status.")
-        raise SpotifyLimitExceededError
+    elif status_code == requests.codes.too_many_requests:  # 429 Too Many Requests
+        raise SpotifyLimitExceededError(parse_retry_after(headers))
 
     else:
-        logging.error(f"Spotify returned {response.status_code} status.")
-        raise SpotifyUnknownStatusError(method, path, response.status_code)  # Any other HTTP status code
+        raise SpotifyUnknownStatusError(method, path, status_code)  # Any other HTTP status code